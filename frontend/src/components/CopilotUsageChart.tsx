@@ -33,8 +33,8 @@ const CopilotUsageChart: React.FC = () => {
   const [endDate, setEndDate] = useState<string>(defaultDates.end);
 
   useEffect(() => {
-    fetchCopilotUsersMetrics();
-  }, [fetchCopilotUsersMetrics]);
+    fetchCopilotUsersMetrics(beginDate, endDate);
+  }, [fetchCopilotUsersMetrics, beginDate, endDate]);
 
   interface ChartDataEntry {
     date: Date;
@@ -59,7 +59,11 @@ const SuggestionAcceptanceChart: React.FC = () => {
     setLoading(true);
     setError(null);
     try {
-      const result = await CopilotMetricsByPeriodService.getCopilotMetricsByPeriod(period);
+      const result = await CopilotMetricsByPeriodService.getCopilotMetricsByPeriod(
+        period,
+        beginDate ? new Date(beginDate) : undefined,
+        endDate ? new Date(endDate) : undefined
+      );
 
       // Transform data for the Lines of Code chart
       const transformedData: ChartData[] = result.map((item) => {
@@ -111,7 +115,7 @@ const SuggestionAcceptanceChart: React.FC = () => {
   useEffect(() => {
     fetchData();
   // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [period]);
+  }, [period, beginDate, endDate]);
 
   const customTooltip = ({ active, payload, label }: any) => {
     if (active && payload && payload.length) {
@@ -7,12 +7,16 @@ export const useCopilotUsersMetrics = () => {
   const [isLoading, setIsLoading] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
 
-  const fetchCopilotUsersMetrics = useCallback(async () => {
+  const fetchCopilotUsersMetrics = useCallback(async (initialDate: string, finalDate: string) => {
     setIsLoading(true);
     setError(null);
 
     try {
-      const response = await CopilotUsersMetricsService.getCopilotUsersMetrics();
+      // Only the selected range is read, instead of every day the user has
+      const response = await CopilotUsersMetricsService.getCopilotUsersMetrics(
+        new Date(initialDate),
+        new Date(finalDate)
+      );
       console.log("Copilot users metrics API response:", response);
       
       if (response) {
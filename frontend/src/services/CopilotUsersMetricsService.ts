@@ -1,11 +1,15 @@
 import { CopilotUsersMetrics } from "../types/model/index";
 import axios from "axios";
+import { formatDate } from "../utils/date/formatDate";
 import { getToken, getUserId } from "../utils/auth";
 
 const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || "http://localhost:8000";
 
 export class CopilotUsersMetricsService {
-  static async getCopilotUsersMetrics(): Promise<CopilotUsersMetrics[]> {
+  static async getCopilotUsersMetrics(
+    initial_date?: Date,
+    final_date?: Date
+  ): Promise<CopilotUsersMetrics[]> {
     try {
       const token = getToken();
       const userId = getUserId();
@@ -14,7 +18,15 @@ export class CopilotUsersMetricsService {
         throw new Error("Authentication required");
       }
 
-      const url = `${API_BASE_URL}/copilot_metrics/users/${encodeURIComponent(userId)}`;
+      const queryParams = new URLSearchParams();
+      if (initial_date) {
+        queryParams.append("initial_date_string", formatDate(initial_date));
+      }
+      if (final_date) {
+        queryParams.append("final_date_string", formatDate(final_date));
+      }
+
+      const url = `${API_BASE_URL}/copilot_metrics/users/${encodeURIComponent(userId)}?${queryParams.toString()}`;
 
       const response = await axios.get<CopilotUsersMetrics[]>(url, {
         headers: {
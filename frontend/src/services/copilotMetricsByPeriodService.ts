@@ -1,12 +1,15 @@
 import { CopilotMetricsByPeriod } from "../types/model/index";
 import axios from "axios";
+import { formatDate } from "../utils/date/formatDate";
 import { getToken, getUserId } from "../utils/auth";
 
 const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || "http://localhost:8000";
 
 export class CopilotMetricsByPeriodService {
   static async getCopilotMetricsByPeriod(
-    period: "W" | "M" | "Q" | "Y"
+    period: "W" | "M" | "Q" | "Y",
+    initial_date?: Date,
+    final_date?: Date
   ): Promise<CopilotMetricsByPeriod[]> {
     try {
       const token = getToken();
@@ -18,6 +21,12 @@ export class CopilotMetricsByPeriodService {
 
       const queryParams = new URLSearchParams();
       queryParams.append("period", period);
+      if (initial_date) {
+        queryParams.append("initial_date_string", formatDate(initial_date));
+      }
+      if (final_date) {
+        queryParams.append("final_date_string", formatDate(final_date));
+      }
 
       const url = `${API_BASE_URL}/copilot_metrics/period/${encodeURIComponent(userId)}?${queryParams.toString()}`;
 
@@ -27,7 +27,7 @@ from src.infrastructure.database.connection.database_connection import SessionLo
 from src.infrastructure.database.raw_commit_metrics.postgre.dtos.model import RawCommitMetrics
 from src.infrastructure.database.raw_copilot_code_metrics.postgre.dtos.model import RawCopilotCodeMetrics
 from src.infrastructure.database.raw_copilot_chat_metrics.postgre.dtos.model import RawCopilotChatMetrics
-from src.infrastructure.database.init_db import create_tables
+from src.infrastructure.database.init_db import init_database
 
 # Import configuration
 from mock_data_config import (
@@ -300,8 +300,8 @@ def main() -> None:
     """Main function to generate all mock data."""
     logger.info("Starting mock data generation...")
     
-    # Ensure database tables exist
-    create_tables()
+    # Ensure database tables and their partitions exist
+    init_database()
     
     # Calculate date range (6 months back from today)
     end_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -118,6 +118,11 @@ def main() -> None:
     parser.add_argument("urls_file", help="Path to the .txt file with repository URLs")
     parser.add_argument("start_date", help="Start date (YYYY-MM-DD)")
     parser.add_argument("end_date", help="End date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Write a single CSV for scripts/load_metrics.py instead of an .xlsx",
+    )
     args = parser.parse_args()
 
     try:
@@ -149,6 +154,14 @@ def main() -> None:
         print("No commits found in the date range.")
         return
 
+    if args.csv:
+        output_file = f"commits_{start_date}_to_{end_date}.csv"
+        pd.DataFrame(
+            [c.model_dump() for commits in repo_data.values() for c in commits]
+        ).to_csv(output_file, index=False)
+        print(f"Export completed successfully: {output_file}")
+        return
+
     output_file = f"commits_{start_date}_to_{end_date}.xlsx"
     with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
         for repo_name, commits in repo_data.items():
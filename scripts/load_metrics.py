@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Bulk metrics loader CLI, for imports too large for the upload endpoints.
+Rows are streamed with COPY into a staging table, then merged into the raw table.
+Usage:
+    python scripts/load_metrics.py commit       <username> <file.csv>
+    python scripts/load_metrics.py copilot_code <username> <file.csv>
+    python scripts/load_metrics.py copilot_chat <username> <file.csv>
+
+CSV headers:
+    commit:       hash, repository, date, author, language, added_lines, removed_lines
+                  (python scripts/git_cosumer/git_consumer.py ... --csv writes this format)
+    copilot_code: team_name, date, ide, copilot_model, language, total_users,
+                  code_acceptances, code_suggestions, lines_accepted, lines_suggested
+    copilot_chat: team_name, date, ide, copilot_model, total_users,
+                  total_chats, copy_events, insertion_events
+"""
+
+import csv
+import sys
+import logging
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    if len(sys.argv) != 4:
+        print(__doc__)
+        sys.exit(1)
+
+    kind, username, file_path = sys.argv[1:]
+
+    from src.cmd.dependencies.dependency_setters import set_bulk_load_metrics_dependencies
+    from src.infrastructure.database.connection.database_connection import SessionLocal
+
+    db = SessionLocal()
+    try:
+        with open(file_path, "r", encoding="utf-8", newline="") as file:
+            logger.info(f"Loading {kind} metrics from {file_path} for {username}...")
+            result = set_bulk_load_metrics_dependencies(db).execute(kind, username, csv.DictReader(file))
+        logger.info(f"Load completed: {result.inserted} rows inserted, {result.skipped} skipped")
+    except Exception as e:
+        logger.error(f"Error loading metrics: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
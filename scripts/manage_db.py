@@ -3,12 +3,15 @@
 """
 Database management CLI script.
 Usage:
-    python scripts/manage_db.py init     # Initialize database (create tables)
+    python scripts/manage_db.py init     # Initialize database (apply schema migrations)
+    python scripts/manage_db.py migrate  # Apply pending schema migrations, including the manual table rewrites
     python scripts/manage_db.py drop     # Drop all tables (WARNING: destructive)
     python scripts/manage_db.py test     # Test database connection
     python scripts/manage_db.py status   # Show database status and record counts
     python scripts/manage_db.py clear    # Clear all data (keep tables)
     python scripts/manage_db.py sample   # Show sample data from tables
+    python scripts/manage_db.py rollup   # Rebuild the metrics rollups from raw data
+    python scripts/manage_db.py partitions  # Create the upcoming monthly raw metrics partitions
 """
 
 import sys
@@ -60,14 +63,23 @@ def clear_all_data() -> None:
     from src.infrastructure.database.raw_copilot_code_metrics.postgre.dtos.model import RawCopilotCodeMetrics
     from src.infrastructure.database.raw_copilot_chat_metrics.postgre.dtos.model import RawCopilotChatMetrics
     from src.infrastructure.database.users.postgre.dtos.model import UserDbSchema
+    from src.infrastructure.database.commit_metrics_daily.postgre.dtos.model import CommitMetricsDaily
+    from src.infrastructure.database.copilot_code_metrics_daily.postgre.dtos.model import CopilotCodeMetricsDaily
+    from src.infrastructure.database.copilot_chat_metrics_daily.postgre.dtos.model import CopilotChatMetricsDaily
+    from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 
     logger.info("Clearing all data from database...")
     db = SessionLocal()
     try:
+        db.query(CommitMetricsDaily).delete()
+        db.query(CopilotCodeMetricsDaily).delete()
+        db.query(CopilotChatMetricsDaily).delete()
         db.query(RawCopilotChatMetrics).delete()
         db.query(RawCopilotCodeMetrics).delete()
         db.query(RawCommitMetrics).delete()
         db.query(UserDbSchema).delete()
+        # Running API workers see this and stop serving their cached metrics
+        UserDataVersionsRepository(db).bump_all()
         db.commit()
         logger.info("All data cleared successfully!")
     except Exception as e:
@@ -121,6 +133,47 @@ def show_sample_data(limit: int = 5) -> None:
         db.close()
 
 
+def rebuild_rollups() -> None:
+    """Rebuild the metrics rollup tables from the raw metrics tables."""
+    from src.infrastructure.database.connection.database_connection import SessionLocal
+    from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+    from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+    from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+
+    logger.info("Rebuilding metrics rollups...")
+    db = SessionLocal()
+    try:
+        CommitMetricsDailyRepository(db).rebuild()
+        CopilotCodeMetricsDailyRepository(db).rebuild()
+        CopilotChatMetricsDailyRepository(db).rebuild()
+        logger.info("Metrics rollups rebuilt successfully!")
+    except Exception as e:
+        logger.error(f"Error rebuilding rollups: {e}")
+        raise
+    finally:
+        db.close()
+
+
+def maintain_partitions() -> None:
+    """Create the monthly raw metrics partitions ahead of time, applying the configured retention."""
+    from src.cmd.dependencies.dependency_setters import set_maintain_metrics_partitions_dependencies
+    from src.config.config import CONFIG
+    from src.infrastructure.database.connection.database_connection import SessionLocal
+
+    logger.info("Maintaining raw metrics partitions...")
+    db = SessionLocal()
+    try:
+        created = set_maintain_metrics_partitions_dependencies(db).execute(
+            retention_months=CONFIG.raw_metrics_retention_months
+        )
+        logger.info(f"Raw metrics partitions up to date ({len(created)} created)")
+    except Exception as e:
+        logger.error(f"Error maintaining partitions: {e}")
+        raise
+    finally:
+        db.close()
+
+
 def main() -> None:
     if len(sys.argv) != 2:
         print(__doc__)
@@ -130,7 +183,7 @@ def main() -> None:
     
     try:
         # Import modules inside the function to avoid module-level import issues
-        from src.infrastructure.database.init_db import init_database, drop_tables
+        from src.infrastructure.database.init_db import init_database, drop_tables, migrate_database
         from src.infrastructure.database.database_utils import test_database_connection
         
         if command == 'init':
@@ -138,6 +191,10 @@ def main() -> None:
             init_database()
             logger.info("Database initialized successfully!")
             
+        elif command == 'migrate':
+            logger.info("Applying schema migrations...")
+            migrate_database()
+
         elif command == 'drop':
             response = input("Are you sure you want to drop all tables? This will delete all data! (yes/no): ")
             if response.lower() == 'yes':
@@ -167,6 +224,12 @@ def main() -> None:
                 
         elif command == 'sample':
             show_sample_data()
+
+        elif command == 'rollup':
+            rebuild_rollups()
+
+        elif command == 'partitions':
+            maintain_partitions()
                 
         else:
             print(f"Unknown command: {command}")
@@ -1,3 +1,4 @@
+import csv
 from datetime import datetime
 import io
 from typing import Any, Dict, List
@@ -17,6 +18,11 @@ from src.cmd.dependencies.dependency_setters import set_get_commit_metrics_depen
 from src.cmd.dependencies.dependency_setters import set_get_copilot_metrics_dependencies
 from src.cmd.dependencies.dependency_setters import set_get_xlsx_commit_metrics_dependencies
 from src.cmd.dependencies.dependency_setters import set_get_calculated_metrics_dependencies
+from src.cmd.dependencies.dependency_setters import set_get_metrics_correlation_dependencies
+from src.cmd.dependencies.dependency_setters import set_get_dashboard_metrics_bundle_dependencies
+from src.cmd.dependencies.dependency_setters import set_get_commit_metrics_breakdown_dependencies
+from src.cmd.dependencies.dependency_setters import set_get_copilot_metrics_breakdown_dependencies
+from src.cmd.dependencies.dependency_setters import set_get_copilot_metrics_by_editor_dependencies
 from src.cmd.dependencies.dependency_setters import set_get_copilot_metrics_by_language_dependencies
 from src.cmd.dependencies.dependency_setters import set_get_copilot_metrics_by_period_dependencies
 from src.cmd.dependencies.dependency_setters import set_get_copilot_users_metrics_dependencies
@@ -24,14 +30,18 @@ from src.cmd.dependencies.dependency_setters import set_create_github_app_depend
 from src.cmd.dependencies.dependency_setters import set_create_api_key_dependencies
 from src.cmd.dependencies.dependency_setters import set_list_api_keys_dependencies
 from src.cmd.dependencies.dependency_setters import set_revoke_api_key_dependencies
-from src.domain.entities.commit_metrics import CommitMetrics
+from src.cmd.dependencies.dependency_setters import set_rebuild_metrics_rollups_dependencies
+from src.cmd.dependencies.dependency_setters import set_bulk_load_metrics_dependencies
 from src.domain.entities.github_app import GitHubApp
 from src.domain.entities.report_config import ReportConfig
 from src.domain.entities.value_objects.enums.period import Period
-from src.domain.use_cases.dtos.calculated_metrics import CalculatedMetrics, CopilotMetricsByLanguage, CopilotMetricsByPeriod, CopilotUsersMetrics
+from src.domain.entities.value_objects.enums.productivity_metric import Productivity_metric
+from src.domain.use_cases.dtos.calculated_metrics import CalculatedMetrics, CombinedCalculatedMetrics, CommitMetricsBreakdown, CopilotMetricsBreakdown, CopilotMetricsByEditor, CopilotMetricsByLanguage, CopilotMetricsByPeriod, CopilotUsersMetrics, DashboardMetricsBundle, MetricsCorrelations
+from src.domain.use_cases.dtos.bulk_insert_result import BulkInsertResult
 from src.domain.use_cases.dtos.token import Token
 from src.domain.use_cases.dtos.user_response import UserResponse
 from src.domain.use_cases.dtos.api_key_response import ApiKeyResponse, ApiKeyListItem
+from src.infrastructure.cache.metrics_cache import calculated_metrics_cache
 from src.infrastructure.database.connection.database_connection import SessionLocal
 
 
@@ -108,7 +118,7 @@ async def get_commit_metrics_xlsx(
     user_id: str = Body(..., embed=True),
     authenticated_user_id: str = Depends(get_user_id_dual_auth),
     db: Session = Depends(get_db),
-) -> List[CommitMetrics]:
+) -> BulkInsertResult:
     # Verify the authenticated user matches the requested user_id
     if authenticated_user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied: cannot access other user's data")
@@ -141,11 +151,174 @@ def get_calculated_metrics(
     return response
 
 
+@router.get("/calculated_metrics/{user_id}/combined")
+def get_combined_calculated_metrics(
+    user_id: str,
+    periods_string: str = "",
+    initial_date_string: str = "",
+    final_date_string: str = "",
+    languages_string: str = "",
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> CombinedCalculatedMetrics:
+    verify_user_access(token, user_id)
+    try:
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid dates: {initial_date_string}, {final_date_string}")
+    try:
+        periods = [Period(period) for period in periods_string.split(',')]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid periods: {periods_string}")
+    languages: List[str] = []
+    if(languages_string):
+        languages = languages_string.split(',')
+    get_calculated_metrics_use_case = set_get_calculated_metrics_dependencies(db)
+    response = get_calculated_metrics_use_case.execute_combined(user_id, periods, initial_date, final_date, languages)
+    return response
+
+
+@router.get("/dashboard/{user_id}")
+def get_dashboard_metrics_bundle(
+    user_id: str,
+    period: str = "",
+    productivity_metric: str = "",
+    initial_date_string: str = "",
+    final_date_string: str = "",
+    languages_string: str = "",
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> DashboardMetricsBundle:
+    verify_user_access(token, user_id)
+    try:
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid dates: {initial_date_string}, {final_date_string}")
+    try:
+        validated_period = Period(period)
+        validated_productivity_metric = Productivity_metric(productivity_metric)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid period or productivity metric: {period}, {productivity_metric}")
+    languages: List[str] = []
+    if(languages_string):
+        languages = languages_string.split(',')
+    get_dashboard_metrics_bundle_use_case = set_get_dashboard_metrics_bundle_dependencies(db)
+    response = get_dashboard_metrics_bundle_use_case.execute(
+        user_id, validated_period, validated_productivity_metric, initial_date, final_date, languages
+    )
+    return response
+
+
+@router.get("/calculated_metrics/{user_id}/correlation")
+def get_metrics_correlation(
+    user_id: str,
+    period: str = "",
+    slice_by: str = "",
+    initial_date_string: str = "",
+    final_date_string: str = "",
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> MetricsCorrelations:
+    verify_user_access(token, user_id)
+    initial_date = None
+    final_date = None
+    if(initial_date_string):
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+    if(final_date_string):
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    try:
+        validated_period = Period(period)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid period: {period}")
+    get_metrics_correlation_use_case = set_get_metrics_correlation_dependencies(db)
+    response = get_metrics_correlation_use_case.execute(user_id, validated_period, slice_by, initial_date, final_date)
+    return response
+
+
+@router.get("/commit_metrics/breakdown/{user_id}")
+def get_commit_metrics_breakdown(
+    user_id: str,
+    group_by_string: str = "",
+    initial_date_string: str = "",
+    final_date_string: str = "",
+    languages_string: str = "",
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> List[CommitMetricsBreakdown]:
+    verify_user_access(token, user_id)
+    initial_date = None
+    final_date = None
+    if(initial_date_string):
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+    if(final_date_string):
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    languages: List[str] = []
+    if(languages_string):
+        languages = languages_string.split(',')
+    get_commit_metrics_breakdown_use_case = set_get_commit_metrics_breakdown_dependencies(db)
+    response = get_commit_metrics_breakdown_use_case.execute(user_id, group_by_string.split(','), initial_date, final_date, languages)
+    return response
+
+
+@router.get("/copilot_metrics/breakdown/{user_id}")
+def get_copilot_metrics_breakdown(
+    user_id: str,
+    group_by_string: str = "",
+    initial_date_string: str = "",
+    final_date_string: str = "",
+    languages_string: str = "",
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> List[CopilotMetricsBreakdown]:
+    verify_user_access(token, user_id)
+    initial_date = None
+    final_date = None
+    if(initial_date_string):
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+    if(final_date_string):
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    languages: List[str] = []
+    if(languages_string):
+        languages = languages_string.split(',')
+    get_copilot_metrics_breakdown_use_case = set_get_copilot_metrics_breakdown_dependencies(db)
+    response = get_copilot_metrics_breakdown_use_case.execute(user_id, group_by_string.split(','), initial_date, final_date, languages)
+    return response
+
+
+@router.get("/copilot_metrics/editor/{user_id}")
+def get_copilot_metrics_by_editor(
+    user_id: str,
+    group_by_string: str = "IDE,copilot_model",
+    initial_date_string: str = "",
+    final_date_string: str = "",
+    languages_string: str = "",
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> List[CopilotMetricsByEditor]:
+    verify_user_access(token, user_id)
+    initial_date = None
+    final_date = None
+    if(initial_date_string):
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+    if(final_date_string):
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    languages: List[str] = []
+    if(languages_string):
+        languages = languages_string.split(',')
+    get_copilot_metrics_by_editor_use_case = set_get_copilot_metrics_by_editor_dependencies(db)
+    response = get_copilot_metrics_by_editor_use_case.execute(user_id, group_by_string.split(','), initial_date, final_date, languages)
+    return response
+
+
 @router.get("/copilot_metrics/language/{user_id}")
 def get_copilot_metrics_by_language(
     user_id: str,
     initial_date_string: str = "",
     final_date_string: str = "",
+    ides_string: str = "",
+    copilot_models_string: str = "",
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ) -> List[CopilotMetricsByLanguage]:
@@ -156,32 +329,58 @@ def get_copilot_metrics_by_language(
         initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
     if(final_date_string):
         final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    ides: List[str] = []
+    if(ides_string):
+        ides = ides_string.split(',')
+    copilot_models: List[str] = []
+    if(copilot_models_string):
+        copilot_models = copilot_models_string.split(',')
     get_copilot_metrics_by_language_use_case = set_get_copilot_metrics_by_language_dependencies(db)
-    response = get_copilot_metrics_by_language_use_case.execute(user_id, initial_date, final_date)
+    response = get_copilot_metrics_by_language_use_case.execute(user_id, initial_date, final_date, ides, copilot_models)
     return response
 
 @router.get("/copilot_metrics/period/{user_id}")
 def get_copilot_metrics_by_period(
     user_id: str,
     period: str = "",
+    initial_date_string: str = "",
+    final_date_string: str = "",
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ) -> List[CopilotMetricsByPeriod]:
     verify_user_access(token, user_id)
+    initial_date = None
+    final_date = None
+    if(initial_date_string):
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+    if(final_date_string):
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
+    try:
+        validated_period = Period(period)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid period: {period}")
     get_copilot_metrics_by_period_use_case = set_get_copilot_metrics_by_period_dependencies(db)
-    response = get_copilot_metrics_by_period_use_case.execute(user_id, period) # type: ignore
+    response = get_copilot_metrics_by_period_use_case.execute(user_id, validated_period, initial_date, final_date)
     return response
 
 
 @router.get("/copilot_metrics/users/{user_id}")
 def get_copilot_metrics_by_users(
     user_id: str,
+    initial_date_string: str = "",
+    final_date_string: str = "",
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ) -> List[CopilotUsersMetrics]:
     verify_user_access(token, user_id)
+    initial_date = None
+    final_date = None
+    if(initial_date_string):
+        initial_date = datetime.strptime(initial_date_string, "%Y-%m-%d")
+    if(final_date_string):
+        final_date = datetime.strptime(final_date_string, "%Y-%m-%d")
     get_copilot_users_metrics_use_case = set_get_copilot_users_metrics_dependencies(db)
-    response = get_copilot_users_metrics_use_case.execute(user_id)
+    response = get_copilot_users_metrics_use_case.execute(user_id, initial_date, final_date)
     return response
 
 @router.post("/github_app")
@@ -370,6 +569,38 @@ def delete_user_metrics(
     delete_user_metrics_use_case = set_delete_metrics_dependencies(db)
     delete_user_metrics_use_case.execute(username)
 
+@router.post("/admin/rollups/rebuild")
+def rebuild_metrics_rollups(
+    token: str = Body(..., embed=True),
+    username: str = Body("", embed=True),
+    db: Session = Depends(get_db),
+) -> Dict[str, str]:
+    verify_admin_access(token)
+    rebuild_metrics_rollups_use_case = set_rebuild_metrics_rollups_dependencies(db)
+    rebuild_metrics_rollups_use_case.execute(username)
+    return {"message": "Metrics rollups rebuilt successfully"}
+
+@router.post("/admin/metrics/bulk_load")
+def bulk_load_metrics(
+    file: UploadFile = File(...),
+    kind: str = Body(..., embed=True),
+    username: str = Body(..., embed=True),
+    token: str = Body(..., embed=True),
+    db: Session = Depends(get_db),
+) -> BulkInsertResult:
+    verify_admin_access(token)
+    # The CSV is read row by row straight into COPY, never held in memory as a whole
+    rows = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8", newline=""))
+    bulk_load_metrics_use_case = set_bulk_load_metrics_dependencies(db)
+    return bulk_load_metrics_use_case.execute(kind, username, rows)
+
+@router.post("/admin/cache/stats")
+def get_cache_stats(
+    token: str = Body(..., embed=True),
+) -> Dict[str, int]:
+    verify_admin_access(token)
+    return calculated_metrics_cache.stats()
+
 @router.post("/admin/database/clear")
 def clear_database(
     token: str = Body(..., embed=True),
@@ -380,12 +611,20 @@ def clear_database(
     from src.infrastructure.database.raw_copilot_code_metrics.postgre.dtos.model import RawCopilotCodeMetrics
     from src.infrastructure.database.raw_copilot_chat_metrics.postgre.dtos.model import RawCopilotChatMetrics
     from src.infrastructure.database.users.postgre.dtos.model import UserDbSchema
+    from src.infrastructure.database.commit_metrics_daily.postgre.dtos.model import CommitMetricsDaily
+    from src.infrastructure.database.copilot_code_metrics_daily.postgre.dtos.model import CopilotCodeMetricsDaily
+    from src.infrastructure.database.copilot_chat_metrics_daily.postgre.dtos.model import CopilotChatMetricsDaily
+    from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 
     try:
+        db.query(CommitMetricsDaily).delete()
+        db.query(CopilotCodeMetricsDaily).delete()
+        db.query(CopilotChatMetricsDaily).delete()
         db.query(RawCopilotChatMetrics).delete()
         db.query(RawCopilotCodeMetrics).delete()
         db.query(RawCommitMetrics).delete()
         db.query(UserDbSchema).delete()
+        UserDataVersionsRepository(db).bump_all()
         db.commit()
         return {"message": "All database data cleared successfully"}
     except Exception as e:
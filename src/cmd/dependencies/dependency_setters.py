@@ -14,11 +14,20 @@ from src.domain.use_cases.find_github_app_use_case import FindGitHubAppUseCase
 from src.domain.use_cases.find_report_config_use_case import FindReportConfigUseCase
 from src.domain.use_cases.get_calculated_metrics_use_case import GetCalculatedMetricsUseCase
 from src.domain.use_cases.get_commit_metrics_use_case import GetCommitMetricsUseCase
+from src.domain.use_cases.get_commit_metrics_breakdown_use_case import GetCommitMetricsBreakdownUseCase
+from src.domain.use_cases.get_copilot_metrics_breakdown_use_case import GetCopilotMetricsBreakdownUseCase
+from src.domain.use_cases.get_copilot_metrics_by_editor_use_case import GetCopilotMetricsByEditorUseCase
 from src.domain.use_cases.get_copilot_metrics_by_language_use_case import GetCopilotMetricsByLanguageUseCase
 from src.domain.use_cases.get_copilot_metrics_by_period_use_case import GetCopilotMetricsByPeriodUseCase
 from src.domain.use_cases.get_copilot_metrics_use_case import GetCopilotMetricsUseCase
 from src.domain.use_cases.get_copilot_users_metrics_use_case import GetCopilotUsersMetricsUseCase
+from src.domain.use_cases.get_report_metrics_snapshot_use_case import GetReportMetricsSnapshotUseCase
 from src.domain.use_cases.get_csv_commit_metrics_use_case import GetXlsxCommitMetricsUseCase
+from src.domain.use_cases.get_dashboard_metrics_bundle_use_case import GetDashboardMetricsBundleUseCase
+from src.domain.use_cases.get_metrics_correlation_use_case import GetMetricsCorrelationUseCase
+from src.domain.use_cases.bulk_load_metrics_use_case import BulkLoadMetricsUseCase
+from src.domain.use_cases.maintain_metrics_partitions_use_case import MaintainMetricsPartitionsUseCase
+from src.domain.use_cases.rebuild_metrics_rollups_use_case import RebuildMetricsRollupsUseCase
 from src.domain.use_cases.send_metrics_email_use_case import SendMetricsEmailUseCase
 from src.domain.use_cases.update_report_config_use_case import UpdateReportConfigUseCase
 from src.domain.use_cases.validate_user_use_case import ValidateUserUseCase
@@ -26,12 +35,19 @@ from src.domain.use_cases.validate_api_key_use_case import ValidateApiKeyUseCase
 from src.domain.use_cases.create_api_key_use_case import CreateApiKeyUseCase
 from src.domain.use_cases.list_api_keys_use_case import ListApiKeysUseCase
 from src.domain.use_cases.revoke_api_key_use_case import RevokeApiKeyUseCase
+from src.infrastructure.cache.metrics_cache import calculated_metrics_cache, metrics_correlations_cache
 from src.infrastructure.database.api_keys.postgre.api_keys_repository import ApiKeysRepository
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+from src.infrastructure.database.metrics_bulk_loader.postgre.metrics_bulk_loader_repository import MetricsBulkLoaderRepository
+from src.infrastructure.database.metrics_partitions.postgre.metrics_partitions_repository import MetricsPartitionsRepository
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
 from src.infrastructure.database.github_apps.postgre.github_apps_repository import GitHubAppsRepository
 from src.infrastructure.database.raw_commit_metrics.postgre.raw_commit_metrics_repository import RawCommitMetricsRepository
 from src.infrastructure.database.raw_copilot_chat_metrics.postgre.raw_copilot_chat_metrics_repository import RawCopilotChatMetricsRepository
 from src.infrastructure.database.raw_copilot_code_metrics.postgre.raw_copilot_code_metrics_repository import RawCopilotCodeMetricsRepository
 from src.infrastructure.database.report_config.postgre.report_config_repository import ReportConfigRepository
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 from src.infrastructure.database.users.postgre.users_repository import UsersRepository
 
 
@@ -90,38 +106,82 @@ def set_get_calculated_metrics_dependencies(
 ) -> GetCalculatedMetricsUseCase:
     commit_metrics_repository = RawCommitMetricsRepository(db)
     copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
+    commit_metrics_daily_repository = CommitMetricsDailyRepository(db)
     return GetCalculatedMetricsUseCase(
         commit_metrics_repository,
         copilot_code_metrics_repository,
+        commit_metrics_daily_repository,
+        calculated_metrics_cache,
+        UserDataVersionsRepository(db),
+    )
+
+
+def set_get_metrics_correlation_dependencies(
+    db: Session,
+) -> GetMetricsCorrelationUseCase:
+    commit_metrics_repository = RawCommitMetricsRepository(db)
+    copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
+    return GetMetricsCorrelationUseCase(
+        commit_metrics_repository,
+        copilot_code_metrics_repository,
+        metrics_correlations_cache,
+        UserDataVersionsRepository(db),
+    )
+
+
+def set_get_commit_metrics_breakdown_dependencies(
+    db: Session,
+) -> GetCommitMetricsBreakdownUseCase:
+    commit_metrics_repository = RawCommitMetricsRepository(db)
+    return GetCommitMetricsBreakdownUseCase(
+        commit_metrics_repository,
+    )
+
+
+def set_get_copilot_metrics_breakdown_dependencies(
+    db: Session,
+) -> GetCopilotMetricsBreakdownUseCase:
+    copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
+    return GetCopilotMetricsBreakdownUseCase(
+        copilot_code_metrics_repository,
     )
 
 
 def set_get_copilot_metrics_by_language_dependencies(
     db: Session,
 ) -> GetCopilotMetricsByLanguageUseCase:
-    copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
+    copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
     return GetCopilotMetricsByLanguageUseCase(
-        copilot_code_metrics_repository,
+        copilot_code_metrics_daily_repository,
     )
 
 
 def set_get_copilot_metrics_by_period_dependencies(
     db: Session,
 ) -> GetCopilotMetricsByPeriodUseCase:
-    copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
+    copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
     return GetCopilotMetricsByPeriodUseCase(
-        copilot_code_metrics_repository,
+        copilot_code_metrics_daily_repository,
+    )
+
+
+def set_get_copilot_metrics_by_editor_dependencies(
+    db: Session,
+) -> GetCopilotMetricsByEditorUseCase:
+    copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
+    copilot_chat_metrics_daily_repository = CopilotChatMetricsDailyRepository(db)
+    return GetCopilotMetricsByEditorUseCase(
+        copilot_code_metrics_daily_repository,
+        copilot_chat_metrics_daily_repository,
     )
 
 
 def set_get_copilot_users_metrics_dependencies(
     db: Session,
 ) -> GetCopilotUsersMetricsUseCase:
-    copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
-    copilot_chat_metrics_repository = RawCopilotChatMetricsRepository(db)
+    copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
     return GetCopilotUsersMetricsUseCase(
-        copilot_code_metrics_repository,
-        copilot_chat_metrics_repository,
+        copilot_code_metrics_daily_repository,
     )
 
 
@@ -166,16 +226,28 @@ def set_fetch_copilot_metrics_dependencies(
     get_copilot_metrics_use_case = set_get_copilot_metrics_dependencies(db)
     return FetchCopilotMetricsUseCase(github_apps_repository, get_copilot_metrics_use_case, encryption_key=FERNET_KEY) # type: ignore
 
+def set_get_report_metrics_snapshot_dependencies(
+    db: Session
+) -> GetReportMetricsSnapshotUseCase:
+    commit_metrics_repository = RawCommitMetricsRepository(db)
+    commit_metrics_daily_repository = CommitMetricsDailyRepository(db)
+    copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
+    copilot_chat_metrics_daily_repository = CopilotChatMetricsDailyRepository(db)
+    return GetReportMetricsSnapshotUseCase(commit_metrics_repository, commit_metrics_daily_repository, copilot_code_metrics_daily_repository, copilot_chat_metrics_daily_repository)
+
+def set_get_dashboard_metrics_bundle_dependencies(
+    db: Session
+) -> GetDashboardMetricsBundleUseCase:
+    get_report_metrics_snapshot_use_case = set_get_report_metrics_snapshot_dependencies(db)
+    return GetDashboardMetricsBundleUseCase(get_report_metrics_snapshot_use_case)
+
 def set_send_metrics_email_dependencies(
     db: Session
 ) -> SendMetricsEmailUseCase:
     report_config_repository = ReportConfigRepository(db)
     github_apps_repository = GitHubAppsRepository(db)
-    get_calculated_metrics_use_case = set_get_calculated_metrics_dependencies(db)
-    get_copilot_metrics_by_language_use_case = set_get_copilot_metrics_by_language_dependencies(db)
-    get_copilot_metrics_by_period_use_case = set_get_copilot_metrics_by_period_dependencies(db)
-    get_copilot_users_metrics_use_case = set_get_copilot_users_metrics_dependencies(db)
-    return SendMetricsEmailUseCase(report_config_repository, github_apps_repository, get_calculated_metrics_use_case, get_copilot_metrics_by_language_use_case, get_copilot_metrics_by_period_use_case, get_copilot_users_metrics_use_case, mail_name=MAIL_NAME, mail_password=MAIL_PASSWORD, encryption_key=FERNET_KEY, unsubscribe_link=UNSUBSCRIBE_LINK) # type: ignore
+    get_report_metrics_snapshot_use_case = set_get_report_metrics_snapshot_dependencies(db)
+    return SendMetricsEmailUseCase(report_config_repository, github_apps_repository, get_report_metrics_snapshot_use_case, mail_name=MAIL_NAME, mail_password=MAIL_PASSWORD, encryption_key=FERNET_KEY, unsubscribe_link=UNSUBSCRIBE_LINK) # type: ignore
 
 def set_find_github_app_dependencies(
     db: Session
@@ -220,4 +292,26 @@ def set_delete_metrics_dependencies(
     commit_metrics_repository = RawCommitMetricsRepository(db)
     copilot_code_metrics_repository = RawCopilotCodeMetricsRepository(db)
     copilot_chat_metrics_repository = RawCopilotChatMetricsRepository(db)
-    return DeleteMetricsUseCase(users_repository, commit_metrics_repository, copilot_code_metrics_repository, copilot_chat_metrics_repository)
\ No newline at end of file
+    return DeleteMetricsUseCase(users_repository, commit_metrics_repository, copilot_code_metrics_repository, copilot_chat_metrics_repository)
+
+def set_rebuild_metrics_rollups_dependencies(
+    db: Session
+) -> RebuildMetricsRollupsUseCase:
+    users_repository = UsersRepository(db)
+    commit_metrics_daily_repository = CommitMetricsDailyRepository(db)
+    copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
+    copilot_chat_metrics_daily_repository = CopilotChatMetricsDailyRepository(db)
+    return RebuildMetricsRollupsUseCase(users_repository, commit_metrics_daily_repository, copilot_code_metrics_daily_repository, copilot_chat_metrics_daily_repository)
+
+def set_maintain_metrics_partitions_dependencies(
+    db: Session
+) -> MaintainMetricsPartitionsUseCase:
+    metrics_partitions_repository = MetricsPartitionsRepository(db)
+    return MaintainMetricsPartitionsUseCase(metrics_partitions_repository)
+
+def set_bulk_load_metrics_dependencies(
+    db: Session
+) -> BulkLoadMetricsUseCase:
+    users_repository = UsersRepository(db)
+    metrics_bulk_loader_repository = MetricsBulkLoaderRepository(db)
+    return BulkLoadMetricsUseCase(users_repository, metrics_bulk_loader_repository)
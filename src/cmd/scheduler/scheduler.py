@@ -1,7 +1,8 @@
 from src.infrastructure.logger.logger_config import logger
 from apscheduler.schedulers.background import BackgroundScheduler # type: ignore
 
-from src.cmd.dependencies.dependency_setters import set_fetch_copilot_metrics_dependencies, set_send_metrics_email_dependencies
+from src.cmd.dependencies.dependency_setters import set_fetch_copilot_metrics_dependencies, set_maintain_metrics_partitions_dependencies, set_send_metrics_email_dependencies
+from src.config.config import CONFIG
 from src.infrastructure.database.connection.database_connection import SessionLocal # type: ignore
 
 
@@ -31,6 +32,24 @@ def fetch_metrics_job() -> None:
         logger.info("Database session closed.")
 
 
+@scheduler.scheduled_job('interval', days=1) # type: ignore
+def maintain_partitions_job() -> None:
+    logger.info("Starting raw metrics partition maintenance")
+    db = SessionLocal()
+
+    maintain_metrics_partitions_use_case = set_maintain_metrics_partitions_dependencies(db)
+
+    try:
+        maintain_metrics_partitions_use_case.execute(retention_months=CONFIG.raw_metrics_retention_months)
+        logger.info("Raw metrics partition maintenance completed successfully")
+
+    except Exception as e:
+        logger.error(f"Error during raw metrics partition maintenance: {e}")
+
+    finally:
+        db.close()
+
+
 @scheduler.scheduled_job('interval', days=1) # type: ignore
 def send_email_job() -> None:
     logger.info("Starting metrics email dispatch")
@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -8,14 +9,29 @@ load_dotenv()
 class Config:
     __REPO_PATH_ENV = "REPO_PATH"
     __GH_COPILOT_METRICS_FILE_PATH_ENV = "GH_COPILOT_METRICS_FILE_PATH"
+    __RAW_METRICS_RETENTION_MONTHS_ENV = "RAW_METRICS_RETENTION_MONTHS"
+    __DB_INSERT_BATCH_SIZE_ENV = "DB_INSERT_BATCH_SIZE"
 
     __DEFAULT_REPO_PATH = "."
+    __DEFAULT_DB_INSERT_BATCH_SIZE = "1000"
 
     def __init__(self) -> None:
         self.repo_path: str = os.getenv(self.__REPO_PATH_ENV, self.__DEFAULT_REPO_PATH)
         self.gh_copilot_metrics_file_path: str = os.getenv(
             self.__GH_COPILOT_METRICS_FILE_PATH_ENV, ""
         )
+        # Empty keeps every raw metrics partition
+        retention_months = os.getenv(self.__RAW_METRICS_RETENTION_MONTHS_ENV, "")
+        self.raw_metrics_retention_months: Optional[int] = (
+            int(retention_months) if retention_months else None
+        )
+        self.db_insert_batch_size: int = int(
+            os.getenv(self.__DB_INSERT_BATCH_SIZE_ENV, self.__DEFAULT_DB_INSERT_BATCH_SIZE)
+        )
+        if self.db_insert_batch_size < 1:
+            raise ValueError(
+                f"{self.__DB_INSERT_BATCH_SIZE_ENV} must be at least 1, got {self.db_insert_batch_size}"
+            )
 
 
 CONFIG = Config()
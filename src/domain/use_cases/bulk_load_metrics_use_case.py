@@ -0,0 +1,38 @@
+from typing import Any, Iterable, Mapping
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.dtos.bulk_insert_result import BulkInsertResult
+from src.infrastructure.database.metrics_bulk_loader.postgre.metrics_bulk_loader_repository import MetricsBulkLoaderRepository
+from src.infrastructure.database.users.postgre.users_repository import UsersRepository
+
+
+class BulkLoadMetricsUseCase:
+    def __init__(
+        self,
+        users_repository: UsersRepository,
+        metrics_bulk_loader_repository: MetricsBulkLoaderRepository,
+    ) -> None:
+        self.users_repository = users_repository
+        self.metrics_bulk_loader_repository = metrics_bulk_loader_repository
+
+    def execute(
+        self,
+        kind: str,
+        username: str,
+        rows: Iterable[Mapping[str, Any]],
+    ) -> BulkInsertResult:
+        """Loads a large commit, copilot_code or copilot_chat import for one user through COPY"""
+        allowed = list(MetricsBulkLoaderRepository.TARGETS)
+        if kind not in allowed:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid metrics kind: {kind}. Allowed: {allowed}",
+            )
+
+        user = self.users_repository.find_by_username(username)
+
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        return self.metrics_bulk_loader_repository.load(kind, user.id, rows)
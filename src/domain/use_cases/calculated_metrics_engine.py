@@ -0,0 +1,284 @@
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+import pandas as pd  # type: ignore
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.calculated_metrics import (
+    CalculatedMetrics,
+    CodeLineMetricsData,
+    CommitMetricsData,
+)
+from src.domain.use_cases.dtos.period_aggregates import (
+    CommitMetricsDailyAggregate,
+    CommitMetricsPeriodAggregate,
+    CopilotCodeMetricsPeriodAggregate,
+)
+from src.domain.use_cases.time_series_alignment import TimeSeriesAlignment
+
+
+class CalculatedMetricsEngine:
+    """
+    Columnar aggregation behind GetCalculatedMetricsUseCase.
+    Aggregates are turned into typed columns once and every period bucket is
+    computed in a single grouped pass instead of one DataFrame per commit.
+    """
+
+    # ================================ Database aggregates ================================
+
+    @staticmethod
+    def rebucket(frame: pd.DataFrame, period: Period) -> pd.DataFrame:
+        """
+        Re-labels rows already bucketed by the database (one row per
+        period_start) with the pandas bins the responses are labelled with,
+        including the empty periods in between.
+        """
+        return frame.groupby(  # type: ignore
+            pd.Grouper(key="period_start", freq=period)
+        ).sum()
+
+    @staticmethod
+    def bucket_labels(period_starts: Sequence[datetime], period: Period) -> pd.DatetimeIndex:
+        """
+        Labels of every bucket between the first and last period start, gaps included,
+        as rebucket produces them. Each label is the bucket end, so
+        searchsorted maps a period start to its own bucket.
+        """
+        counts = pd.Series(1, index=pd.DatetimeIndex(period_starts)).groupby(
+            pd.Grouper(freq=period)
+        ).size()
+        return counts.index
+
+    @staticmethod
+    def copilot_lines_from_aggregates(
+        copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate], period: Period
+    ) -> Dict[pd.Timestamp, int]:
+        if not copilot_aggregates:
+            return {}
+
+        lines = CalculatedMetricsEngine.rebucket(
+            pd.DataFrame.from_records(
+                [(a.period_start, a.lines_accepted) for a in copilot_aggregates],
+                columns=["period_start", "lines_accepted"],
+            ),
+            period,
+        )["lines_accepted"]
+        return dict(zip(lines.index, lines.to_numpy().tolist()))  # type: ignore
+
+    @staticmethod
+    def code_lines_metrics_from_aggregates(
+        user_id: str,
+        languages: List[str],
+        commit_aggregates: List[CommitMetricsPeriodAggregate],
+        copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate],
+        period: Period,
+    ) -> CalculatedMetrics:
+        frame = pd.DataFrame.from_records(
+            [
+                (a.period_start, a.added_lines, a.added_lines + a.removed_lines, a.number_of_authors)
+                for a in commit_aggregates
+            ],
+            columns=["period_start", "added_lines", "net_changed_lines", "number_of_authors"],
+        )
+
+        return CalculatedMetricsEngine.assemble_code_lines_metrics(
+            user_id=user_id,
+            period=period,
+            languages=languages,
+            buckets=CalculatedMetricsEngine.rebucket(frame, period),
+            copilot_lines=CalculatedMetricsEngine.copilot_lines_from_aggregates(copilot_aggregates, period),
+            total_added_lines=int(frame["added_lines"].sum()),
+        )
+
+    @staticmethod
+    def commit_metrics_from_aggregates(
+        user_id: str,
+        languages: List[str],
+        number_of_authors: int,
+        commit_aggregates: List[CommitMetricsPeriodAggregate],
+        copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate],
+        period: Period,
+    ) -> CalculatedMetrics:
+        frame = pd.DataFrame.from_records(
+            [
+                (a.period_start, a.added_lines, a.added_lines + a.removed_lines, a.number_of_commits)
+                for a in commit_aggregates
+            ],
+            columns=["period_start", "added_lines", "net_changed_lines", "total_commits"],
+        )
+
+        return CalculatedMetricsEngine.assemble_commit_metrics(
+            user_id=user_id,
+            period=period,
+            languages=languages,
+            number_of_authors=number_of_authors,
+            buckets=CalculatedMetricsEngine.rebucket(frame, period),
+            copilot_lines=CalculatedMetricsEngine.copilot_lines_from_aggregates(copilot_aggregates, period),
+            total_added_lines=int(frame["added_lines"].sum()),
+        )
+
+    # ================================ Daily rollup rows ================================
+
+    @staticmethod
+    def code_lines_metrics_from_days(
+        user_id: str,
+        commit_aggregates: List[CommitMetricsDailyAggregate],
+        copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate],
+        period: Period,
+    ) -> CalculatedMetrics:
+        """
+        Same series as code_lines_metrics_from_aggregates, bucketed in memory from
+        the rows of CommitMetricsDailyRepository.list_daily_aggregates_by_user_id.
+        copilot_aggregates may hold daily buckets, they are re-bucketed to period.
+        """
+        frame = pd.DataFrame.from_records(
+            [(a.day, a.language, a.author_name, a.added_lines, a.removed_lines) for a in commit_aggregates],
+            columns=["day", "language", "author_name", "added_lines", "removed_lines"],
+        )
+        frame["day"] = pd.to_datetime(frame["day"])
+
+        # Authors may be None; factorize keeps None as its own distinct value, like the database
+        author_codes, _ = pd.factorize(frame["author_name"], use_na_sentinel=False)  # type: ignore
+        buckets = frame.assign(
+            net_changed_lines=frame["added_lines"] + frame["removed_lines"],
+            author_code=author_codes,
+        ).groupby(pd.Grouper(key="day", freq=period)).agg(  # type: ignore
+            net_changed_lines=("net_changed_lines", "sum"),
+            number_of_authors=("author_code", "nunique"),
+        )
+
+        return CalculatedMetricsEngine.assemble_code_lines_metrics(
+            user_id=user_id,
+            period=period,
+            languages=CalculatedMetricsEngine.languages_by_first_day(frame),
+            buckets=buckets,
+            copilot_lines=CalculatedMetricsEngine.copilot_lines_from_aggregates(copilot_aggregates, period),
+            total_added_lines=int(frame["added_lines"].sum()),
+        )
+
+    @staticmethod
+    def commit_metrics_from_days(
+        user_id: str,
+        commit_aggregates: List[CommitMetricsDailyAggregate],
+        commit_day_aggregates: List[CommitMetricsPeriodAggregate],
+        copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate],
+        period: Period,
+    ) -> CalculatedMetrics:
+        """
+        Same series as commit_metrics_from_aggregates. Distinct commits only add up
+        across days, so commit_day_aggregates holds the daily buckets of
+        RawCommitMetricsRepository.list_period_aggregates_by_user_id; the languages
+        and authors come from the daily rollup rows.
+        """
+        frame = pd.DataFrame.from_records(
+            [(a.day, a.language, a.author_name) for a in commit_aggregates],
+            columns=["day", "language", "author_name"],
+        )
+        _, authors = pd.factorize(frame["author_name"], use_na_sentinel=False)  # type: ignore
+
+        return CalculatedMetricsEngine.commit_metrics_from_aggregates(
+            user_id,
+            CalculatedMetricsEngine.languages_by_first_day(frame),
+            len(authors),
+            commit_day_aggregates,
+            copilot_aggregates,
+            period,
+        )
+
+    @staticmethod
+    def languages_by_first_day(frame: pd.DataFrame) -> List[str]:
+        """Distinct languages ordered by the day they first appear, then by name"""
+        ordered = frame.sort_values(["day", "language"], kind="stable")
+        return pd.unique(ordered["language"].to_numpy()).tolist()  # type: ignore
+
+    # ================================ Response assembly ================================
+
+    @staticmethod
+    def copilot_share(copilot_lines: int, total_added_lines: int) -> float:
+        return copilot_lines / total_added_lines if total_added_lines > 0 else 0
+
+    @staticmethod
+    def assemble_code_lines_metrics(
+        user_id: str,
+        period: Period,
+        languages: List[str],
+        buckets: pd.DataFrame,
+        copilot_lines: Dict[pd.Timestamp, int],
+        total_added_lines: int,
+    ) -> CalculatedMetrics:
+        """
+        buckets is indexed by the period final date and holds
+        net_changed_lines and number_of_authors for every bucket.
+        """
+        response = CalculatedMetrics(
+            user_id=user_id,
+            languages=languages,
+            period=period,
+            data=[],
+        )
+
+        for period_final_date, net_changed_lines, number_of_authors, bucket_copilot_lines in zip(
+            buckets.index,
+            buckets["net_changed_lines"].to_numpy().tolist(),
+            buckets["number_of_authors"].to_numpy().tolist(),
+            TimeSeriesAlignment.reindex(copilot_lines, buckets.index),
+        ):
+            percentage_changed_lines_by_copilot = CalculatedMetricsEngine.copilot_share(
+                bucket_copilot_lines, total_added_lines
+            )
+            response.data.append(
+                CodeLineMetricsData(
+                    initial_date=period_final_date.to_period(period).start_time.to_pydatetime(),
+                    final_date=period_final_date.to_pydatetime(),
+                    net_changed_lines=net_changed_lines,
+                    net_changed_lines_by_copilot=round(percentage_changed_lines_by_copilot * net_changed_lines),
+                    percentage_changed_lines_by_copilot=percentage_changed_lines_by_copilot,
+                    number_of_authors=number_of_authors,
+                )
+            )
+
+        return response
+
+    @staticmethod
+    def assemble_commit_metrics(
+        user_id: str,
+        period: Period,
+        languages: List[str],
+        number_of_authors: int,
+        buckets: pd.DataFrame,
+        copilot_lines: Dict[pd.Timestamp, int],
+        total_added_lines: int,
+    ) -> CalculatedMetrics:
+        """
+        buckets is indexed by the period final date and holds
+        total_commits and net_changed_lines for every bucket.
+        """
+        response = CalculatedMetrics(
+            user_id=user_id,
+            languages=languages,
+            period=period,
+            data=[],
+        )
+
+        for period_final_date, total_commits, net_changed_lines, bucket_copilot_lines in zip(
+            buckets.index,
+            buckets["total_commits"].to_numpy().tolist(),
+            buckets["net_changed_lines"].to_numpy().tolist(),
+            TimeSeriesAlignment.reindex(copilot_lines, buckets.index),
+        ):
+            percentage_changed_lines_by_copilot = CalculatedMetricsEngine.copilot_share(
+                bucket_copilot_lines, total_added_lines
+            )
+            response.data.append(
+                CommitMetricsData(
+                    initial_date=period_final_date.to_period(period).start_time.to_pydatetime(),
+                    final_date=period_final_date.to_pydatetime(),
+                    total_commits=total_commits,
+                    number_of_authors=number_of_authors,
+                    net_changed_lines=net_changed_lines,
+                    net_changed_lines_by_copilot=round(percentage_changed_lines_by_copilot * net_changed_lines),
+                    percentage_changed_lines_by_copilot=percentage_changed_lines_by_copilot,
+                )
+            )
+
+        return response
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class BulkInsertResult(BaseModel):
+    """Outcome of an insert that skips rows which already exist"""
+    inserted: int
+    skipped: int
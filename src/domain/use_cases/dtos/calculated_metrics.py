@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -31,6 +31,11 @@ class CalculatedMetrics(BaseModel):
     period: Period
     data: List[CodeLineMetricsData | CommitMetricsData]
 
+class CombinedCalculatedMetrics(BaseModel):
+    user_id: str
+    code_lines: List[CalculatedMetrics]
+    commits: List[CalculatedMetrics]
+
 class CopilotMetricsByLanguage(BaseModel):
     language: str
     code_acceptances: int
@@ -52,3 +57,56 @@ class CopilotUsersMetrics(BaseModel):
     date: datetime
     total_code_assistant_users: int
     total_chat_users: int
+
+class CommitMetricsBreakdown(BaseModel):
+    repository: Optional[str] = None
+    team: Optional[str] = None
+    language: Optional[str] = None
+    author: Optional[str] = None
+    added_lines: int
+    removed_lines: int
+    gross_productivity: int
+    number_of_commits: int
+
+class CopilotMetricsBreakdown(BaseModel):
+    team: Optional[str] = None
+    language: Optional[str] = None
+    IDE: Optional[str] = None
+    copilot_model: Optional[str] = None
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+    relative_use_of_AI: float
+
+class CopilotMetricsByEditor(BaseModel):
+    IDE: Optional[str] = None
+    copilot_model: Optional[str] = None
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+    percentage_code_acceptances: float
+    percentage_lines_accepted: float
+    total_chats: int
+    chat_insertion_events: int
+    chat_copy_events: int
+
+class MetricsCorrelation(BaseModel):
+    value: Optional[str] = None
+    code_lines: float
+    commits: float
+
+class MetricsCorrelations(BaseModel):
+    user_id: str
+    period: Period
+    slice_by: str
+    number_of_periods: int
+    overall: MetricsCorrelation
+    slices: List[MetricsCorrelation]
+
+class DashboardMetricsBundle(BaseModel):
+    calculated_metrics: CalculatedMetrics
+    copilot_metrics_by_language: List[CopilotMetricsByLanguage]
+    copilot_metrics_by_period: List[CopilotMetricsByPeriod]
+    copilot_users_metrics: List[CopilotUsersMetrics]
@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CommitMetricsPeriodAggregate(BaseModel):
+    """One period bucket of raw commit metrics, summed by the database"""
+    period_start: datetime
+    added_lines: int
+    removed_lines: int
+    number_of_authors: int
+    number_of_commits: int
+
+
+class CopilotCodeMetricsPeriodAggregate(BaseModel):
+    """One period bucket of Copilot code metrics, summed by the database"""
+    period_start: datetime
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+
+
+class CopilotCodeMetricsPeriodTotals(BaseModel):
+    """One period bucket of Copilot code metrics with its acceptance ratios, computed by the database"""
+    period_start: datetime
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+    percentage_code_acceptances: float
+    percentage_lines_accepted: float
+
+
+class CopilotCodeMetricsLanguageAggregate(BaseModel):
+    """Copilot code metrics of one language, summed by the database"""
+    language: str
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+
+
+class CommitMetricsDailyAggregate(BaseModel):
+    """Commit metrics of one day, language and author, read from the daily rollup"""
+    day: datetime
+    language: str
+    author_name: Optional[str]
+    added_lines: int
+    removed_lines: int
+
+
+class CopilotCodeMetricsDailyAggregate(BaseModel):
+    """Copilot code metrics of one day and language, read from the daily rollup"""
+    day: datetime
+    language: str
+    total_users: int
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+
+
+class CopilotChatUsersDailyAggregate(BaseModel):
+    """Copilot chat users of one day, read from the daily rollup"""
+    day: datetime
+    total_users: int
+
+
+class CommitMetricsSlicePeriodAggregate(BaseModel):
+    """One period bucket of raw commit metrics of one team or language, summed by the database"""
+    slice_value: Optional[str]
+    period_start: datetime
+    added_lines: int
+    removed_lines: int
+    number_of_commits: int
+
+
+class CopilotCodeMetricsSlicePeriodAggregate(BaseModel):
+    """One period bucket of Copilot code metrics of one team or language, summed by the database"""
+    slice_value: Optional[str]
+    period_start: datetime
+    lines_accepted: int
+
+
+class CopilotCodeMetricsEditorAggregate(BaseModel):
+    """Copilot code metrics of one IDE and/or model, read from the daily rollup"""
+    IDE: Optional[str] = None
+    copilot_model: Optional[str] = None
+    code_acceptances: int
+    code_suggestions: int
+    lines_accepted: int
+    lines_suggested: int
+
+
+class CopilotChatMetricsEditorAggregate(BaseModel):
+    """Copilot chat metrics of one IDE and/or model, read from the daily rollup"""
+    IDE: Optional[str] = None
+    copilot_model: Optional[str] = None
+    total_chats: int
+    insertion_events: int
+    copy_events: int
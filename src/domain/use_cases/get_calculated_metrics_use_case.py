@@ -1,23 +1,18 @@
 from datetime import datetime
-from typing import Dict, List, Optional
-import uuid
+from typing import Dict, Hashable, List, Optional, Tuple
 
-import pandas as pd  # type: ignore
-
-from src.domain.entities.commit_metrics import CommitMetrics
-from src.domain.entities.copilot_code_metrics import CopilotCodeMetrics
 from src.domain.entities.value_objects.enums.period import Period
 from src.domain.entities.value_objects.enums.productivity_metric import (
     Productivity_metric,
 )
-from src.domain.use_cases.dtos.calculated_metrics import (
-    CalculatedMetrics,
-    CodeLineMetricsData,
-    CommitMetricsData,
-)
-from src.domain.use_cases.metrics_calculator import MetricsCalculator
+from src.domain.use_cases.calculated_metrics_engine import CalculatedMetricsEngine
+from src.domain.use_cases.dtos.calculated_metrics import CalculatedMetrics, CombinedCalculatedMetrics
+from src.domain.use_cases.dtos.period_aggregates import CommitMetricsPeriodAggregate
+from src.infrastructure.cache.metrics_cache import LRUCache
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
 from src.infrastructure.database.raw_commit_metrics.postgre.raw_commit_metrics_repository import RawCommitMetricsRepository
 from src.infrastructure.database.raw_copilot_code_metrics.postgre.raw_copilot_code_metrics_repository import RawCopilotCodeMetricsRepository
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 
 
 class GetCalculatedMetricsUseCase:
@@ -25,9 +20,15 @@ class GetCalculatedMetricsUseCase:
         self,
         commit_metrics_repository: RawCommitMetricsRepository,
         copilot_code_metrics_repository: RawCopilotCodeMetricsRepository,
+        commit_metrics_daily_repository: CommitMetricsDailyRepository,
+        cache: Optional[LRUCache[CalculatedMetrics]] = None,
+        user_data_versions: Optional[UserDataVersionsRepository] = None,
     ) -> None:
         self.commit_metrics_repository = commit_metrics_repository
         self.copilot_code_metrics_repository = copilot_code_metrics_repository
+        self.commit_metrics_daily_repository = commit_metrics_daily_repository
+        self.cache = cache
+        self.user_data_versions = user_data_versions
 
     def execute(
         self,
@@ -38,217 +39,233 @@ class GetCalculatedMetricsUseCase:
         final_date: Optional[datetime] = None,
         languages: Optional[List[str]] = None,
     ) -> CalculatedMetrics:
-        raw_commit_metrics = self.commit_metrics_repository.listByUserId(
-            user_id, initial_date, final_date, languages
+        if self.cache is None or self.user_data_versions is None:
+            return self.calculate(
+                user_id, period, productivity_metric, initial_date, final_date, languages
+            )
+
+        # The data version changes on every write, so stale entries are never hit
+        cache_key = self.cache_key(
+            user_id,
+            self.user_data_versions.get(user_id),
+            period,
+            productivity_metric,
+            initial_date,
+            final_date,
+            languages,
         )
 
-        if not raw_commit_metrics:
-            return CalculatedMetrics(
-                user_id=user_id,
-                languages=[],
-                period=period,
-                data=[],
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            cached = self.calculate(
+                user_id, period, productivity_metric, initial_date, final_date, languages
             )
+            self.cache.put(cache_key, cached)
 
-        raw_copilot_code_metrics = self.copilot_code_metrics_repository.listByUserId(
-            user_id, initial_date, final_date, languages
-        )
+        # Callers get their own copy so the cached entry cannot be mutated
+        return cached.model_copy(deep=True)
 
+    def calculate(
+        self,
+        user_id: str,
+        period: Period,
+        productivity_metric: Productivity_metric,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> CalculatedMetrics:
         productivity_metric_map = {
-            Productivity_metric.code_lines: self.get_code_lines_metrics,
-            Productivity_metric.commits: self.get_commit_metrics,
+            Productivity_metric.code_lines: self.get_aggregated_code_lines_metrics,
+            Productivity_metric.commits: self.get_aggregated_commit_metrics,
         }
 
         result = productivity_metric_map[productivity_metric](
-            raw_commit_metrics, raw_copilot_code_metrics, period
+            user_id, period, initial_date, final_date, languages
         )
 
         return result
 
-    def get_code_lines_metrics(
+    def execute_combined(
         self,
-        raw_commit_metrics: List[CommitMetrics],
-        raw_copilot_code_metrics: List[CopilotCodeMetrics],
-        period: Period,
-    ) -> CalculatedMetrics:
-        df_commit_metrics = pd.DataFrame(
-            [{"metrics": c, "date": c.date} for c in raw_commit_metrics]
-        )
-        df_copilot_code_metrics = pd.DataFrame(
-            [{"metrics": c, "date": c.date} for c in raw_copilot_code_metrics],
-            columns=["metrics", "date"]
+        user_id: str,
+        periods: List[Period],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> CombinedCalculatedMetrics:
+        """
+        Both productivity metrics for every requested period. The daily aggregates
+        are read once and every period is bucketed from them in memory; each result
+        is cached under the same key as execute, so both paths share the entries.
+        """
+        requested = [
+            (period, productivity_metric)
+            for productivity_metric in (Productivity_metric.code_lines, Productivity_metric.commits)
+            for period in periods
+        ]
+
+        results: Dict[Tuple[Period, Productivity_metric], CalculatedMetrics] = {}
+        cache_keys: Dict[Tuple[Period, Productivity_metric], Hashable] = {}
+        if self.cache is not None and self.user_data_versions is not None:
+            version = self.user_data_versions.get(user_id)
+            for period, productivity_metric in requested:
+                cache_keys[(period, productivity_metric)] = self.cache_key(
+                    user_id, version, period, productivity_metric, initial_date, final_date, languages
+                )
+                cached = self.cache.get(cache_keys[(period, productivity_metric)])
+                if cached is not None:
+                    results[(period, productivity_metric)] = cached
+
+        missing = [request for request in requested if request not in results]
+        if missing:
+            calculated = self.calculate_from_days(user_id, missing, initial_date, final_date, languages)
+            for request, metrics in calculated.items():
+                if self.cache is not None and request in cache_keys:
+                    self.cache.put(cache_keys[request], metrics)
+                results[request] = metrics
+
+        return CombinedCalculatedMetrics(
+            user_id=user_id,
+            code_lines=[
+                results[(period, Productivity_metric.code_lines)].model_copy(deep=True)
+                for period in periods
+            ],
+            commits=[
+                results[(period, Productivity_metric.commits)].model_copy(deep=True)
+                for period in periods
+            ],
         )
-        df_copilot_code_metrics["date"] = pd.to_datetime(df_copilot_code_metrics["date"], errors="coerce") # type: ignore
 
-        grouped_commit_metrics = df_commit_metrics.groupby(  # type: ignore
-            pd.Grouper(key="date", freq=period)
+    def calculate_from_days(
+        self,
+        user_id: str,
+        requested: List[Tuple[Period, Productivity_metric]],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> Dict[Tuple[Period, Productivity_metric], CalculatedMetrics]:
+        """
+        Reads each source once in daily buckets and computes every requested
+        period and metric from them. The raw commits are only read when a
+        commit series is requested, for the distinct commit counts.
+        """
+        commit_aggregates = self.commit_metrics_daily_repository.list_daily_aggregates_by_user_id(
+            user_id, initial_date, final_date, languages
         )
 
-        grouped_copilot_code_metrics = df_copilot_code_metrics.groupby(  # type: ignore
-            pd.Grouper(key="date", freq=period)
-        )
+        if not commit_aggregates:
+            return {
+                (period, productivity_metric): self.empty_metrics(user_id, period)
+                for period, productivity_metric in requested
+            }
 
-        response = CalculatedMetrics(
-            user_id=raw_commit_metrics[0].user_id,
-            languages=[],
-            period=period,
-            data=[],
+        copilot_aggregates = self.copilot_code_metrics_repository.list_period_aggregates_by_user_id(
+            user_id, Period.DAILY, initial_date, final_date, languages
         )
+        commit_day_aggregates: List[CommitMetricsPeriodAggregate] = []
+        if any(productivity_metric == Productivity_metric.commits for _, productivity_metric in requested):
+            commit_day_aggregates = self.commit_metrics_repository.list_period_aggregates_by_user_id(
+                user_id, Period.DAILY, initial_date, final_date, languages
+            )
 
-        total_added_lines: int = 0
-
-        for period_final_date, commit_metrics_df in grouped_commit_metrics:  # type: ignore
-            authors = []
-            net_changed_lines = 0
-            for commit_metrics in commit_metrics_df["metrics"]:  # type: ignore
-                if commit_metrics.language not in response.languages:  # type: ignore
-                    response.languages.append(commit_metrics.language)  # type: ignore
-                if commit_metrics.author.name not in authors:  # type: ignore
-                    authors.append(commit_metrics.author.name)  # type: ignore
-                net_changed_lines += MetricsCalculator.calculate_gross_productivity(
-                    [commit_metrics]
+        results: Dict[Tuple[Period, Productivity_metric], CalculatedMetrics] = {}
+        for period, productivity_metric in requested:
+            if productivity_metric == Productivity_metric.code_lines:
+                results[(period, productivity_metric)] = CalculatedMetricsEngine.code_lines_metrics_from_days(
+                    user_id, commit_aggregates, copilot_aggregates, period
                 )
-                total_added_lines += commit_metrics.added_lines  # type: ignore
-
-            response.data.append(
-                CodeLineMetricsData(
-                    initial_date=period_final_date.to_period(  # type: ignore
-                        period
-                    ).start_time.to_pydatetime(),
-                    final_date=period_final_date.to_pydatetime(),  # type: ignore
-                    net_changed_lines=net_changed_lines,
-                    net_changed_lines_by_copilot=0,
-                    percentage_changed_lines_by_copilot=0,
-                    number_of_authors=authors.__len__(),
+            elif not commit_day_aggregates:
+                results[(period, productivity_metric)] = self.empty_metrics(user_id, period)
+            else:
+                results[(period, productivity_metric)] = CalculatedMetricsEngine.commit_metrics_from_days(
+                    user_id, commit_aggregates, commit_day_aggregates, copilot_aggregates, period
                 )
-            )
-
-        for (
-            copilot_period_final_date,  # type: ignore
-            copilot_code_metrics_df,
-        ) in grouped_copilot_code_metrics:
-            index = next(
-                (i for i, data in enumerate(response.data)
-                if data.final_date == copilot_period_final_date),
-                None
-            )
-            if index is None:
-                continue
-            total_added_lines_by_copilot = MetricsCalculator.calculate_gross_use_of_AI_lines(
-                copilot_code_metrics_df["metrics"].to_list()  # type: ignore
-            )
-            percentage_changed_lines_by_copilot = (  # type: ignore
-                total_added_lines_by_copilot / total_added_lines
-            )
-            response.data[index].percentage_changed_lines_by_copilot = percentage_changed_lines_by_copilot # type: ignore
-            response.data[index].net_changed_lines_by_copilot = round(percentage_changed_lines_by_copilot * response.data[index].net_changed_lines) # type: ignore
 
-        return response
+        return results
 
-    def get_commit_metrics(
+    def get_aggregated_code_lines_metrics(
         self,
-        raw_commit_metrics: List[CommitMetrics],
-        raw_copilot_code_metrics: List[CopilotCodeMetrics],
+        user_id: str,
         period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
     ) -> CalculatedMetrics:
-
-        aggregated_by_hash: Dict[str, CommitMetrics] = {}
-
-        languages: List[str] = []
-        authors: List[str] = []
-
-        for c in raw_commit_metrics:
-            if c.language not in languages:
-                languages.append(c.language)
-
-            if c.author.name not in authors:
-                authors.append(c.author.name) # type: ignore
-
-            if c.hash not in aggregated_by_hash:
-                aggregated_by_hash[c.hash] = CommitMetrics(
-                    id=str(uuid.uuid4()),
-                    hash=c.hash,
-                    user_id=c.user_id,
-                    date=c.date,
-                    language=c.language,
-                    author=c.author,
-                    added_lines=c.added_lines,
-                    removed_lines=c.removed_lines,
-                    repository=c.repository
-                )
-            else:
-                aggregated_by_hash[c.hash].added_lines += c.added_lines
-                aggregated_by_hash[c.hash].removed_lines += c.removed_lines
-                if c.date > aggregated_by_hash[c.hash].date:
-                    aggregated_by_hash[c.hash].date = c.date
-
-        aggregated_list = list(aggregated_by_hash.values())
-
-        response = CalculatedMetrics(
-            user_id=aggregated_list[0].user_id,
-            languages=languages,
-            period=period,
-            data=[],
+        # Lines and authors add up per day, so they are read from the daily rollup
+        commit_aggregates = self.commit_metrics_daily_repository.list_period_aggregates_by_user_id(
+            user_id, period, initial_date, final_date, languages
         )
 
-        df_commit_metrics = pd.DataFrame(
-            [{"metrics": c, "date": c.date} for c in aggregated_list]
+        if not commit_aggregates:
+            return self.empty_metrics(user_id, period)
+
+        return CalculatedMetricsEngine.code_lines_metrics_from_aggregates(
+            user_id,
+            self.commit_metrics_daily_repository.list_languages_by_user_id(
+                user_id, initial_date, final_date, languages
+            ),
+            commit_aggregates,
+            self.copilot_code_metrics_repository.list_period_aggregates_by_user_id(
+                user_id, period, initial_date, final_date, languages
+            ),
+            period,
         )
 
-        df_copilot_code_metrics = pd.DataFrame(
-            [{"metrics": c, "date": c.date} for c in raw_copilot_code_metrics],
-            columns=["metrics", "date"]
+    def get_aggregated_commit_metrics(
+        self,
+        user_id: str,
+        period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> CalculatedMetrics:
+        # Distinct commits span several language rows, so they are counted on the raw table
+        commit_aggregates = self.commit_metrics_repository.list_period_aggregates_by_user_id(
+            user_id, period, initial_date, final_date, languages
         )
-        df_copilot_code_metrics["date"] = pd.to_datetime(df_copilot_code_metrics["date"], errors="coerce") # type: ignore
 
-        grouped_commit_metrics = df_commit_metrics.groupby( # type: ignore
-            pd.Grouper(key="date", freq=period)
+        if not commit_aggregates:
+            return self.empty_metrics(user_id, period)
+
+        return CalculatedMetricsEngine.commit_metrics_from_aggregates(
+            user_id,
+            self.commit_metrics_repository.list_languages_by_user_id(
+                user_id, initial_date, final_date, languages
+            ),
+            self.commit_metrics_repository.count_authors_by_user_id(
+                user_id, initial_date, final_date, languages
+            ),
+            commit_aggregates,
+            self.copilot_code_metrics_repository.list_period_aggregates_by_user_id(
+                user_id, period, initial_date, final_date, languages
+            ),
+            period,
         )
 
-        grouped_copilot_code_metrics = df_copilot_code_metrics.groupby( # type: ignore
-            pd.Grouper(key="date", freq=period)
+    def cache_key(
+        self,
+        user_id: str,
+        version: int,
+        period: Period,
+        productivity_metric: Productivity_metric,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> Hashable:
+        return (
+            user_id,
+            version,
+            period,
+            productivity_metric,
+            initial_date,
+            final_date,
+            tuple(sorted(languages or [])),
         )
 
-        total_added_lines: int = 0
-
-        for period_final_date, commit_metrics_df in grouped_commit_metrics: # type: ignore
-            net_changed_lines = 0
-            for commit_metrics in commit_metrics_df["metrics"]: # type: ignore
-                net_changed_lines += MetricsCalculator.calculate_gross_productivity(
-                    [commit_metrics]
-                )
-                total_added_lines += commit_metrics.added_lines # type: ignore
-
-            response.data.append(
-                CommitMetricsData(
-                    initial_date=period_final_date.to_period(period).start_time.to_pydatetime(), # type: ignore
-                    final_date=period_final_date.to_pydatetime(), # type: ignore
-                    total_commits=len(commit_metrics_df["metrics"]),
-                    number_of_authors=len(authors),
-                    net_changed_lines=net_changed_lines,
-                    net_changed_lines_by_copilot=0,
-                    percentage_changed_lines_by_copilot=0,
-                )
-            )
-
-        for (
-            copilot_period_final_date,  # type: ignore
-            copilot_code_metrics_df,
-        ) in grouped_copilot_code_metrics:
-            index = next(
-                (i for i, data in enumerate(response.data)
-                if data.final_date == copilot_period_final_date),
-                None
-            )
-            if index is None:
-                continue
-            total_added_lines_by_copilot = MetricsCalculator.calculate_gross_use_of_AI_lines(
-                copilot_code_metrics_df["metrics"].to_list()  # type: ignore
-            )
-            percentage_changed_lines_by_copilot = (  # type: ignore
-                total_added_lines_by_copilot / total_added_lines if total_added_lines > 0 else 0
-            )
-            response.data[index].percentage_changed_lines_by_copilot = percentage_changed_lines_by_copilot # type: ignore
-            response.data[index].net_changed_lines_by_copilot = round(percentage_changed_lines_by_copilot * response.data[index].net_changed_lines) # type: ignore
-
-        return response
+    def empty_metrics(self, user_id: str, period: Period) -> CalculatedMetrics:
+        return CalculatedMetrics(
+            user_id=user_id,
+            languages=[],
+            period=period,
+            data=[],
+        )
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.dtos.calculated_metrics import CommitMetricsBreakdown
+from src.infrastructure.database.raw_commit_metrics.postgre.raw_commit_metrics_repository import RawCommitMetricsRepository
+
+
+class GetCommitMetricsBreakdownUseCase:
+    def __init__(
+        self,
+        commit_metrics_repository: RawCommitMetricsRepository,
+    ) -> None:
+        self.commit_metrics_repository = commit_metrics_repository
+
+    def execute(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CommitMetricsBreakdown]:
+        """Commit metrics summed by repository, team, language and/or author in the database"""
+        allowed = set(RawCommitMetricsRepository.BREAKDOWN_COLUMNS)
+        if not group_by or not set(group_by).issubset(allowed):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid group_by columns: {group_by}. Allowed: {sorted(allowed)}",
+            )
+
+        return self.commit_metrics_repository.list_breakdown_by_user_id(
+            user_id, list(dict.fromkeys(group_by)), initial_date, final_date, languages
+        )
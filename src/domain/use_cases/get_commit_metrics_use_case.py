@@ -18,7 +18,6 @@ class GetCommitMetricsUseCase:
     def execute(self, date: date, team_name: str, user_id: str) -> List[CommitMetrics]:
         commits_metrics = self.git_repo_consumer.get_commits_by_date(date, team_name, user_id)
 
-        for commit_metrics in commits_metrics:
-            self.commit_metrics_repository.create(commit_metrics)
+        self.commit_metrics_repository.create_many(commits_metrics)
 
         return commits_metrics
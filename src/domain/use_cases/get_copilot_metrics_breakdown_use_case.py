@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsBreakdown
+from src.infrastructure.database.raw_copilot_code_metrics.postgre.raw_copilot_code_metrics_repository import RawCopilotCodeMetricsRepository
+
+
+class GetCopilotMetricsBreakdownUseCase:
+    def __init__(
+        self,
+        copilot_code_metrics_repository: RawCopilotCodeMetricsRepository,
+    ) -> None:
+        self.copilot_code_metrics_repository = copilot_code_metrics_repository
+
+    def execute(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotMetricsBreakdown]:
+        """Copilot code metrics summed by team, language, IDE and/or copilot_model in the database"""
+        allowed = set(RawCopilotCodeMetricsRepository.BREAKDOWN_COLUMNS)
+        if not group_by or not set(group_by).issubset(allowed):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid group_by columns: {group_by}. Allowed: {sorted(allowed)}",
+            )
+
+        return self.copilot_code_metrics_repository.list_breakdown_by_user_id(
+            user_id, list(dict.fromkeys(group_by)), initial_date, final_date, languages
+        )
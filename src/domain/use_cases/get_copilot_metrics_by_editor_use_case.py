@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsByEditor
+from src.domain.use_cases.dtos.period_aggregates import CopilotChatMetricsEditorAggregate, CopilotCodeMetricsEditorAggregate
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+
+
+class GetCopilotMetricsByEditorUseCase:
+    """
+    Copilot acceptance rates and code/chat volumes by IDE and/or copilot_model,
+    read from the code and chat daily rollups. Chat metrics carry no language,
+    so a language filter only applies to the code side.
+    """
+
+    def __init__(
+        self,
+        copilot_code_metrics_daily_repository: CopilotCodeMetricsDailyRepository,
+        copilot_chat_metrics_daily_repository: CopilotChatMetricsDailyRepository,
+    ) -> None:
+        self.copilot_code_metrics_daily_repository = copilot_code_metrics_daily_repository
+        self.copilot_chat_metrics_daily_repository = copilot_chat_metrics_daily_repository
+
+    def execute(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotMetricsByEditor]:
+        allowed = set(CopilotCodeMetricsDailyRepository.EDITOR_COLUMNS)
+        if not group_by or not set(group_by).issubset(allowed):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid group_by columns: {group_by}. Allowed: {sorted(allowed)}",
+            )
+
+        group_by = list(dict.fromkeys(group_by))
+        code_aggregates = self.copilot_code_metrics_daily_repository.list_editor_aggregates_by_user_id(
+            user_id, group_by, initial_date, final_date, languages
+        )
+        chat_aggregates = self.copilot_chat_metrics_daily_repository.list_editor_aggregates_by_user_id(
+            user_id, group_by, initial_date, final_date
+        )
+
+        return GetCopilotMetricsByEditorUseCase.metrics_from_aggregates(code_aggregates, chat_aggregates)
+
+    @staticmethod
+    def metrics_from_aggregates(
+        code_aggregates: List[CopilotCodeMetricsEditorAggregate],
+        chat_aggregates: List[CopilotChatMetricsEditorAggregate],
+    ) -> List[CopilotMetricsByEditor]:
+        """One row per IDE/model found on either side, 0 where the other side has none"""
+        by_key: Dict[Tuple[Optional[str], Optional[str]], CopilotMetricsByEditor] = {}
+
+        for code in code_aggregates:
+            by_key[(code.IDE, code.copilot_model)] = CopilotMetricsByEditor(
+                IDE=code.IDE,
+                copilot_model=code.copilot_model,
+                code_acceptances=code.code_acceptances,
+                code_suggestions=code.code_suggestions,
+                lines_accepted=code.lines_accepted,
+                lines_suggested=code.lines_suggested,
+                percentage_code_acceptances=(
+                    code.code_acceptances / code.code_suggestions * 100
+                    if code.code_suggestions > 0 else 0.0
+                ),
+                percentage_lines_accepted=(
+                    code.lines_accepted / code.lines_suggested * 100
+                    if code.lines_suggested > 0 else 0.0
+                ),
+                total_chats=0,
+                chat_insertion_events=0,
+                chat_copy_events=0,
+            )
+
+        for chat in chat_aggregates:
+            key = (chat.IDE, chat.copilot_model)
+            metrics = by_key.get(key)
+            if metrics is None:
+                metrics = by_key[key] = CopilotMetricsByEditor(
+                    IDE=chat.IDE,
+                    copilot_model=chat.copilot_model,
+                    code_acceptances=0,
+                    code_suggestions=0,
+                    lines_accepted=0,
+                    lines_suggested=0,
+                    percentage_code_acceptances=0.0,
+                    percentage_lines_accepted=0.0,
+                    total_chats=0,
+                    chat_insertion_events=0,
+                    chat_copy_events=0,
+                )
+
+            metrics.total_chats = chat.total_chats
+            metrics.chat_insertion_events = chat.insertion_events
+            metrics.chat_copy_events = chat.copy_events
+
+        return sorted(
+            by_key.values(),
+            key=lambda m: (m.IDE is None, m.IDE or "", m.copilot_model is None, m.copilot_model or ""),
+        )
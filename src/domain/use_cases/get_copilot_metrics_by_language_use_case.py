@@ -1,42 +1,42 @@
 from datetime import datetime
-from typing import DefaultDict, Dict, List, Optional
+from typing import List, Optional
 from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsByLanguage
-from src.infrastructure.database.raw_copilot_code_metrics.postgre.raw_copilot_code_metrics_repository import RawCopilotCodeMetricsRepository
+from src.domain.use_cases.dtos.period_aggregates import CopilotCodeMetricsLanguageAggregate
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
 
 
 class GetCopilotMetricsByLanguageUseCase:
   def __init__(
         self,
-        copilot_code_metrics_repository: RawCopilotCodeMetricsRepository,
+        copilot_code_metrics_daily_repository: CopilotCodeMetricsDailyRepository,
     ) -> None:
-        self.copilot_code_metrics_repository = copilot_code_metrics_repository
+        self.copilot_code_metrics_daily_repository = copilot_code_metrics_daily_repository
 
-  def execute(self, user_id: str, initial_date: Optional[datetime] = None, final_date: Optional[datetime] = None) -> List[CopilotMetricsByLanguage]:
-    raw_copilot_code_metrics = self.copilot_code_metrics_repository.listByUserId(user_id, initial_date, final_date)
-
-    if (not raw_copilot_code_metrics):
+  def execute(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        ides: Optional[List[str]] = None,
+        copilot_models: Optional[List[str]] = None,
+    ) -> List[CopilotMetricsByLanguage]:
+    language_aggregates = self.copilot_code_metrics_daily_repository.list_language_aggregates_by_user_id(
+        user_id, initial_date, final_date, ides, copilot_models
+    )
+
+    return GetCopilotMetricsByLanguageUseCase.metrics_from_aggregates(language_aggregates)
+
+  @staticmethod
+  def metrics_from_aggregates(language_aggregates: List[CopilotCodeMetricsLanguageAggregate]) -> List[CopilotMetricsByLanguage]:
+    if (not language_aggregates):
       return []
-    
-    grouped_metrics: DefaultDict[str, Dict[str, int]] = DefaultDict(lambda: {
-      "code_acceptances": 0,
-      "code_suggestions": 0,
-      "lines_accepted": 0,
-      "lines_suggested": 0,
-    })
-
-    for metric in raw_copilot_code_metrics:
-      language = metric.language
-      grouped_metrics[language]["code_acceptances"] += metric.code_acceptances
-      grouped_metrics[language]["code_suggestions"] += metric.code_suggestions
-      grouped_metrics[language]["lines_accepted"] += metric.lines_accepted
-      grouped_metrics[language]["lines_suggested"] += metric.lines_suggested
 
     response: List[CopilotMetricsByLanguage] = []
-    for lang, values in grouped_metrics.items():
-        code_suggestions = values["code_suggestions"]
-        lines_suggested = values["lines_suggested"]
-        code_acceptances = values["code_acceptances"]
-        lines_accepted = values["lines_accepted"]
+    for values in language_aggregates:
+        code_suggestions = values.code_suggestions
+        lines_suggested = values.lines_suggested
+        code_acceptances = values.code_acceptances
+        lines_accepted = values.lines_accepted
 
         percentage_code_acceptances = (
             code_acceptances / code_suggestions * 100
@@ -49,7 +49,7 @@ class GetCopilotMetricsByLanguageUseCase:
         )
 
         response.append(CopilotMetricsByLanguage(
-            language=lang,
+            language=values.language,
             code_acceptances=code_acceptances,
             code_suggestions=code_suggestions,
             lines_accepted=lines_accepted,
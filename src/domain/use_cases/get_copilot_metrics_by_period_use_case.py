@@ -2,64 +2,84 @@ from datetime import datetime
 import pandas as pd  # type: ignore
 from typing import List, Optional
 from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.calculated_metrics_engine import CalculatedMetricsEngine
 from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsByPeriod
-from src.domain.use_cases.metrics_calculator import MetricsCalculator
-from src.infrastructure.database.raw_copilot_code_metrics.postgre.raw_copilot_code_metrics_repository import RawCopilotCodeMetricsRepository
+from src.domain.use_cases.dtos.period_aggregates import CopilotCodeMetricsPeriodAggregate, CopilotCodeMetricsPeriodTotals
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
 
 
 class GetCopilotMetricsByPeriodUseCase:
   def __init__(
         self,
-        copilot_code_metrics_repository: RawCopilotCodeMetricsRepository,
+        copilot_code_metrics_daily_repository: CopilotCodeMetricsDailyRepository,
     ) -> None:
-        self.copilot_code_metrics_repository = copilot_code_metrics_repository
+        self.copilot_code_metrics_daily_repository = copilot_code_metrics_daily_repository
 
   def execute(self, user_id: str, period: Period, initial_date: Optional[datetime] = None, final_date: Optional[datetime] = None) -> List[CopilotMetricsByPeriod]:
-      raw_copilot_code_metrics = self.copilot_code_metrics_repository.listByUserId(user_id, initial_date, final_date)
+      period_totals = self.copilot_code_metrics_daily_repository.list_period_totals_by_user_id(user_id, period, initial_date, final_date)
 
-      if (not raw_copilot_code_metrics):
+      return GetCopilotMetricsByPeriodUseCase.metrics_from_totals(period_totals, period)
+
+  @staticmethod
+  def metrics_from_aggregates(period_aggregates: List[CopilotCodeMetricsPeriodAggregate], period: Period) -> List[CopilotMetricsByPeriod]:
+      """Same response from rows that still need bucketing, such as daily aggregates"""
+      if (not period_aggregates):
         return []
-      
-      df_copilot_code_metrics = pd.DataFrame(
-            [{"metrics": c, "date": c.date} for c in raw_copilot_code_metrics],
-            columns=["metrics", "date"]
-        )
-      
-      grouped_copilot_code_metrics = df_copilot_code_metrics.groupby(  # type: ignore
-            pd.Grouper(key="date", freq=period)
+
+      buckets = CalculatedMetricsEngine.rebucket(
+            pd.DataFrame([a.model_dump() for a in period_aggregates]),
+            period,
         )
-      
-      response: List[CopilotMetricsByPeriod] = []
 
-      for (
-            copilot_period_final_date,  # type: ignore
-            copilot_code_metrics_df,
-        ) in grouped_copilot_code_metrics:
-            total_code_acceptances = MetricsCalculator.calculate_gross_use_of_AI(
-                copilot_code_metrics_df["metrics"].to_list()  # type: ignore
-            )
+      period_totals: List[CopilotCodeMetricsPeriodTotals] = []
+      for copilot_period_final_date, values in zip(buckets.index, buckets.to_dict("records")):  # type: ignore
+            code_acceptances = int(values["code_acceptances"])
+            code_suggestions = int(values["code_suggestions"])
+            lines_accepted = int(values["lines_accepted"])
+            lines_suggested = int(values["lines_suggested"])
+
+            period_totals.append(CopilotCodeMetricsPeriodTotals(
+                period_start=copilot_period_final_date.to_period(period).start_time.to_pydatetime(),  # type: ignore
+                code_acceptances=code_acceptances,
+                code_suggestions=code_suggestions,
+                lines_accepted=lines_accepted,
+                lines_suggested=lines_suggested,
+                percentage_code_acceptances=code_acceptances / code_suggestions if code_suggestions > 0 else 0.0,
+                percentage_lines_accepted=lines_accepted / lines_suggested if lines_suggested > 0 else 0.0,
+            ))
+
+      return GetCopilotMetricsByPeriodUseCase.metrics_from_totals(period_totals, period)
+
+  @staticmethod
+  def metrics_from_totals(period_totals: List[CopilotCodeMetricsPeriodTotals], period: Period) -> List[CopilotMetricsByPeriod]:
+      if (not period_totals):
+        return []
+
+      totals_by_start = {totals.period_start: totals for totals in period_totals}
+      empty = CopilotCodeMetricsPeriodTotals(
+            period_start=period_totals[0].period_start,
+            code_acceptances=0,
+            code_suggestions=0,
+            lines_accepted=0,
+            lines_suggested=0,
+            percentage_code_acceptances=0.0,
+            percentage_lines_accepted=0.0,
+        )
 
-            percentage_code_acceptances = MetricsCalculator.calculate_relative_use_of_AI(
-                copilot_code_metrics_df["metrics"].to_list()  # type: ignore
-            )
+      response: List[CopilotMetricsByPeriod] = []
 
-            total_lines_accepted = MetricsCalculator.calculate_gross_use_of_AI_lines(
-                copilot_code_metrics_df["metrics"].to_list()  # type: ignore
-            )
+      # Same bins as grouping the raw rows, including the empty periods in between
+      for copilot_period_final_date in CalculatedMetricsEngine.bucket_labels(list(totals_by_start), period):
+            period_initial_date = copilot_period_final_date.to_period(period).start_time.to_pydatetime()
+            totals = totals_by_start.get(period_initial_date, empty)
 
-            percentage_lines_accepted = MetricsCalculator.calculate_relative_use_of_AI_lines(
-                copilot_code_metrics_df["metrics"].to_list()  # type: ignore
-            )
-            
             response.append(CopilotMetricsByPeriod(
-                period_final_date=copilot_period_final_date.to_pydatetime(),  # type: ignore
-                period_initial_date=copilot_period_final_date.to_period(  # type: ignore
-                    period
-                ).start_time.to_pydatetime(),
-                total_code_acceptances=total_code_acceptances,
-                percentage_code_acceptances=percentage_code_acceptances,
-                total_lines_accepted=total_lines_accepted,
-                percentage_lines_accepted=percentage_lines_accepted
+                period_final_date=copilot_period_final_date.to_pydatetime(),
+                period_initial_date=period_initial_date,
+                total_code_acceptances=totals.code_acceptances,
+                percentage_code_acceptances=totals.percentage_code_acceptances,
+                total_lines_accepted=totals.lines_accepted,
+                percentage_lines_accepted=totals.percentage_lines_accepted,
             ))
 
       return response
@@ -1,8 +1,7 @@
 from io import BytesIO
-from typing import List
 
 from src.consumers.git_metrics_xlsx.git_metrics_xlsx_consumer import GitCommitMetricsXlsxConsumer
-from src.domain.entities.commit_metrics import CommitMetrics
+from src.domain.use_cases.dtos.bulk_insert_result import BulkInsertResult
 from src.infrastructure.database.raw_commit_metrics.postgre.raw_commit_metrics_repository import RawCommitMetricsRepository
 
 
@@ -15,9 +14,7 @@ class GetXlsxCommitMetricsUseCase:
         self.commit_metrics_repository = commit_metrics_repository
         self.git_commit_metrics_xlsx_consumer = git_commit_metrics_xlsx_consumer
 
-    def execute(self, file_content: BytesIO, user_id: str) -> List[CommitMetrics]:
+    def execute(self, file_content: BytesIO, user_id: str) -> BulkInsertResult:
         commits_metrics = self.git_commit_metrics_xlsx_consumer.execute(file_content, user_id)
 
-        self.commit_metrics_repository.create_many(commits_metrics)
-
-        return commits_metrics
+        return self.commit_metrics_repository.create_many(commits_metrics)
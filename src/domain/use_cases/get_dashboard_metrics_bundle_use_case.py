@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.entities.value_objects.enums.productivity_metric import Productivity_metric
+from src.domain.use_cases.dtos.calculated_metrics import DashboardMetricsBundle
+from src.domain.use_cases.get_report_metrics_snapshot_use_case import GetReportMetricsSnapshotUseCase
+
+
+class GetDashboardMetricsBundleUseCase:
+    """
+    Every series of the dashboard page for one window in one request, all built
+    from a single ReportMetricsSnapshot so each table is read once. The productivity
+    chart runs the same in-memory bucketing as /calculated_metrics/combined.
+    """
+
+    def __init__(
+        self,
+        get_report_metrics_snapshot_use_case: GetReportMetricsSnapshotUseCase,
+    ) -> None:
+        self.get_report_metrics_snapshot_use_case = get_report_metrics_snapshot_use_case
+
+    def execute(
+        self,
+        user_id: str,
+        period: Period,
+        productivity_metric: Productivity_metric,
+        initial_date: datetime,
+        final_date: datetime,
+        languages: Optional[List[str]] = None,
+    ) -> DashboardMetricsBundle:
+        snapshot = self.get_report_metrics_snapshot_use_case.execute(
+            user_id,
+            initial_date,
+            initial_date,
+            initial_date,
+            final_date,
+            languages,
+            with_commit_counts=productivity_metric == Productivity_metric.commits,
+        )
+
+        productivity_metric_map = {
+            Productivity_metric.code_lines: snapshot.code_lines_metrics,
+            Productivity_metric.commits: snapshot.commit_metrics,
+        }
+
+        return DashboardMetricsBundle(
+            calculated_metrics=productivity_metric_map[productivity_metric](period, initial_date, final_date),
+            copilot_metrics_by_language=snapshot.copilot_metrics_by_language(initial_date, final_date),
+            copilot_metrics_by_period=snapshot.copilot_metrics_by_period(period, initial_date, final_date),
+            copilot_users_metrics=snapshot.copilot_users_metrics(initial_date, final_date),
+        )
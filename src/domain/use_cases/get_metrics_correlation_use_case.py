@@ -0,0 +1,188 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.calculated_metrics_engine import CalculatedMetricsEngine
+from src.domain.use_cases.dtos.calculated_metrics import CommitMetricsData, MetricsCorrelation, MetricsCorrelations
+from src.domain.use_cases.dtos.period_aggregates import CommitMetricsPeriodAggregate, CopilotCodeMetricsPeriodAggregate
+from src.infrastructure.cache.metrics_cache import LRUCache
+from src.infrastructure.database.raw_commit_metrics.postgre.raw_commit_metrics_repository import RawCommitMetricsRepository
+from src.infrastructure.database.raw_copilot_code_metrics.postgre.raw_copilot_code_metrics_repository import RawCopilotCodeMetricsRepository
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class GetMetricsCorrelationUseCase:
+    """
+    Pearson correlation between the changed lines attributed to Copilot and commit
+    productivity, for every team or language at once. Same series and pairs as the
+    dashboard display (pearsonCorrelationCalculator.ts) over the commit metrics of
+    that slice: net_changed_lines_by_copilot is the bucket's accepted lines over the
+    slice's added lines times its net changed lines, the buckets span the slice's
+    commit periods only, code_lines pairs it with net changed lines and commits
+    with the number of commits. The overall row is the unsliced series, so a commit
+    touching several languages counts once.
+    """
+
+    SLICE_COLUMNS = ["team", "language"]
+
+    def __init__(
+        self,
+        commit_metrics_repository: RawCommitMetricsRepository,
+        copilot_code_metrics_repository: RawCopilotCodeMetricsRepository,
+        cache: Optional[LRUCache[MetricsCorrelations]] = None,
+        user_data_versions: Optional[UserDataVersionsRepository] = None,
+    ) -> None:
+        self.commit_metrics_repository = commit_metrics_repository
+        self.copilot_code_metrics_repository = copilot_code_metrics_repository
+        self.cache = cache
+        self.user_data_versions = user_data_versions
+
+    def execute(
+        self,
+        user_id: str,
+        period: Period,
+        slice_by: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> MetricsCorrelations:
+        if slice_by not in self.SLICE_COLUMNS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid slice_by column: {slice_by}. Allowed: {self.SLICE_COLUMNS}",
+            )
+
+        if self.cache is None or self.user_data_versions is None:
+            return self.calculate(user_id, period, slice_by, initial_date, final_date)
+
+        cache_key = (
+            user_id,
+            self.user_data_versions.get(user_id),
+            period,
+            slice_by,
+            initial_date,
+            final_date,
+        )
+
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            cached = self.calculate(user_id, period, slice_by, initial_date, final_date)
+            self.cache.put(cache_key, cached)
+
+        return cached.model_copy(deep=True)
+
+    def calculate(
+        self,
+        user_id: str,
+        period: Period,
+        slice_by: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> MetricsCorrelations:
+        commit_aggregates: Dict[Optional[str], List[CommitMetricsPeriodAggregate]] = defaultdict(list)
+        for commit_aggregate in self.commit_metrics_repository.list_period_aggregates_by_slice(
+            user_id, period, slice_by, initial_date, final_date
+        ):
+            commit_aggregates[commit_aggregate.slice_value].append(
+                CommitMetricsPeriodAggregate(
+                    period_start=commit_aggregate.period_start,
+                    added_lines=commit_aggregate.added_lines,
+                    removed_lines=commit_aggregate.removed_lines,
+                    number_of_authors=0,
+                    number_of_commits=commit_aggregate.number_of_commits,
+                )
+            )
+
+        copilot_aggregates: Dict[Optional[str], List[CopilotCodeMetricsPeriodAggregate]] = defaultdict(list)
+        for copilot_aggregate in self.copilot_code_metrics_repository.list_period_aggregates_by_slice(
+            user_id, period, slice_by, initial_date, final_date
+        ):
+            copilot_aggregates[copilot_aggregate.slice_value].append(
+                CopilotCodeMetricsPeriodAggregate(
+                    period_start=copilot_aggregate.period_start,
+                    code_acceptances=0,
+                    code_suggestions=0,
+                    lines_accepted=copilot_aggregate.lines_accepted,
+                    lines_suggested=0,
+                )
+            )
+
+        slices = sorted(
+            set(commit_aggregates) | set(copilot_aggregates),
+            key=lambda value: (value is None, value or ""),
+        )
+        if not slices:
+            return MetricsCorrelations(
+                user_id=user_id,
+                period=period,
+                slice_by=slice_by,
+                number_of_periods=0,
+                overall=MetricsCorrelation(code_lines=0, commits=0),
+                slices=[],
+            )
+
+        overall, number_of_periods = self.correlate(
+            self.commit_metrics_repository.list_period_aggregates_by_user_id(
+                user_id, period, initial_date, final_date
+            ),
+            self.copilot_code_metrics_repository.list_period_aggregates_by_user_id(
+                user_id, period, initial_date, final_date
+            ),
+            period,
+        )
+
+        return MetricsCorrelations(
+            user_id=user_id,
+            period=period,
+            slice_by=slice_by,
+            number_of_periods=number_of_periods,
+            overall=overall,
+            slices=[
+                self.correlate(commit_aggregates[value], copilot_aggregates[value], period)[0].model_copy(
+                    update={"value": value}
+                )
+                for value in slices
+            ],
+        )
+
+    def correlate(
+        self,
+        commit_aggregates: List[CommitMetricsPeriodAggregate],
+        copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate],
+        period: Period,
+    ) -> Tuple[MetricsCorrelation, int]:
+        """Both correlations over the commit metrics series, and its number of buckets"""
+        if not commit_aggregates:
+            return MetricsCorrelation(code_lines=0, commits=0), 0
+
+        data = CalculatedMetricsEngine.commit_metrics_from_aggregates(
+            "", [], 0, commit_aggregates, copilot_aggregates, period
+        ).data
+        net_changed_lines_by_copilot = np.array([d.net_changed_lines_by_copilot for d in data], dtype=np.int64)
+        correlations = self.pearson_by_row(
+            np.stack([net_changed_lines_by_copilot, net_changed_lines_by_copilot]),
+            np.array(
+                [
+                    [d.net_changed_lines for d in data],
+                    [d.total_commits for d in data if isinstance(d, CommitMetricsData)],
+                ],
+                dtype=np.int64,
+            ),
+        ).tolist()
+
+        return MetricsCorrelation(code_lines=correlations[0], commits=correlations[1]), len(data)
+
+    @staticmethod
+    def pearson_by_row(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Pearson correlation of x and y along the last axis, 0 where either row is constant"""
+        x_centered = x - x.mean(axis=-1, keepdims=True)
+        y_centered = y - y.mean(axis=-1, keepdims=True)
+        numerator = (x_centered * y_centered).sum(axis=-1)
+        denominator = np.sqrt((x_centered ** 2).sum(axis=-1) * (y_centered ** 2).sum(axis=-1))
+
+        correlations = np.zeros(numerator.shape, dtype=np.float64)
+        np.divide(numerator, denominator, out=correlations, where=denominator > 0)
+        return correlations
@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.report_metrics_snapshot import ReportMetricsSnapshot
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+from src.infrastructure.database.raw_commit_metrics.postgre.raw_commit_metrics_repository import RawCommitMetricsRepository
+
+
+class GetReportMetricsSnapshotUseCase:
+    def __init__(
+        self,
+        commit_metrics_repository: RawCommitMetricsRepository,
+        commit_metrics_daily_repository: CommitMetricsDailyRepository,
+        copilot_code_metrics_daily_repository: CopilotCodeMetricsDailyRepository,
+        copilot_chat_metrics_daily_repository: CopilotChatMetricsDailyRepository,
+    ) -> None:
+        self.commit_metrics_repository = commit_metrics_repository
+        self.commit_metrics_daily_repository = commit_metrics_daily_repository
+        self.copilot_code_metrics_daily_repository = copilot_code_metrics_daily_repository
+        self.copilot_chat_metrics_daily_repository = copilot_chat_metrics_daily_repository
+
+    def execute(
+        self,
+        user_id: str,
+        commits_initial_date: Optional[datetime],
+        copilot_code_initial_date: datetime,
+        copilot_users_initial_date: datetime,
+        final_date: datetime,
+        languages: Optional[List[str]] = None,
+        with_commit_counts: bool = False,
+    ) -> ReportMetricsSnapshot:
+        """
+        Reads each table once, from the earliest date any chart of the report needs.
+        Without a commits_initial_date the commit rows are not read at all. The raw
+        commits are only read with_commit_counts, for the distinct commits per day.
+        languages restricts the commit rows; the Copilot rows are always read whole.
+        """
+        commit_aggregates = []
+        commit_day_aggregates = []
+        if commits_initial_date is not None:
+            commit_aggregates = self.commit_metrics_daily_repository.list_daily_aggregates_by_user_id(
+                user_id, commits_initial_date, final_date, languages
+            )
+            if with_commit_counts:
+                commit_day_aggregates = self.commit_metrics_repository.list_period_aggregates_by_user_id(
+                    user_id, Period.DAILY, commits_initial_date, final_date, languages
+                )
+
+        # The code users come from the same rows as the code charts
+        return ReportMetricsSnapshot(
+            user_id,
+            commit_aggregates,
+            commit_day_aggregates,
+            self.copilot_code_metrics_daily_repository.list_daily_aggregates_by_user_id(
+                user_id, min(copilot_code_initial_date, copilot_users_initial_date), final_date
+            ),
+            self.copilot_chat_metrics_daily_repository.list_daily_users_by_user_id(
+                user_id, copilot_users_initial_date, final_date
+            ),
+            languages,
+        )
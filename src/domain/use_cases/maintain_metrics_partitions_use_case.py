@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import List, Optional
+
+from src.infrastructure.database.metrics_partitions.postgre.metrics_partitions_repository import MetricsPartitionsRepository
+from src.infrastructure.logger.logger_config import logger
+
+
+class MaintainMetricsPartitionsUseCase:
+    def __init__(
+        self,
+        metrics_partitions_repository: MetricsPartitionsRepository,
+    ) -> None:
+        self.metrics_partitions_repository = metrics_partitions_repository
+
+    def execute(
+        self,
+        months_ahead: int = MetricsPartitionsRepository.MONTHS_AHEAD,
+        retention_months: Optional[int] = None,
+        today: Optional[datetime] = None,
+    ) -> List[str]:
+        """
+        Creates the monthly partitions of the raw metrics tables ahead of time and,
+        when a retention is given, drops the partitions older than that many months.
+        Returns the created partitions.
+        """
+        today = today or datetime.now()
+        created = self.metrics_partitions_repository.create_future_partitions(months_ahead, today)
+        if created:
+            logger.info(f"Created raw metrics partitions: {', '.join(created)}")
+
+        if retention_months is not None:
+            cutoff = MetricsPartitionsRepository.add_months(
+                MetricsPartitionsRepository.month_start(today), -retention_months
+            )
+            dropped = self.metrics_partitions_repository.drop_partitions_before(cutoff)
+            if dropped:
+                logger.info(f"Dropped raw metrics partitions before {cutoff.date()}: {', '.join(dropped)}")
+
+        return created
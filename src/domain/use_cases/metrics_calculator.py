@@ -82,12 +82,13 @@ class MetricsCalculator:
                 f"Invalid group_by columns: {group_by}. Allowed: {allowed}"
             )
 
+        # Repositories carry no id, so they are identified by name
         df_commits = pd.DataFrame([c.model_dump() for c in commits])
         df_repos = pd.DataFrame([r.model_dump() for r in repositories]).rename(
-            columns={"id": "repository_id", "team": "team"}
+            columns={"name": "repository_id", "team": "team"}
         )
 
-        df_commits["repository_id"] = df_commits["repository"].apply(lambda x: x.id)  # type: ignore
+        df_commits["repository_id"] = df_commits["repository"].apply(lambda x: x["name"])  # type: ignore
 
         df_commits = df_commits.merge(  # type: ignore
             df_repos[["repository_id", "team"]],  # type: ignore
@@ -116,7 +117,7 @@ class MetricsCalculator:
             )
 
         df: pd.DataFrame = pd.DataFrame([m.model_dump() for m in metrics])
-        df["team_id"] = df["team"].apply(lambda t: t["id"] if t else None)  # type: ignore
+        df["team_id"] = df["team"].apply(lambda t: t["name"] if t else None)  # type: ignore
 
         result: pd.DataFrame = (
             df.groupby(group_by)["lines_accepted"]  # type: ignore
@@ -137,7 +138,7 @@ class MetricsCalculator:
 
         df: pd.DataFrame = pd.DataFrame([m.model_dump() for m in metrics])
 
-        df["team_id"] = df["team"].apply(lambda t: t["id"] if t else None)  # type: ignore
+        df["team_id"] = df["team"].apply(lambda t: t["name"] if t else None)  # type: ignore
 
         grouped: pd.DataFrame = (
             df.groupby(group_by)  # type: ignore
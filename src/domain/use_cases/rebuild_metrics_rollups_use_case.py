@@ -0,0 +1,38 @@
+from typing import Optional
+from fastapi import HTTPException
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+from src.infrastructure.database.users.postgre.users_repository import UsersRepository
+
+
+class RebuildMetricsRollupsUseCase:
+    def __init__(
+        self,
+        users_repository: UsersRepository,
+        commit_metrics_daily_repository: CommitMetricsDailyRepository,
+        copilot_code_metrics_daily_repository: CopilotCodeMetricsDailyRepository,
+        copilot_chat_metrics_daily_repository: CopilotChatMetricsDailyRepository,
+    ) -> None:
+        self.users_repository = users_repository
+        self.commit_metrics_daily_repository = commit_metrics_daily_repository
+        self.copilot_code_metrics_daily_repository = copilot_code_metrics_daily_repository
+        self.copilot_chat_metrics_daily_repository = copilot_chat_metrics_daily_repository
+
+    def execute(
+        self,
+        username: Optional[str] = None,
+    ) -> None:
+        """Rebuilds the rollups from the raw tables, for one user or for everyone"""
+        user_id = None
+        if username:
+            user = self.users_repository.find_by_username(username)
+
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            user_id = user.id
+
+        self.commit_metrics_daily_repository.rebuild(user_id)
+        self.copilot_code_metrics_daily_repository.rebuild(user_id)
+        self.copilot_chat_metrics_daily_repository.rebuild(user_id)
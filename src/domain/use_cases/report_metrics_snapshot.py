@@ -0,0 +1,206 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pandas as pd  # type: ignore
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.calculated_metrics_engine import CalculatedMetricsEngine
+from src.domain.use_cases.dtos.calculated_metrics import (
+    CalculatedMetrics,
+    CopilotMetricsByLanguage,
+    CopilotMetricsByPeriod,
+    CopilotUsersMetrics,
+)
+from src.domain.use_cases.dtos.period_aggregates import (
+    CommitMetricsDailyAggregate,
+    CommitMetricsPeriodAggregate,
+    CopilotChatUsersDailyAggregate,
+    CopilotCodeMetricsDailyAggregate,
+    CopilotCodeMetricsLanguageAggregate,
+    CopilotCodeMetricsPeriodAggregate,
+)
+from src.domain.use_cases.get_copilot_metrics_by_language_use_case import GetCopilotMetricsByLanguageUseCase
+from src.domain.use_cases.get_copilot_metrics_by_period_use_case import GetCopilotMetricsByPeriodUseCase
+
+
+class ReportMetricsSnapshot:
+    """
+    Every row a metrics report needs, read once for its widest window.
+    Each chart series narrows the rows to its own window in memory and runs
+    the same calculation as the use case serving that series on the API.
+    The commit rows are read for the snapshot's languages only; the Copilot
+    rows are kept whole and narrowed to those languages for the productivity series.
+    """
+
+    COPILOT_CODE_COLUMNS = [
+        "date",
+        "language",
+        "total_users",
+        "code_acceptances",
+        "code_suggestions",
+        "lines_accepted",
+        "lines_suggested",
+    ]
+
+    def __init__(
+        self,
+        user_id: str,
+        commit_aggregates: List[CommitMetricsDailyAggregate],
+        commit_day_aggregates: List[CommitMetricsPeriodAggregate],
+        copilot_code_aggregates: List[CopilotCodeMetricsDailyAggregate],
+        copilot_chat_users: List[CopilotChatUsersDailyAggregate],
+        languages: Optional[List[str]] = None,
+    ) -> None:
+        self.user_id = user_id
+        self.languages = languages
+        self.commit_aggregates = commit_aggregates
+        self.commit_day_aggregates = commit_day_aggregates
+        self.copilot_code_frame = pd.DataFrame.from_records(
+            [
+                (
+                    a.day,
+                    a.language,
+                    a.total_users,
+                    a.code_acceptances,
+                    a.code_suggestions,
+                    a.lines_accepted,
+                    a.lines_suggested,
+                )
+                for a in copilot_code_aggregates
+            ],
+            columns=self.COPILOT_CODE_COLUMNS,
+        )
+        self.copilot_code_frame["date"] = pd.to_datetime(self.copilot_code_frame["date"])
+        self.copilot_chat_users = copilot_chat_users
+
+    def code_lines_metrics(
+        self, period: Period, initial_date: datetime, final_date: datetime
+    ) -> CalculatedMetrics:
+        commit_aggregates = self._commit_window(initial_date, final_date)
+        if not commit_aggregates:
+            return self._empty_metrics(period)
+
+        return CalculatedMetricsEngine.code_lines_metrics_from_days(
+            self.user_id,
+            commit_aggregates,
+            self._copilot_code_by_day(self._productivity_copilot_code_window(initial_date, final_date)),
+            period,
+        )
+
+    def commit_metrics(
+        self, period: Period, initial_date: datetime, final_date: datetime
+    ) -> CalculatedMetrics:
+        """Needs the commit day aggregates, read only when the snapshot is taken with commit counts"""
+        commit_aggregates = self._commit_window(initial_date, final_date)
+        commit_day_aggregates = [
+            a for a in self.commit_day_aggregates
+            if self._in_window(a.period_start, initial_date, final_date)
+        ]
+        if not commit_aggregates or not commit_day_aggregates:
+            return self._empty_metrics(period)
+
+        return CalculatedMetricsEngine.commit_metrics_from_days(
+            self.user_id,
+            commit_aggregates,
+            commit_day_aggregates,
+            self._copilot_code_by_day(self._productivity_copilot_code_window(initial_date, final_date)),
+            period,
+        )
+
+    def copilot_metrics_by_language(
+        self, initial_date: datetime, final_date: datetime
+    ) -> List[CopilotMetricsByLanguage]:
+        by_language = self._copilot_code_window(initial_date, final_date).groupby(  # type: ignore
+            "language", sort=True
+        )[["code_acceptances", "code_suggestions", "lines_accepted", "lines_suggested"]].sum()
+
+        return GetCopilotMetricsByLanguageUseCase.metrics_from_aggregates(
+            [
+                CopilotCodeMetricsLanguageAggregate(language=language, **values)
+                for language, values in zip(by_language.index, by_language.to_dict("records"))  # type: ignore
+            ]
+        )
+
+    def copilot_metrics_by_period(
+        self, period: Period, initial_date: datetime, final_date: datetime
+    ) -> List[CopilotMetricsByPeriod]:
+        # Daily rows bucket into the same pandas bins as the database period buckets
+        return GetCopilotMetricsByPeriodUseCase.metrics_from_aggregates(
+            self._copilot_code_by_day(self._copilot_code_window(initial_date, final_date)),
+            period,
+        )
+
+    def copilot_users_metrics(
+        self, initial_date: datetime, final_date: datetime
+    ) -> List[CopilotUsersMetrics]:
+        """
+        Code assistant and chat users per day, joined on the day like
+        CopilotCodeMetricsDailyRepository.list_code_and_chat_users_by_user_id:
+        0 where one side has no row, empty without any code metrics.
+        """
+        code_users = self._copilot_code_window(initial_date, final_date).groupby(  # type: ignore
+            "date", sort=True
+        )["total_users"].sum()
+        if code_users.empty:
+            return []
+
+        chat_users = pd.Series(
+            {
+                pd.Timestamp(users.day): users.total_users
+                for users in self.copilot_chat_users
+                if self._in_window(users.day, initial_date, final_date)
+            },
+            dtype="int64",
+        )
+        users = pd.concat([code_users, chat_users], axis=1, keys=["code", "chat"]).fillna(0).sort_index()  # type: ignore
+
+        return [
+            CopilotUsersMetrics(
+                date=day.to_pydatetime(),
+                total_code_assistant_users=int(code),
+                total_chat_users=int(chat),
+            )
+            for day, code, chat in zip(users.index, users["code"], users["chat"])  # type: ignore
+        ]
+
+    def _empty_metrics(self, period: Period) -> CalculatedMetrics:
+        return CalculatedMetrics(
+            user_id=self.user_id,
+            languages=[],
+            period=period,
+            data=[],
+        )
+
+    def _commit_window(self, initial_date: datetime, final_date: datetime) -> List[CommitMetricsDailyAggregate]:
+        return [a for a in self.commit_aggregates if self._in_window(a.day, initial_date, final_date)]
+
+    def _copilot_code_by_day(self, copilot_code_frame: pd.DataFrame) -> List[CopilotCodeMetricsPeriodAggregate]:
+        by_day = copilot_code_frame.groupby(  # type: ignore
+            "date", sort=True
+        )[["code_acceptances", "code_suggestions", "lines_accepted", "lines_suggested"]].sum()
+
+        return [
+            CopilotCodeMetricsPeriodAggregate(period_start=day.to_pydatetime(), **values)
+            for day, values in zip(by_day.index, by_day.to_dict("records"))  # type: ignore
+        ]
+
+    def _productivity_copilot_code_window(self, initial_date: datetime, final_date: datetime) -> pd.DataFrame:
+        copilot_code_frame = self._copilot_code_window(initial_date, final_date)
+        if not self.languages:
+            return copilot_code_frame
+
+        return copilot_code_frame[copilot_code_frame["language"].isin(self.languages)]
+
+    def _copilot_code_window(self, initial_date: datetime, final_date: datetime) -> pd.DataFrame:
+        return self._window(self.copilot_code_frame, initial_date, final_date)
+
+    def _window(self, frame: pd.DataFrame, initial_date: datetime, final_date: datetime) -> pd.DataFrame:
+        # Whole days on both ends, like the repositories: the frames hold one row per day
+        dates = frame["date"]
+        return frame[(dates >= self._day_start(initial_date)) & (dates <= self._day_start(final_date))]
+
+    def _in_window(self, date: datetime, initial_date: datetime, final_date: datetime) -> bool:
+        return self._day_start(initial_date) <= date < self._day_start(final_date) + timedelta(days=1)
+
+    def _day_start(self, date: datetime) -> datetime:
+        return datetime(date.year, date.month, date.day)
@@ -13,11 +13,7 @@ from dateutil.relativedelta import relativedelta
 from src.domain.entities.github_app import GitHubApp
 from src.domain.entities.report_config import ReportConfig
 from src.domain.entities.value_objects.enums.period import Period
-from src.domain.entities.value_objects.enums.productivity_metric import Productivity_metric
-from src.domain.use_cases.get_calculated_metrics_use_case import GetCalculatedMetricsUseCase
-from src.domain.use_cases.get_copilot_metrics_by_language_use_case import GetCopilotMetricsByLanguageUseCase
-from src.domain.use_cases.get_copilot_metrics_by_period_use_case import GetCopilotMetricsByPeriodUseCase
-from src.domain.use_cases.get_copilot_users_metrics_use_case import GetCopilotUsersMetricsUseCase
+from src.domain.use_cases.get_report_metrics_snapshot_use_case import GetReportMetricsSnapshotUseCase
 from src.infrastructure.database.github_apps.postgre.github_apps_repository import GitHubAppsRepository
 from src.infrastructure.database.report_config.postgre.report_config_repository import ReportConfigRepository
 from src.infrastructure.logger.logger_config import logger
@@ -28,10 +24,7 @@ class SendMetricsEmailUseCase:
         self,
         report_config_repository: ReportConfigRepository,
         github_apps_repository: GitHubAppsRepository,
-        get_calculated_metrics_use_case: GetCalculatedMetricsUseCase,
-        get_copilot_metrics_by_language_use_case: GetCopilotMetricsByLanguageUseCase,
-        get_copilot_metrics_by_period_use_case: GetCopilotMetricsByPeriodUseCase,
-        get_copilot_users_metrics_use_case: GetCopilotUsersMetricsUseCase,
+        get_report_metrics_snapshot_use_case: GetReportMetricsSnapshotUseCase,
         mail_name: str,
         mail_password: str,
         encryption_key: str,
@@ -39,10 +32,7 @@ class SendMetricsEmailUseCase:
     ) -> None:
         self.report_config_repository = report_config_repository
         self.github_apps_repository = github_apps_repository
-        self.get_calculated_metrics_use_case = get_calculated_metrics_use_case
-        self.get_copilot_metrics_by_language_use_case = get_copilot_metrics_by_language_use_case
-        self.get_copilot_metrics_by_period_use_case = get_copilot_metrics_by_period_use_case
-        self.get_copilot_users_metrics_use_case = get_copilot_users_metrics_use_case
+        self.get_report_metrics_snapshot_use_case = get_report_metrics_snapshot_use_case
         self.mail_name = mail_name
         self.mail_password = mail_password
         self.fernet = Fernet(encryption_key.encode())
@@ -74,13 +64,14 @@ class SendMetricsEmailUseCase:
 
     def make_daily_graphs(self, report_config: ReportConfig, date: datetime, github_app: GitHubApp | None) -> Tuple[List[Tuple[str, io.BytesIO]], List[str]]:
       ten_weeks_ago = date - timedelta(weeks=10)
-      last_ten_weeks_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.WEEK, Productivity_metric.code_lines, ten_weeks_ago, date)
       six_months_ago = date - relativedelta(months=6)
-      last_six_months_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.MONTH, Productivity_metric.code_lines, six_months_ago, date)
       one_week_ago = date - timedelta(weeks=1)
-      last_week_copilot_metrics_by_language = self.get_copilot_metrics_by_language_use_case.execute(report_config.user_id, one_week_ago, date)
-      last_week_copilot_metrics_by_day = self.get_copilot_metrics_by_period_use_case.execute(report_config.user_id, Period.DAILY, one_week_ago, date)
-      last_week_copilot_users_metrics = self.get_copilot_users_metrics_use_case.execute(report_config.user_id, one_week_ago, date)
+      snapshot = self.get_report_metrics_snapshot_use_case.execute(report_config.user_id, six_months_ago, six_months_ago, one_week_ago, date)
+      last_ten_weeks_productivity_metrics = snapshot.code_lines_metrics(Period.WEEK, ten_weeks_ago, date)
+      last_six_months_productivity_metrics = snapshot.code_lines_metrics(Period.MONTH, six_months_ago, date)
+      last_week_copilot_metrics_by_language = snapshot.copilot_metrics_by_language(one_week_ago, date)
+      last_week_copilot_metrics_by_day = snapshot.copilot_metrics_by_period(Period.DAILY, one_week_ago, date)
+      last_week_copilot_users_metrics = snapshot.copilot_users_metrics(one_week_ago, date)
       graphs: List[Tuple[str, io.BytesIO]] = []
       if len(last_ten_weeks_productivity_metrics.data) > 0:
         graphs.append(('last_ten_weeks_productivity.png', self.make_graph(last_ten_weeks_productivity_metrics.data, 'Last ten weeks productivity', 'initial_date', ['net_changed_lines', 'net_changed_lines_by_copilot'], 'Date', 'Changed lines total/copilot'))) # type: ignore
@@ -99,13 +90,14 @@ class SendMetricsEmailUseCase:
 
     def make_weekly_graphs(self, report_config: ReportConfig, date: datetime, github_app: GitHubApp | None) -> Tuple[List[Tuple[str, io.BytesIO]], List[str]]:
       ten_weeks_ago = date - timedelta(weeks=10)
-      last_ten_weeks_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.WEEK, Productivity_metric.code_lines, ten_weeks_ago, date)
       six_months_ago = date - relativedelta(months=6)
-      last_six_months_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.MONTH, Productivity_metric.code_lines, six_months_ago, date)
       one_week_ago = date - timedelta(weeks=1)
-      last_week_copilot_metrics_by_language = self.get_copilot_metrics_by_language_use_case.execute(report_config.user_id, one_week_ago, date)
-      last_week_copilot_metrics_by_day = self.get_copilot_metrics_by_period_use_case.execute(report_config.user_id, Period.DAILY, one_week_ago, date)
-      last_week_copilot_users_metrics = self.get_copilot_users_metrics_use_case.execute(report_config.user_id, one_week_ago, date)
+      snapshot = self.get_report_metrics_snapshot_use_case.execute(report_config.user_id, six_months_ago, six_months_ago, one_week_ago, date)
+      last_ten_weeks_productivity_metrics = snapshot.code_lines_metrics(Period.WEEK, ten_weeks_ago, date)
+      last_six_months_productivity_metrics = snapshot.code_lines_metrics(Period.MONTH, six_months_ago, date)
+      last_week_copilot_metrics_by_language = snapshot.copilot_metrics_by_language(one_week_ago, date)
+      last_week_copilot_metrics_by_day = snapshot.copilot_metrics_by_period(Period.DAILY, one_week_ago, date)
+      last_week_copilot_users_metrics = snapshot.copilot_users_metrics(one_week_ago, date)
       graphs: List[Tuple[str, io.BytesIO]] = []
       if len(last_ten_weeks_productivity_metrics.data) > 0:
         graphs.append(('last_ten_weeks_productivity.png', self.make_graph(last_ten_weeks_productivity_metrics.data, 'Last ten weeks productivity', 'initial_date', ['net_changed_lines', 'net_changed_lines_by_copilot'], 'Date', 'Changed lines total/copilot'))) # type: ignore
@@ -124,13 +116,14 @@ class SendMetricsEmailUseCase:
     
     def make_monthly_graphs(self, report_config: ReportConfig, date: datetime, github_app: GitHubApp | None) -> Tuple[List[Tuple[str, io.BytesIO]], List[str]]:
       ten_weeks_ago = date - timedelta(weeks=10)
-      last_ten_weeks_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.WEEK, Productivity_metric.code_lines, ten_weeks_ago, date)
       six_months_ago = date - relativedelta(months=6)
-      last_six_months_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.MONTH, Productivity_metric.code_lines, six_months_ago, date)
       one_month_ago = date - relativedelta(months=1)
-      last_month_copilot_metrics_by_language = self.get_copilot_metrics_by_language_use_case.execute(report_config.user_id, one_month_ago, date)
-      last_month_copilot_metrics_by_week = self.get_copilot_metrics_by_period_use_case.execute(report_config.user_id, Period.WEEK, one_month_ago, date)
-      last_month_copilot_users_metrics = self.get_copilot_users_metrics_use_case.execute(report_config.user_id, one_month_ago, date)
+      snapshot = self.get_report_metrics_snapshot_use_case.execute(report_config.user_id, six_months_ago, six_months_ago, one_month_ago, date)
+      last_ten_weeks_productivity_metrics = snapshot.code_lines_metrics(Period.WEEK, ten_weeks_ago, date)
+      last_six_months_productivity_metrics = snapshot.code_lines_metrics(Period.MONTH, six_months_ago, date)
+      last_month_copilot_metrics_by_language = snapshot.copilot_metrics_by_language(one_month_ago, date)
+      last_month_copilot_metrics_by_week = snapshot.copilot_metrics_by_period(Period.WEEK, one_month_ago, date)
+      last_month_copilot_users_metrics = snapshot.copilot_users_metrics(one_month_ago, date)
       graphs: List[Tuple[str, io.BytesIO]] = []
       if len(last_ten_weeks_productivity_metrics.data) > 0:
         graphs.append(('last_ten_weeks_productivity.png', self.make_graph(last_ten_weeks_productivity_metrics.data, 'Last ten weeks productivity', 'initial_date', ['net_changed_lines', 'net_changed_lines_by_copilot'], 'Date', 'Changed lines total/copilot'))) # type: ignore
@@ -149,14 +142,15 @@ class SendMetricsEmailUseCase:
     
     def make_quarterly_graphs(self, report_config: ReportConfig, date: datetime, github_app: GitHubApp | None) -> Tuple[List[Tuple[str, io.BytesIO]], List[str]]:
       ten_weeks_ago = date - timedelta(weeks=10)
-      last_ten_weeks_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.WEEK, Productivity_metric.code_lines, ten_weeks_ago, date)
       six_months_ago = date - relativedelta(months=6)
-      last_six_months_productivity_metrics = self.get_calculated_metrics_use_case.execute(report_config.user_id, Period.MONTH, Productivity_metric.code_lines, six_months_ago, date)
       one_month_ago = date - relativedelta(months=1)
       one_quarter_ago = date - relativedelta(months=3)
-      last_quarter_copilot_metrics_by_language = self.get_copilot_metrics_by_language_use_case.execute(report_config.user_id, one_quarter_ago, date)
-      last_quarter_copilot_metrics_by_week = self.get_copilot_metrics_by_period_use_case.execute(report_config.user_id, Period.WEEK, one_quarter_ago, date)
-      last_month_copilot_users_metrics = self.get_copilot_users_metrics_use_case.execute(report_config.user_id, one_month_ago, date)
+      snapshot = self.get_report_metrics_snapshot_use_case.execute(report_config.user_id, six_months_ago, six_months_ago, one_month_ago, date)
+      last_ten_weeks_productivity_metrics = snapshot.code_lines_metrics(Period.WEEK, ten_weeks_ago, date)
+      last_six_months_productivity_metrics = snapshot.code_lines_metrics(Period.MONTH, six_months_ago, date)
+      last_quarter_copilot_metrics_by_language = snapshot.copilot_metrics_by_language(one_quarter_ago, date)
+      last_quarter_copilot_metrics_by_week = snapshot.copilot_metrics_by_period(Period.WEEK, one_quarter_ago, date)
+      last_month_copilot_users_metrics = snapshot.copilot_users_metrics(one_month_ago, date)
       graphs: List[Tuple[str, io.BytesIO]] = []
       if len(last_ten_weeks_productivity_metrics.data) > 0:
         graphs.append(('last_ten_weeks_productivity.png', self.make_graph(last_ten_weeks_productivity_metrics.data, 'Last ten weeks productivity', 'initial_date', ['net_changed_lines', 'net_changed_lines_by_copilot'], 'Date', 'Changed lines total/copilot'))) # type: ignore
@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import Iterable, List, Mapping, TypeVar
+
+K = TypeVar("K", bound=datetime)
+
+
+class TimeSeriesAlignment:
+    """
+    Aligns series keyed by their bucket date (a day or a period final date).
+    Every series is looked up by hash, so aligning stays linear in the number
+    of buckets instead of scanning the series for each key.
+    """
+
+    @staticmethod
+    def reindex(values: Mapping[K, int], keys: Iterable[K]) -> List[int]:
+        """Aligns a series onto the given keys, keeping their order, with 0 for missing keys"""
+        return [values.get(key, 0) for key in keys]
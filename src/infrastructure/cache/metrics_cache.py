@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Generic, Hashable, Optional, TypeVar
+
+from src.domain.use_cases.dtos.calculated_metrics import CalculatedMetrics, MetricsCorrelations
+
+V = TypeVar("V")
+
+CALCULATED_METRICS_CACHE_SIZE = 1024
+METRICS_CORRELATIONS_CACHE_SIZE = 256
+
+
+class LRUCache(Generic[V]):
+    """Thread safe in-process cache bounded to max_size entries, evicting the least recently used"""
+
+    def __init__(self, max_size: int) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+calculated_metrics_cache: LRUCache[CalculatedMetrics] = LRUCache(CALCULATED_METRICS_CACHE_SIZE)
+metrics_correlations_cache: LRUCache[MetricsCorrelations] = LRUCache(METRICS_CORRELATIONS_CACHE_SIZE)
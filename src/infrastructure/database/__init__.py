@@ -9,7 +9,7 @@ This package contains all database-related functionality including:
 """
 
 from .connection.database_connection import Base, SessionLocal, engine
-from .init_db import init_database, create_tables, drop_tables
+from .init_db import init_database, check_schema_version, create_tables, drop_tables, migrate_database
 from .database_utils import get_db, get_db_session, test_database_connection
 
 __all__ = [
@@ -17,6 +17,8 @@ __all__ = [
     "SessionLocal", 
     "engine",
     "init_database",
+    "check_schema_version",
+    "migrate_database",
     "create_tables",
     "drop_tables",
     "get_db",
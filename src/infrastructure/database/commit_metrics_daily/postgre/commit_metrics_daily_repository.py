@@ -0,0 +1,226 @@
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import delete, distinct, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.period_aggregates import CommitMetricsDailyAggregate, CommitMetricsPeriodAggregate
+from src.infrastructure.database.commit_metrics_daily.postgre.dtos.model import CommitMetricsDaily
+from src.infrastructure.database.database_utils import count_distinct_with_null, filter_whole_days, lock_user_rollups, period_bucket
+from src.infrastructure.database.raw_commit_metrics.postgre.dtos.model import RawCommitMetrics
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class CommitMetricsDailyRepository:
+    """
+    Pre-summed commit metrics per (user_id, day, language, repository_name, author_name).
+    refresh_days and delete_by_user_id never commit: they run inside the caller's
+    transaction so the rollup always moves together with raw_commit_metrics.
+    Writers of one user are serialized by an advisory lock held until that transaction ends.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def refresh_days(self, user_id: str, days: Iterable[datetime]) -> None:
+        """Recomputes the rollup rows of the given days from the raw table"""
+        day_starts = sorted({self._day_start(day) for day in days})
+        if not day_starts:
+            return
+
+        lock_user_rollups(self.db, user_id)
+        self.db.execute(
+            delete(CommitMetricsDaily)
+            .where(CommitMetricsDaily.user_id == user_id)
+            .where(CommitMetricsDaily.day.in_(day_starts))
+        )
+
+        self.db.execute(
+            self._insert_from_raw(
+                (RawCommitMetrics.user_id == user_id)
+                & (RawCommitMetrics.date >= day_starts[0])
+                & (RawCommitMetrics.date < day_starts[-1] + timedelta(days=1))
+                & period_bucket(RawCommitMetrics.date, Period.DAILY).in_(day_starts)
+            )
+        )
+
+    def rebuild(self, user_id: Optional[str] = None) -> None:
+        """Recomputes the whole rollup (or one user's) from the raw table"""
+        statement = delete(CommitMetricsDaily)
+        condition: Any = RawCommitMetrics.user_id.is_not(None)
+        if user_id:
+            statement = statement.where(CommitMetricsDaily.user_id == user_id)
+            condition = RawCommitMetrics.user_id == user_id
+            lock_user_rollups(self.db, user_id)
+
+        try:
+            self.db.execute(statement)
+            self.db.execute(self._insert_from_raw(condition))
+            if user_id:
+                UserDataVersionsRepository(self.db).bump(user_id)
+            else:
+                UserDataVersionsRepository(self.db).bump_all()
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+    def delete_by_user_id(self, user_id: str) -> None:
+        self.db.execute(
+            delete(CommitMetricsDaily).where(CommitMetricsDaily.user_id == user_id)
+        )
+
+    def list_period_aggregates_by_user_id(
+        self,
+        user_id: str,
+        period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CommitMetricsPeriodAggregate]:
+        """
+        Same buckets as RawCommitMetricsRepository.list_period_aggregates_by_user_id,
+        read from the rollup. number_of_commits is summed per rollup row, so a commit
+        touching several languages counts once per language.
+        """
+        bucket = period_bucket(CommitMetricsDaily.day, period).label("period_start")
+        query = self._filter_by_user_id(
+            self.db.query(
+                bucket,
+                func.coalesce(func.sum(CommitMetricsDaily.added_lines), 0),
+                func.coalesce(func.sum(CommitMetricsDaily.removed_lines), 0),
+                count_distinct_with_null(CommitMetricsDaily.author_name),
+                func.coalesce(func.sum(CommitMetricsDaily.commits), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(bucket).order_by(bucket).all()
+
+        return [
+            CommitMetricsPeriodAggregate(
+                period_start=period_start,
+                added_lines=added_lines,
+                removed_lines=removed_lines,
+                number_of_authors=number_of_authors,
+                number_of_commits=number_of_commits,
+            )
+            for period_start, added_lines, removed_lines, number_of_authors, number_of_commits in rows
+        ]
+
+    def list_languages_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Distinct languages ordered by the day they first appear, then by name"""
+        query = self._filter_by_user_id(
+            self.db.query(CommitMetricsDaily.language),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(CommitMetricsDaily.language).order_by(
+            func.min(CommitMetricsDaily.day), CommitMetricsDaily.language
+        ).all()
+
+        return [language for (language,) in rows]
+
+    def list_daily_aggregates_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CommitMetricsDailyAggregate]:
+        """One row per day, language and author across repositories, ordered by day and language"""
+        query = self._filter_by_user_id(
+            self.db.query(
+                CommitMetricsDaily.day,
+                CommitMetricsDaily.language,
+                CommitMetricsDaily.author_name,
+                func.coalesce(func.sum(CommitMetricsDaily.added_lines), 0),
+                func.coalesce(func.sum(CommitMetricsDaily.removed_lines), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(
+            CommitMetricsDaily.day,
+            CommitMetricsDaily.language,
+            CommitMetricsDaily.author_name,
+        ).order_by(CommitMetricsDaily.day, CommitMetricsDaily.language).all()
+
+        return [
+            CommitMetricsDailyAggregate(
+                day=day,
+                language=language,
+                author_name=author_name,
+                added_lines=added_lines,
+                removed_lines=removed_lines,
+            )
+            for day, language, author_name, added_lines, removed_lines in rows
+        ]
+
+    def _day_start(self, date: datetime) -> datetime:
+        return datetime(date.year, date.month, date.day)
+
+    def _insert_from_raw(self, condition: Any) -> Any:
+        day = period_bucket(RawCommitMetrics.date, Period.DAILY)
+        return insert(CommitMetricsDaily).from_select(
+            [
+                "user_id",
+                "day",
+                "language",
+                "repository_name",
+                "author_name",
+                "added_lines",
+                "removed_lines",
+                "commits",
+            ],
+            select(
+                RawCommitMetrics.user_id,
+                day,
+                RawCommitMetrics.language,
+                RawCommitMetrics.repository_name,
+                RawCommitMetrics.author_name,
+                func.coalesce(func.sum(RawCommitMetrics.added_lines), 0),
+                func.coalesce(func.sum(RawCommitMetrics.removed_lines), 0),
+                func.count(distinct(RawCommitMetrics.hash)),
+            )
+            .where(condition)
+            .group_by(
+                RawCommitMetrics.user_id,
+                day,
+                RawCommitMetrics.language,
+                RawCommitMetrics.repository_name,
+                RawCommitMetrics.author_name,
+            ),
+        )
+
+    def _filter_by_user_id(
+        self,
+        query: Query[Any],
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> Query[Any]:
+        query = filter_whole_days(query, CommitMetricsDaily.day, initial_date, final_date)
+
+        if languages:
+            query = query.filter(CommitMetricsDaily.language.in_(languages))
+
+        return query.filter(CommitMetricsDaily.user_id == user_id)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
+
+from src.infrastructure.database.connection.database_connection import Base
+
+
+class CommitMetricsDaily(Base):
+    """Daily rollup of raw_commit_metrics, maintained by RawCommitMetricsRepository"""
+    __tablename__ = "commit_metrics_daily"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'day', 'language', 'repository_name', 'author_name', name='uq_commit_metrics_daily_key'),
+        Index('ix_commit_metrics_daily_user_id_day', 'user_id', 'day'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String, nullable=False)
+    day = Column(DateTime, nullable=False)
+    language = Column(String)
+    repository_name = Column(String)
+    author_name = Column(String)
+    added_lines = Column(Integer, nullable=False, default=0)
+    removed_lines = Column(Integer, nullable=False, default=0)
+    commits = Column(Integer, nullable=False, default=0)
+
@@ -0,0 +1,181 @@
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.period_aggregates import CopilotChatMetricsEditorAggregate, CopilotChatUsersDailyAggregate
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.dtos.model import CopilotChatMetricsDaily
+from src.infrastructure.database.database_utils import filter_whole_days, lock_user_rollups, period_bucket
+from src.infrastructure.database.raw_copilot_chat_metrics.postgre.dtos.model import RawCopilotChatMetrics
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class CopilotChatMetricsDailyRepository:
+    """
+    Pre-summed Copilot chat metrics per (user_id, day, ide, copilot_model).
+    refresh_days and delete_by_user_id never commit: they run inside the caller's
+    transaction so the rollup always moves together with raw_copilot_chat_metrics.
+    Writers of one user are serialized by an advisory lock held until that transaction ends.
+    """
+
+    EDITOR_COLUMNS = {
+        "IDE": CopilotChatMetricsDaily.ide,
+        "copilot_model": CopilotChatMetricsDaily.copilot_model,
+    }
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def refresh_days(self, user_id: str, days: Iterable[datetime]) -> None:
+        """Recomputes the rollup rows of the given days from the raw table"""
+        day_starts = sorted({self._day_start(day) for day in days})
+        if not day_starts:
+            return
+
+        lock_user_rollups(self.db, user_id)
+        self.db.execute(
+            delete(CopilotChatMetricsDaily)
+            .where(CopilotChatMetricsDaily.user_id == user_id)
+            .where(CopilotChatMetricsDaily.day.in_(day_starts))
+        )
+
+        self.db.execute(
+            self._insert_from_raw(
+                (RawCopilotChatMetrics.user_id == user_id)
+                & (RawCopilotChatMetrics.date >= day_starts[0])
+                & (RawCopilotChatMetrics.date < day_starts[-1] + timedelta(days=1))
+                & period_bucket(RawCopilotChatMetrics.date, Period.DAILY).in_(day_starts)
+            )
+        )
+
+    def rebuild(self, user_id: Optional[str] = None) -> None:
+        """Recomputes the whole rollup (or one user's) from the raw table"""
+        statement = delete(CopilotChatMetricsDaily)
+        condition: Any = RawCopilotChatMetrics.user_id.is_not(None)
+        if user_id:
+            statement = statement.where(CopilotChatMetricsDaily.user_id == user_id)
+            condition = RawCopilotChatMetrics.user_id == user_id
+            lock_user_rollups(self.db, user_id)
+
+        try:
+            self.db.execute(statement)
+            self.db.execute(self._insert_from_raw(condition))
+            if user_id:
+                UserDataVersionsRepository(self.db).bump(user_id)
+            else:
+                UserDataVersionsRepository(self.db).bump_all()
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+    def delete_by_user_id(self, user_id: str) -> None:
+        self.db.execute(
+            delete(CopilotChatMetricsDaily).where(CopilotChatMetricsDaily.user_id == user_id)
+        )
+
+    def list_editor_aggregates_by_user_id(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> List[CopilotChatMetricsEditorAggregate]:
+        """One row per combination of the group_by EDITOR_COLUMNS, ordered by them"""
+        columns = [self.EDITOR_COLUMNS[name] for name in group_by]
+        query = self._filter_by_user_id(
+            self.db.query(
+                *columns,
+                func.coalesce(func.sum(CopilotChatMetricsDaily.total_chats), 0),
+                func.coalesce(func.sum(CopilotChatMetricsDaily.insertion_events), 0),
+                func.coalesce(func.sum(CopilotChatMetricsDaily.copy_events), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+        )
+
+        rows = query.group_by(*columns).order_by(*columns).all()
+
+        return [
+            CopilotChatMetricsEditorAggregate(
+                **dict(zip(group_by, row[: len(group_by)])),
+                total_chats=row[-3],
+                insertion_events=row[-2],
+                copy_events=row[-1],
+            )
+            for row in rows
+        ]
+
+    def list_daily_users_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> List[CopilotChatUsersDailyAggregate]:
+        """Chat users summed per day across IDEs and models, ordered by day"""
+        query = self._filter_by_user_id(
+            self.db.query(
+                CopilotChatMetricsDaily.day,
+                func.coalesce(func.sum(CopilotChatMetricsDaily.total_users), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+        )
+
+        rows = query.group_by(CopilotChatMetricsDaily.day).order_by(CopilotChatMetricsDaily.day).all()
+
+        return [
+            CopilotChatUsersDailyAggregate(day=day, total_users=total_users)
+            for day, total_users in rows
+        ]
+
+    def _day_start(self, date: datetime) -> datetime:
+        return datetime(date.year, date.month, date.day)
+
+    def _insert_from_raw(self, condition: Any) -> Any:
+        day = period_bucket(RawCopilotChatMetrics.date, Period.DAILY)
+        return insert(CopilotChatMetricsDaily).from_select(
+            [
+                "user_id",
+                "day",
+                "ide",
+                "copilot_model",
+                "total_users",
+                "total_chats",
+                "copy_events",
+                "insertion_events",
+            ],
+            select(
+                RawCopilotChatMetrics.user_id,
+                day,
+                RawCopilotChatMetrics.ide,
+                RawCopilotChatMetrics.copilot_model,
+                func.coalesce(func.sum(RawCopilotChatMetrics.total_users), 0),
+                func.coalesce(func.sum(RawCopilotChatMetrics.total_chats), 0),
+                func.coalesce(func.sum(RawCopilotChatMetrics.copy_events), 0),
+                func.coalesce(func.sum(RawCopilotChatMetrics.insertion_events), 0),
+            )
+            .where(condition)
+            .group_by(
+                RawCopilotChatMetrics.user_id,
+                day,
+                RawCopilotChatMetrics.ide,
+                RawCopilotChatMetrics.copilot_model,
+            ),
+        )
+
+    def _filter_by_user_id(
+        self,
+        query: Query[Any],
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> Query[Any]:
+        query = filter_whole_days(query, CopilotChatMetricsDaily.day, initial_date, final_date)
+
+        return query.filter(CopilotChatMetricsDaily.user_id == user_id)
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
+
+from src.infrastructure.database.connection.database_connection import Base
+
+
+class CopilotChatMetricsDaily(Base):
+    """Daily rollup of raw_copilot_chat_metrics, maintained by RawCopilotChatMetricsRepository"""
+    __tablename__ = "copilot_chat_metrics_daily"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'day', 'ide', 'copilot_model', name='uq_copilot_chat_metrics_daily_key'),
+        Index('ix_copilot_chat_metrics_daily_user_id_day', 'user_id', 'day'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String, nullable=False)
+    day = Column(DateTime, nullable=False)
+    ide = Column(String)
+    copilot_model = Column(String)
+    total_users = Column(Integer, nullable=False, default=0)
+    total_chats = Column(Integer, nullable=False, default=0)
+    copy_events = Column(Integer, nullable=False, default=0)
+    insertion_events = Column(Integer, nullable=False, default=0)
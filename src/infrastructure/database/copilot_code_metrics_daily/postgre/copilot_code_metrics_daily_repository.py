@@ -0,0 +1,390 @@
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.calculated_metrics import CopilotUsersMetrics
+from src.domain.use_cases.dtos.period_aggregates import (
+    CopilotCodeMetricsDailyAggregate,
+    CopilotCodeMetricsEditorAggregate,
+    CopilotCodeMetricsLanguageAggregate,
+    CopilotCodeMetricsPeriodAggregate,
+    CopilotCodeMetricsPeriodTotals,
+)
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.dtos.model import CopilotChatMetricsDaily
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.dtos.model import CopilotCodeMetricsDaily
+from src.infrastructure.database.database_utils import filter_whole_days, lock_user_rollups, period_bucket, ratio_or_zero
+from src.infrastructure.database.raw_copilot_code_metrics.postgre.dtos.model import RawCopilotCodeMetrics
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class CopilotCodeMetricsDailyRepository:
+    """
+    Pre-summed Copilot code metrics per (user_id, day, language, ide, copilot_model).
+    refresh_days and delete_by_user_id never commit: they run inside the caller's
+    transaction so the rollup always moves together with raw_copilot_code_metrics.
+    Writers of one user are serialized by an advisory lock held until that transaction ends.
+    """
+
+    EDITOR_COLUMNS = {
+        "IDE": CopilotCodeMetricsDaily.ide,
+        "copilot_model": CopilotCodeMetricsDaily.copilot_model,
+    }
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def refresh_days(self, user_id: str, days: Iterable[datetime]) -> None:
+        """Recomputes the rollup rows of the given days from the raw table"""
+        day_starts = sorted({self._day_start(day) for day in days})
+        if not day_starts:
+            return
+
+        lock_user_rollups(self.db, user_id)
+        self.db.execute(
+            delete(CopilotCodeMetricsDaily)
+            .where(CopilotCodeMetricsDaily.user_id == user_id)
+            .where(CopilotCodeMetricsDaily.day.in_(day_starts))
+        )
+
+        self.db.execute(
+            self._insert_from_raw(
+                (RawCopilotCodeMetrics.user_id == user_id)
+                & (RawCopilotCodeMetrics.date >= day_starts[0])
+                & (RawCopilotCodeMetrics.date < day_starts[-1] + timedelta(days=1))
+                & period_bucket(RawCopilotCodeMetrics.date, Period.DAILY).in_(day_starts)
+            )
+        )
+
+    def rebuild(self, user_id: Optional[str] = None) -> None:
+        """Recomputes the whole rollup (or one user's) from the raw table"""
+        statement = delete(CopilotCodeMetricsDaily)
+        condition: Any = RawCopilotCodeMetrics.user_id.is_not(None)
+        if user_id:
+            statement = statement.where(CopilotCodeMetricsDaily.user_id == user_id)
+            condition = RawCopilotCodeMetrics.user_id == user_id
+            lock_user_rollups(self.db, user_id)
+
+        try:
+            self.db.execute(statement)
+            self.db.execute(self._insert_from_raw(condition))
+            if user_id:
+                UserDataVersionsRepository(self.db).bump(user_id)
+            else:
+                UserDataVersionsRepository(self.db).bump_all()
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+    def delete_by_user_id(self, user_id: str) -> None:
+        self.db.execute(
+            delete(CopilotCodeMetricsDaily).where(CopilotCodeMetricsDaily.user_id == user_id)
+        )
+
+    def list_period_aggregates_by_user_id(
+        self,
+        user_id: str,
+        period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotCodeMetricsPeriodAggregate]:
+        """One row per non-empty period, ordered by period start"""
+        bucket = period_bucket(CopilotCodeMetricsDaily.day, period).label("period_start")
+        query = self._filter_by_user_id(
+            self.db.query(bucket, *self._metric_sums()),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(bucket).order_by(bucket).all()
+
+        return [
+            CopilotCodeMetricsPeriodAggregate(
+                period_start=period_start,
+                code_acceptances=code_acceptances,
+                code_suggestions=code_suggestions,
+                lines_accepted=lines_accepted,
+                lines_suggested=lines_suggested,
+            )
+            for period_start, code_acceptances, code_suggestions, lines_accepted, lines_suggested in rows
+        ]
+
+    def list_period_totals_by_user_id(
+        self,
+        user_id: str,
+        period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> List[CopilotCodeMetricsPeriodTotals]:
+        """
+        Same buckets as list_period_aggregates_by_user_id, with both acceptance
+        ratios computed in the same query. Ordered by period start.
+        """
+        bucket = period_bucket(CopilotCodeMetricsDaily.day, period).label("period_start")
+        code_acceptances, code_suggestions, lines_accepted, lines_suggested = self._metric_sums()
+        query = self._filter_by_user_id(
+            self.db.query(
+                bucket,
+                code_acceptances,
+                code_suggestions,
+                lines_accepted,
+                lines_suggested,
+                ratio_or_zero(code_acceptances, code_suggestions),
+                ratio_or_zero(lines_accepted, lines_suggested),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+        )
+
+        rows = query.group_by(bucket).order_by(bucket).all()
+
+        return [
+            CopilotCodeMetricsPeriodTotals(
+                period_start=row[0],
+                code_acceptances=row[1],
+                code_suggestions=row[2],
+                lines_accepted=row[3],
+                lines_suggested=row[4],
+                percentage_code_acceptances=row[5],
+                percentage_lines_accepted=row[6],
+            )
+            for row in rows
+        ]
+
+    def list_language_aggregates_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        ides: Optional[List[str]] = None,
+        copilot_models: Optional[List[str]] = None,
+    ) -> List[CopilotCodeMetricsLanguageAggregate]:
+        """One row per language, ordered by language, optionally restricted to some IDEs and models"""
+        query = self._filter_by_user_id(
+            self.db.query(CopilotCodeMetricsDaily.language, *self._metric_sums()),
+            user_id,
+            initial_date,
+            final_date,
+            ides=ides,
+            copilot_models=copilot_models,
+        )
+
+        rows = query.group_by(CopilotCodeMetricsDaily.language).order_by(
+            CopilotCodeMetricsDaily.language
+        ).all()
+
+        return [
+            CopilotCodeMetricsLanguageAggregate(
+                language=language,
+                code_acceptances=code_acceptances,
+                code_suggestions=code_suggestions,
+                lines_accepted=lines_accepted,
+                lines_suggested=lines_suggested,
+            )
+            for language, code_acceptances, code_suggestions, lines_accepted, lines_suggested in rows
+        ]
+
+    def list_editor_aggregates_by_user_id(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotCodeMetricsEditorAggregate]:
+        """One row per combination of the group_by EDITOR_COLUMNS, ordered by them"""
+        columns = [self.EDITOR_COLUMNS[name] for name in group_by]
+        query = self._filter_by_user_id(
+            self.db.query(*columns, *self._metric_sums()),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(*columns).order_by(*columns).all()
+
+        return [
+            CopilotCodeMetricsEditorAggregate(
+                **dict(zip(group_by, row[: len(group_by)])),
+                code_acceptances=row[-4],
+                code_suggestions=row[-3],
+                lines_accepted=row[-2],
+                lines_suggested=row[-1],
+            )
+            for row in rows
+        ]
+
+    def list_code_and_chat_users_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> List[CopilotUsersMetrics]:
+        """
+        Code assistant and chat users summed per day and FULL OUTER JOINed on the day
+        in one query, ordered by day, 0 where one side has no row. Empty when there
+        are no code metrics at all.
+        """
+        code_users = self._filter_by_user_id(
+            self.db.query(
+                CopilotCodeMetricsDaily.day.label("day"),
+                func.sum(CopilotCodeMetricsDaily.total_users).label("total_users"),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+        ).group_by(CopilotCodeMetricsDaily.day).subquery()
+
+        # The chat rollup keeps the same day buckets as the code rollup, so both sides join on whole days
+        chat_query = filter_whole_days(
+            self.db.query(
+                CopilotChatMetricsDaily.day.label("day"),
+                func.sum(CopilotChatMetricsDaily.total_users).label("total_users"),
+            ).filter(CopilotChatMetricsDaily.user_id == user_id),
+            CopilotChatMetricsDaily.day,
+            initial_date,
+            final_date,
+        )
+
+        chat_users = chat_query.group_by(CopilotChatMetricsDaily.day).subquery()
+
+        day = func.coalesce(code_users.c.day, chat_users.c.day)
+        rows = self.db.execute(
+            select(
+                day,
+                func.coalesce(code_users.c.total_users, 0),
+                func.coalesce(chat_users.c.total_users, 0),
+                code_users.c.day.is_not(None),
+            )
+            .select_from(code_users)
+            .join(chat_users, code_users.c.day == chat_users.c.day, full=True)
+            .order_by(day)
+        ).all()
+
+        if not any(has_code_users for *_, has_code_users in rows):
+            return []
+
+        return [
+            CopilotUsersMetrics(
+                date=date,
+                total_code_assistant_users=total_code_assistant_users,
+                total_chat_users=total_chat_users,
+            )
+            for date, total_code_assistant_users, total_chat_users, _ in rows
+        ]
+
+    def list_daily_aggregates_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+    ) -> List[CopilotCodeMetricsDailyAggregate]:
+        """One row per day and language across IDEs and models, ordered by day and language"""
+        query = self._filter_by_user_id(
+            self.db.query(
+                CopilotCodeMetricsDaily.day,
+                CopilotCodeMetricsDaily.language,
+                func.coalesce(func.sum(CopilotCodeMetricsDaily.total_users), 0),
+                *self._metric_sums(),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+        )
+
+        rows = query.group_by(
+            CopilotCodeMetricsDaily.day, CopilotCodeMetricsDaily.language
+        ).order_by(CopilotCodeMetricsDaily.day, CopilotCodeMetricsDaily.language).all()
+
+        return [
+            CopilotCodeMetricsDailyAggregate(
+                day=day,
+                language=language,
+                total_users=total_users,
+                code_acceptances=code_acceptances,
+                code_suggestions=code_suggestions,
+                lines_accepted=lines_accepted,
+                lines_suggested=lines_suggested,
+            )
+            for day, language, total_users, code_acceptances, code_suggestions, lines_accepted, lines_suggested in rows
+        ]
+
+    def _metric_sums(self) -> List[Any]:
+        return [
+            func.coalesce(func.sum(CopilotCodeMetricsDaily.code_acceptances), 0),
+            func.coalesce(func.sum(CopilotCodeMetricsDaily.code_suggestions), 0),
+            func.coalesce(func.sum(CopilotCodeMetricsDaily.lines_accepted), 0),
+            func.coalesce(func.sum(CopilotCodeMetricsDaily.lines_suggested), 0),
+        ]
+
+    def _day_start(self, date: datetime) -> datetime:
+        return datetime(date.year, date.month, date.day)
+
+    def _insert_from_raw(self, condition: Any) -> Any:
+        day = period_bucket(RawCopilotCodeMetrics.date, Period.DAILY)
+        return insert(CopilotCodeMetricsDaily).from_select(
+            [
+                "user_id",
+                "day",
+                "language",
+                "ide",
+                "copilot_model",
+                "total_users",
+                "code_acceptances",
+                "code_suggestions",
+                "lines_accepted",
+                "lines_suggested",
+            ],
+            select(
+                RawCopilotCodeMetrics.user_id,
+                day,
+                RawCopilotCodeMetrics.language,
+                RawCopilotCodeMetrics.ide,
+                RawCopilotCodeMetrics.copilot_model,
+                func.coalesce(func.sum(RawCopilotCodeMetrics.total_users), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.code_acceptances), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.code_suggestions), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_accepted), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_suggested), 0),
+            )
+            .where(condition)
+            .group_by(
+                RawCopilotCodeMetrics.user_id,
+                day,
+                RawCopilotCodeMetrics.language,
+                RawCopilotCodeMetrics.ide,
+                RawCopilotCodeMetrics.copilot_model,
+            ),
+        )
+
+    def _filter_by_user_id(
+        self,
+        query: Query[Any],
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+        ides: Optional[List[str]] = None,
+        copilot_models: Optional[List[str]] = None,
+    ) -> Query[Any]:
+        query = filter_whole_days(query, CopilotCodeMetricsDaily.day, initial_date, final_date)
+
+        if languages:
+            query = query.filter(CopilotCodeMetricsDaily.language.in_(languages))
+
+        if ides:
+            query = query.filter(CopilotCodeMetricsDaily.ide.in_(ides))
+
+        if copilot_models:
+            query = query.filter(CopilotCodeMetricsDaily.copilot_model.in_(copilot_models))
+
+        return query.filter(CopilotCodeMetricsDaily.user_id == user_id)
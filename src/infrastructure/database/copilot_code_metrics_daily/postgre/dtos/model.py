@@ -0,0 +1,24 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
+
+from src.infrastructure.database.connection.database_connection import Base
+
+
+class CopilotCodeMetricsDaily(Base):
+    """Daily rollup of raw_copilot_code_metrics, maintained by RawCopilotCodeMetricsRepository"""
+    __tablename__ = "copilot_code_metrics_daily"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'day', 'language', 'ide', 'copilot_model', name='uq_copilot_code_metrics_daily_key'),
+        Index('ix_copilot_code_metrics_daily_user_id_day', 'user_id', 'day'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String, nullable=False)
+    day = Column(DateTime, nullable=False)
+    language = Column(String)
+    ide = Column(String)
+    copilot_model = Column(String)
+    total_users = Column(Integer, nullable=False, default=0)
+    code_acceptances = Column(Integer, nullable=False, default=0)
+    code_suggestions = Column(Integer, nullable=False, default=0)
+    lines_accepted = Column(Integer, nullable=False, default=0)
+    lines_suggested = Column(Integer, nullable=False, default=0)
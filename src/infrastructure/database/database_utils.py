@@ -1,13 +1,25 @@
 import logging
-from typing import Generator
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import text
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generator, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
+import psycopg2  # type: ignore
+from psycopg2.extras import execute_values  # type: ignore
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy import Float, case, cast, distinct, func, literal_column, text
+
+from src.config.config import CONFIG
 from src.infrastructure.database.connection.database_connection import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+ROLLUP_LOCK_NAMESPACE = 7_245_033
+INSERT_BATCH_SIZE = CONFIG.db_insert_batch_size
+# The Postgres wire protocol caps one statement at this many bind parameters
+MAX_BIND_PARAMETERS = 65_535
+
+T = TypeVar("T")
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -62,3 +74,137 @@ def test_database_connection() -> bool:
     except Exception as e:
         logger.error(f"Database connection test failed: {e}")
         return False
+
+
+PERIOD_DATE_TRUNC_UNITS = {
+    "D": "day",
+    "W": "week",
+    "M": "month",
+    "Q": "quarter",
+    "Y": "year",
+}
+
+
+def period_bucket(column: Any, period: str) -> Any:
+    """
+    Postgres date_trunc expression that starts the bucket of the given Period.
+    Buckets line up with the pandas Grouper frequencies used by the use cases
+    (weeks start on Monday, quarters and years follow the calendar).
+    """
+    if period not in PERIOD_DATE_TRUNC_UNITS:
+        raise ValueError(
+            f"Invalid period: {period}. Allowed: {list(PERIOD_DATE_TRUNC_UNITS)}"
+        )
+    # Rendered inline so SELECT and GROUP BY share the exact same expression
+    unit: Any = literal_column(f"'{PERIOD_DATE_TRUNC_UNITS[period]}'")
+    return func.date_trunc(unit, column)
+
+
+def day_start(date: datetime) -> datetime:
+    return datetime(date.year, date.month, date.day)
+
+
+def filter_whole_days(
+    query: Query[Any],
+    column: Any,
+    initial_date: Optional[datetime] = None,
+    final_date: Optional[datetime] = None,
+) -> Query[Any]:
+    """
+    Bounds column to whole days, from the start of initial_date's day to the end of
+    final_date's day. Raw tables and day granular rollups share this convention,
+    so both answer the same for any pair of bounds.
+    """
+    if initial_date:
+        query = query.filter(column >= day_start(initial_date))
+
+    if final_date:
+        query = query.filter(column < day_start(final_date) + timedelta(days=1))
+
+    return query
+
+
+def lock_user_rollups(db: Session, user_id: str) -> None:
+    """
+    Serializes rollup refreshes of one user until the current transaction ends.
+    The refreshes delete then re-insert days, and ON CONFLICT cannot stand in
+    for that: the rollup keys hold nullable columns.
+    """
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:user_id))"),
+        {"namespace": ROLLUP_LOCK_NAMESPACE, "user_id": user_id},
+    )
+
+
+def count_distinct_with_null(column: Any) -> Any:
+    """COUNT(DISTINCT column) that also counts NULL as one distinct value"""
+    return func.count(distinct(column)) + func.max(
+        case((column.is_(None), 1), else_=0)
+    )
+
+
+def ratio_or_zero(numerator: Any, denominator: Any) -> Any:
+    """numerator / denominator as a float, 0 when the denominator is not positive"""
+    return case((denominator > 0, cast(numerator, Float) / denominator), else_=0.0)
+
+
+def batched(items: List[T], batch_size: int, parameters_per_item: int = 1) -> Iterator[List[T]]:
+    """
+    Consecutive slices of items of at most batch_size elements, shrunk so a
+    slice bound at parameters_per_item each never exceeds MAX_BIND_PARAMETERS
+    """
+    if batch_size < 1:
+        raise ValueError(f"Invalid batch size: {batch_size}")
+
+    batch_size = min(batch_size, MAX_BIND_PARAMETERS // parameters_per_item)
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def upsert_values(
+    db: Session,
+    table: str,
+    columns: List[str],
+    rows: List[Tuple[Any, ...]],
+    conflict_columns: List[str],
+    update_columns: List[str],
+    page_size: int = INSERT_BATCH_SIZE,
+) -> None:
+    """
+    INSERT ... VALUES ... ON CONFLICT DO UPDATE sent page_size rows per statement
+    through psycopg2's execute_values, on the session's connection so every page
+    belongs to the caller's transaction. Rows sharing a conflict key are reduced
+    to the last one, since a statement may update a row only once. Keys with a
+    NULL part never conflict in Postgres, so those rows are all sent as they are.
+    """
+    if page_size < 1:
+        raise ValueError(f"Invalid page size: {page_size}")
+
+    key_indexes = [columns.index(column) for column in conflict_columns]
+    unique_rows: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+    rows_with_null_keys: List[Tuple[Any, ...]] = []
+    for row in rows:
+        key = tuple(row[index] for index in key_indexes)
+        if None in key:
+            rows_with_null_keys.append(row)
+        else:
+            unique_rows[key] = row
+
+    statement = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET "
+        + ", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+    )
+
+    cursor = db.connection().connection.cursor()
+    try:
+        execute_values(cursor, statement, list(unique_rows.values()) + rows_with_null_keys, page_size=page_size)
+    except psycopg2.Error as e:
+        # Surface driver errors like the ORM does, callers only handle SQLAlchemyError
+        raise DBAPIError(statement, None, e) from e
+    finally:
+        cursor.close()
+
+
+def row_values(record: Any, columns: Sequence[str]) -> Tuple[Any, ...]:
+    return tuple(getattr(record, column) for column in columns)
@@ -7,8 +7,15 @@ from src.infrastructure.database.connection.database_connection import Base, eng
 from src.infrastructure.database.raw_copilot_code_metrics.postgre.dtos.model import RawCopilotCodeMetrics  # noqa: F401
 from src.infrastructure.database.raw_copilot_chat_metrics.postgre.dtos.model import RawCopilotChatMetrics  # noqa: F401
 from src.infrastructure.database.raw_commit_metrics.postgre.dtos.model import RawCommitMetrics  # noqa: F401
+from src.infrastructure.database.commit_metrics_daily.postgre.dtos.model import CommitMetricsDaily  # noqa: F401
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.dtos.model import CopilotCodeMetricsDaily  # noqa: F401
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.dtos.model import CopilotChatMetricsDaily  # noqa: F401
 from src.infrastructure.database.users.postgre.dtos.model import UserDbSchema  # noqa: F401
 from src.infrastructure.database.api_keys.postgre.dtos.model import ApiKeyDbSchema  # noqa: F401
+from src.infrastructure.database.user_data_versions.postgre.dtos.model import UserDataVersion  # noqa: F401
+from src.infrastructure.database.schema_migrations.postgre.dtos.model import SchemaMigration  # noqa: F401
+from src.infrastructure.database.schema_migrations.postgre.migrations import LATEST_VERSION
+from src.infrastructure.database.schema_migrations.postgre.schema_migrator import SchemaMigrator
 
 logger = logging.getLogger(__name__)
 
@@ -53,12 +60,59 @@ def drop_tables() -> None:
         raise
 
 
+def migrate_database(include_manual: bool = True) -> int:
+    """
+    Apply the pending schema migrations and return the resulting schema version.
+    Index migrations build CONCURRENTLY, so this is safe against a live database;
+    manual migrations (table rewrites) only run when include_manual is set.
+    """
+    try:
+        version = SchemaMigrator(engine).migrate(include_manual)
+        logger.info(f"Database schema is at version {version}")
+        return version
+    except SQLAlchemyError as e:
+        logger.error(f"Error migrating database schema: {e}")
+        raise
+
+
+def check_schema_version() -> None:
+    """
+    Startup check: one query against schema_migrations instead of reflecting
+    every table. A database behind the code gets its online migrations, and the
+    manual ones that are cheap on it (partitioning still empty raw tables); a
+    manual one with rows to rewrite stops startup until it is applied with
+    `python scripts/manage_db.py migrate`.
+    """
+    current_version = SchemaMigrator(engine).current_version()
+
+    if current_version > LATEST_VERSION:
+        logger.warning(
+            f"Database schema version {current_version} is newer than this release ({LATEST_VERSION})"
+        )
+        return
+
+    if current_version == LATEST_VERSION:
+        logger.info(f"Database schema is up to date (version {current_version})")
+        return
+
+    logger.info(f"Database schema version {current_version} is behind {LATEST_VERSION}, migrating...")
+    current_version = migrate_database(include_manual=False)
+
+    if current_version < LATEST_VERSION:
+        manual = SchemaMigrator.pending(current_version)[0]
+        raise RuntimeError(
+            f"Database schema version {current_version} needs migration {manual.version} ({manual.name}), "
+            f"which rewrites large tables and is not applied at startup. "
+            f"Run `python scripts/manage_db.py migrate`, then start the application again"
+        )
+
+
 def init_database() -> None:
     """
-    Initialize the database by creating all tables.
+    Initialize the database by applying the schema migrations.
     This is the main function to call for database setup.
     """
-    create_tables()
+    migrate_database()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+import csv
+import io
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, cast
+
+from sqlalchemy import text
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.domain.use_cases.dtos.bulk_insert_result import BulkInsertResult
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+from src.infrastructure.database.metrics_partitions.postgre.metrics_partitions_repository import MetricsPartitionsRepository
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class LoadTarget(NamedTuple):
+    """
+    How one kind of metrics file is loaded: its input columns, the raw table
+    they land in and how rows already in that table are handled.
+    """
+    table: str
+    input_columns: List[str]
+    # Raw table column filled from each input column, same order
+    table_columns: List[str]
+    conflict_columns: List[str]
+    # Columns overwritten on conflict like upsert_many does, empty to skip existing rows
+    update_columns: List[str]
+    # Text columns set to a constant by the merge (COPY would turn '' into NULL)
+    constant_columns: Dict[str, str]
+    rollup: Callable[[Session], Any]
+
+
+class _CsvStream(io.RawIOBase):
+    """Read-only file over rows rendered as CSV on demand, for COPY ... FROM STDIN"""
+
+    def __init__(self, rows: Iterator[List[Any]]) -> None:
+        self._rows = rows
+        self._buffer = b""
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        size = size if size is not None and size >= 0 else 1 << 20
+        while len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._line.seek(0)
+            self._line.truncate()
+            self._writer.writerow(row)
+            self._buffer += self._line.getvalue().encode("utf-8")
+
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+class MetricsBulkLoaderRepository:
+    """
+    Loader for very large imports: rows are streamed with COPY ... FROM STDIN into an
+    UNLOGGED staging table, then merged into the raw table with one INSERT ... SELECT
+    ... ON CONFLICT. Everything, including the daily rollup refresh, runs in a single
+    transaction, so a failed load leaves neither rows nor the staging table behind.
+    Values are handed to Postgres as text, an empty value is NULL.
+    """
+
+    TARGETS = {
+        "commit": LoadTarget(
+            table="raw_commit_metrics",
+            input_columns=["hash", "repository", "date", "author", "language", "added_lines", "removed_lines"],
+            table_columns=["hash", "repository_name", "date", "author_name", "language", "added_lines", "removed_lines"],
+            conflict_columns=["user_id", "hash", "repository_name", "language", "date"],
+            update_columns=[],
+            constant_columns={"repository_team": "", "author_teams": ""},
+            rollup=CommitMetricsDailyRepository,
+        ),
+        "copilot_code": LoadTarget(
+            table="raw_copilot_code_metrics",
+            input_columns=["team_name", "date", "ide", "copilot_model", "language", "total_users",
+                           "code_acceptances", "code_suggestions", "lines_accepted", "lines_suggested"],
+            table_columns=["team_name", "date", "ide", "copilot_model", "language", "total_users",
+                           "code_acceptances", "code_suggestions", "lines_accepted", "lines_suggested"],
+            conflict_columns=["user_id", "date", "ide", "copilot_model", "language"],
+            update_columns=["team_name", "total_users", "code_acceptances", "code_suggestions",
+                            "lines_accepted", "lines_suggested"],
+            constant_columns={},
+            rollup=CopilotCodeMetricsDailyRepository,
+        ),
+        "copilot_chat": LoadTarget(
+            table="raw_copilot_chat_metrics",
+            input_columns=["team_name", "date", "ide", "copilot_model", "total_users",
+                           "total_chats", "copy_events", "insertion_events"],
+            table_columns=["team_name", "date", "ide", "copilot_model", "total_users",
+                           "total_chats", "copy_events", "insertion_events"],
+            conflict_columns=["user_id", "team_name", "date", "ide", "copilot_model"],
+            update_columns=["total_users", "total_chats", "copy_events", "insertion_events"],
+            constant_columns={},
+            rollup=CopilotChatMetricsDailyRepository,
+        ),
+    }
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def load(self, kind: str, user_id: str, rows: Iterable[Mapping[str, Any]]) -> BulkInsertResult:
+        """
+        Loads rows keyed by TARGETS[kind].input_columns for user_id. For Copilot metrics,
+        inserted counts upserted rows: existing ones are updated, like upsert_many.
+        """
+        target = self.TARGETS[kind]
+        staging = f"staging_{target.table}_{uuid.uuid4().hex[:12]}"
+        columns = ["id", "user_id", "created_at", *target.table_columns]
+        created_at = datetime.now(timezone.utc).isoformat()
+
+        def copy_rows() -> Iterator[List[Any]]:
+            for row in rows:
+                yield [str(uuid.uuid4()), user_id, created_at,
+                       *(self._copy_value(row.get(column)) for column in target.input_columns)]
+
+        try:
+            self.db.execute(
+                text(f"CREATE UNLOGGED TABLE {staging} (LIKE {target.table} INCLUDING DEFAULTS)")
+            )
+
+            cursor = self.db.connection().connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY {staging} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                    _CsvStream(copy_rows()),
+                )
+            finally:
+                cursor.close()
+
+            staged, first_day, last_day = self.db.execute(
+                text(f"SELECT count(*), min(date), max(date) FROM {staging}")
+            ).one()
+
+            if staged:
+                # Historical months get partitions of their own instead of the default one
+                partitions_repository = MetricsPartitionsRepository(self.db)
+                partitions_repository.ensure_default_partition(target.table)
+                partitions_repository.ensure_partitions(target.table, first_day, last_day)
+
+            merged = cast(
+                CursorResult[Any], self.db.execute(text(self._merge_statement(target, staging, columns)))
+            ).rowcount
+
+            days = self.db.execute(
+                text(f"SELECT DISTINCT date_trunc('day', date) FROM {staging}")
+            ).scalars().all()
+            target.rollup(self.db).refresh_days(user_id, days)
+            UserDataVersionsRepository(self.db).bump(user_id)
+
+            self.db.execute(text(f"DROP TABLE {staging}"))
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        return BulkInsertResult(inserted=merged, skipped=staged - merged)
+
+    def _merge_statement(self, target: LoadTarget, staging: str, columns: List[str]) -> str:
+        insert_list = ", ".join([*columns, *target.constant_columns])
+        select_list = ", ".join(
+            [*columns, *(f"'{value}'" for value in target.constant_columns.values())]
+        )
+        conflict_list = ", ".join(target.conflict_columns)
+
+        if not target.update_columns:
+            return (
+                f"INSERT INTO {target.table} ({insert_list}) SELECT {select_list} FROM {staging} "
+                f"ON CONFLICT ({conflict_list}) DO NOTHING"
+            )
+
+        # DO UPDATE may touch each row once per statement: keep one staged row per key
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in target.update_columns)
+        return (
+            f"INSERT INTO {target.table} ({insert_list}) "
+            f"SELECT DISTINCT ON ({conflict_list}) {select_list} FROM {staging} ORDER BY {conflict_list} "
+            f"ON CONFLICT ({conflict_list}) DO UPDATE SET {updates}"
+        )
+
+    @staticmethod
+    def _copy_value(value: Any) -> Any:
+        if value is None or (isinstance(value, float) and value != value):
+            return ""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
@@ -0,0 +1,192 @@
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class MetricsPartitionsRepository:
+    """
+    Monthly range partitions of the raw metrics tables, named <table>_pYYYY_MM,
+    plus a <table>_default partition that catches rows outside every month.
+    Only the public maintenance methods commit; ensure_* run inside the caller's transaction.
+    The maintenance methods run in every worker, a transaction level advisory lock
+    serializes them.
+    """
+
+    PARTITIONED_TABLES = ["raw_commit_metrics", "raw_copilot_code_metrics", "raw_copilot_chat_metrics"]
+    ROLLUP_TABLES: Dict[str, List[str]] = {
+        "raw_commit_metrics": ["commit_metrics_daily"],
+        "raw_copilot_code_metrics": ["copilot_code_metrics_daily"],
+        "raw_copilot_chat_metrics": ["copilot_chat_metrics_daily"],
+    }
+    MONTHS_AHEAD = 3
+    ADVISORY_LOCK_KEY = 7_245_032
+
+    _PARTITION_NAME = re.compile(r"_p(\d{4})_(\d{2})$")
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def create_future_partitions(
+        self,
+        months_ahead: int = MONTHS_AHEAD,
+        today: Optional[datetime] = None,
+    ) -> List[str]:
+        """
+        Makes sure every table has partitions from this month to months_ahead months
+        from now. Rows that landed in the default partition (historical backfills)
+        get partitions of their own months too, which moves them out of it.
+        """
+        this_month = self.month_start(today or datetime.now())
+        created: List[str] = []
+        self._lock()
+
+        for table in self.PARTITIONED_TABLES:
+            self.ensure_default_partition(table)
+            oldest = self.db.execute(text(f"SELECT min(date) FROM {table}_default")).scalar()
+            first_month = min(self.month_start(oldest), this_month) if oldest else this_month
+            created += self.ensure_partitions(table, first_month, self.add_months(this_month, months_ahead))
+
+        self.db.commit()
+        return created
+
+    def drop_partitions_before(self, cutoff: datetime) -> List[str]:
+        """
+        Retention: detaches and drops every monthly partition that ends on or before
+        the start of the cutoff month, along with the rollup days of that month, so
+        raw reads and rollup reads keep agreeing.
+        """
+        cutoff_month = self.month_start(cutoff)
+        dropped: List[str] = []
+        affected_users: Set[str] = set()
+        self._lock()
+
+        for table in self.PARTITIONED_TABLES:
+            for partition in self.list_partitions(table):
+                bounds = self.partition_bounds(partition)
+                if bounds is None or bounds[1] > cutoff_month:
+                    continue
+
+                for rollup in self.ROLLUP_TABLES[table]:
+                    affected_users.update(self._delete_rollup_days(rollup, *bounds))
+                self.db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition}"))
+                self.db.execute(text(f"DROP TABLE {partition}"))
+                dropped.append(partition)
+
+        versions_repository = UserDataVersionsRepository(self.db)
+        for user_id in sorted(affected_users):
+            versions_repository.bump(user_id)
+
+        self.db.commit()
+        return dropped
+
+    def ensure_partitions(self, table: str, first_month: datetime, last_month: datetime) -> List[str]:
+        """Creates the missing monthly partitions of table between both months, inclusive"""
+        existing = set(self.list_partitions(table))
+        created: List[str] = []
+
+        month = self.month_start(first_month)
+        while month <= last_month:
+            name = self.partition_name(table, month)
+            if name not in existing:
+                self._create_partition(table, name, month, self.add_months(month, 1))
+                created.append(name)
+            month = self.add_months(month, 1)
+
+        return created
+
+    def ensure_default_partition(self, table: str) -> None:
+        self.db.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+        )
+
+    def list_partitions(self, table: str) -> List[str]:
+        return list(
+            self.db.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = CAST(:table AS regclass) ORDER BY c.relname"
+                ),
+                {"table": table},
+            ).scalars()
+        )
+
+    def is_partitioned(self, table: str) -> bool:
+        return bool(self.db.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table))"
+            ),
+            {"table": table},
+        ).scalar_one())
+
+    @staticmethod
+    def partition_name(table: str, month: datetime) -> str:
+        return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+    @classmethod
+    def partition_bounds(cls, partition: str) -> Optional[Tuple[datetime, datetime]]:
+        """[start, end) of a monthly partition, None for the default partition"""
+        match = cls._PARTITION_NAME.search(partition)
+        if match is None:
+            return None
+
+        start = datetime(int(match.group(1)), int(match.group(2)), 1)
+        return start, cls.add_months(start, 1)
+
+    @staticmethod
+    def month_start(date: datetime) -> datetime:
+        return datetime(date.year, date.month, 1)
+
+    @staticmethod
+    def add_months(month: datetime, months: int) -> datetime:
+        index = month.year * 12 + month.month - 1 + months
+        return datetime(index // 12, index % 12 + 1, 1)
+
+    def _lock(self) -> None:
+        self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": self.ADVISORY_LOCK_KEY})
+
+    def _delete_rollup_days(self, rollup: str, start: datetime, end: datetime) -> List[str]:
+        """Deletes the rollup days in [start, end) and returns the users that had any"""
+        return list(
+            self.db.execute(
+                text(
+                    f"WITH deleted AS (DELETE FROM {rollup} WHERE day >= :start AND day < :end RETURNING user_id) "
+                    f"SELECT DISTINCT user_id FROM deleted"
+                ),
+                {"start": start, "end": end},
+            ).scalars()
+        )
+
+    def _create_partition(self, table: str, name: str, start: datetime, end: datetime) -> None:
+        # Postgres refuses a new partition while the default one holds rows of its range,
+        # so those rows are moved out and back in around the CREATE
+        bounds = {"start": start, "end": end}
+        default = f"{table}_default"
+        has_default = self.db.execute(text("SELECT to_regclass(:name)"), {"name": default}).scalar() is not None
+
+        if has_default:
+            self.db.execute(
+                text(
+                    f"CREATE TEMP TABLE {name}_moved AS "
+                    f"WITH moved AS (DELETE FROM {default} WHERE date >= :start AND date < :end RETURNING *) "
+                    f"SELECT * FROM moved"
+                ),
+                bounds,
+            )
+
+        self.db.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+
+        if has_default:
+            self.db.execute(text(f"INSERT INTO {table} SELECT * FROM {name}_moved"))
+            self.db.execute(text(f"DROP TABLE {name}_moved"))
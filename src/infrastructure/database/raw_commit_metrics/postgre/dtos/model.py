@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
 
 from src.infrastructure.database.connection.database_connection import Base
 
@@ -9,11 +9,12 @@ from src.infrastructure.database.connection.database_connection import Base
 class RawCommitMetrics(Base):
     __tablename__ = "raw_commit_metrics"
 
+    # Partitioned by month on date: Postgres requires the partition key in every unique key
     id = Column(String, primary_key=True, index=True)
     hash = Column(String)
     repository_name = Column(String)
     repository_team = Column(String, index=True)
-    date = Column(DateTime, index=True)
+    date = Column(DateTime, primary_key=True, index=True)
     author_name = Column(String)
     author_teams = Column(String, index=True)
     language = Column(String)
@@ -23,5 +24,9 @@ class RawCommitMetrics(Base):
     user_id = Column(String, index=True)
 
     __table_args__ = (
-        UniqueConstraint('user_id', 'hash', 'repository_name', 'language', name='unique_commit_per_repo_lang'),
+        UniqueConstraint('user_id', 'hash', 'repository_name', 'language', 'date', name='unique_commit_per_repo_lang'),
+        # Managed by schema migration 2, declared here so new databases get them too
+        Index('ix_raw_commit_metrics_user_id_date', 'user_id', 'date'),
+        Index('ix_raw_commit_metrics_user_id_language_date', 'user_id', 'language', 'date'),
+        {'postgresql_partition_by': 'RANGE (date)'},
     )
@@ -1,39 +1,100 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy import distinct, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
 
 from src.domain.entities.commit_metrics import CommitMetrics
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.bulk_insert_result import BulkInsertResult
+from src.domain.use_cases.dtos.calculated_metrics import CommitMetricsBreakdown
+from src.domain.use_cases.dtos.period_aggregates import CommitMetricsPeriodAggregate, CommitMetricsSlicePeriodAggregate
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+from src.infrastructure.database.database_utils import INSERT_BATCH_SIZE, batched, count_distinct_with_null, filter_whole_days, period_bucket
 from src.infrastructure.database.raw_commit_metrics.postgre.dtos.model import RawCommitMetrics
 from src.infrastructure.database.raw_commit_metrics.postgre.mappers.database_raw_commit_metrics import DatabaseRawCommitMetricsMapper
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 
 
 class RawCommitMetricsRepository:
+    BREAKDOWN_COLUMNS = {
+        "repository": RawCommitMetrics.repository_name,
+        "team": RawCommitMetrics.repository_team,
+        "language": RawCommitMetrics.language,
+        "author": RawCommitMetrics.author_name,
+    }
+
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.commit_metrics_daily_repository = CommitMetricsDailyRepository(db)
+        self.user_data_versions_repository = UserDataVersionsRepository(db)
 
     def create(self, commit_metrics: CommitMetrics) -> None:
-        record_to_save = DatabaseRawCommitMetricsMapper.to_database(commit_metrics)
+        self.create_many([commit_metrics])
+
+    def create_many(
+        self,
+        commit_metrics_list: List[CommitMetrics],
+        batch_size: int = INSERT_BATCH_SIZE,
+    ) -> BulkInsertResult:
+        """
+        Inserts the records batch_size rows per statement in a single transaction,
+        skipping duplicates (same hash, repository_name and language) with
+        ON CONFLICT DO NOTHING, and refreshes the daily rollup of every day that
+        received new rows. The unique key also holds date, the partition key,
+        which a commit's hash already determines.
+        """
+        inserted_days: Dict[str, Set[datetime]] = defaultdict(set)
+        inserted = 0
 
         try:
-            self.db.add(record_to_save)
+            # Every column is a bind parameter, so large batch sizes are capped per statement
+            for batch in batched(commit_metrics_list, batch_size, len(RawCommitMetrics.__table__.columns)):
+                records_to_save = [
+                    DatabaseRawCommitMetricsMapper.to_database(commit_metrics)
+                    for commit_metrics in batch
+                ]
+
+                stmt = insert(RawCommitMetrics).values([
+                    {
+                        'id': record.id,
+                        'hash': record.hash,
+                        'repository_name': record.repository_name,
+                        'repository_team': record.repository_team,
+                        'date': record.date,
+                        'author_name': record.author_name,
+                        'author_teams': record.author_teams,
+                        'language': record.language,
+                        'added_lines': record.added_lines,
+                        'removed_lines': record.removed_lines,
+                        'created_at': record.created_at,
+                        'user_id': record.user_id
+                    }
+                    for record in records_to_save
+                ])
+
+                # Only the rows actually inserted come back, duplicates leave the rollup untouched
+                returning_stmt = stmt.on_conflict_do_nothing(
+                    index_elements=['user_id', 'hash', 'repository_name', 'language', 'date']
+                ).returning(RawCommitMetrics.user_id, RawCommitMetrics.date)
+
+                for user_id, date in self.db.execute(returning_stmt):
+                    inserted_days[user_id].add(date)
+                    inserted += 1
+
+            for user_id, days in inserted_days.items():
+                self.commit_metrics_daily_repository.refresh_days(user_id, days)
+                self.user_data_versions_repository.bump(user_id)
+
             self.db.commit()
-        except IntegrityError:
+        except SQLAlchemyError:
             self.db.rollback()
-            # Silently ignore duplicate - record with this hash, repository_name, and language already exists
+            raise
 
-    def create_many(self, commit_metrics_list: List[CommitMetrics]) -> None:
-        # Process records individually to skip duplicates while inserting new ones
-        for commit_metrics in commit_metrics_list:
-            record_to_save = DatabaseRawCommitMetricsMapper.to_database(commit_metrics)
-
-            try:
-                self.db.add(record_to_save)
-                self.db.commit()
-            except IntegrityError:
-                self.db.rollback()
-                # Silently ignore duplicate - record with this hash, repository_name, and language already exists
+        return BulkInsertResult(inserted=inserted, skipped=len(commit_metrics_list) - inserted)
 
     def listByUserId(
         self,
@@ -42,24 +103,216 @@ class RawCommitMetricsRepository:
         final_date: Optional[datetime] = None,
         languages: Optional[List[str]] = None,
     ) -> List[CommitMetrics]:
-        query = self.db.query(RawCommitMetrics)
-
-        if initial_date:
-            query = query.filter(RawCommitMetrics.date >= initial_date)
-
-        if final_date:
-            query = query.filter(RawCommitMetrics.date <= final_date)
-
-        if languages:
-            query = query.filter(RawCommitMetrics.language.in_(languages))
+        query = self._filter_by_user_id(
+            self.db.query(RawCommitMetrics), user_id, initial_date, final_date, languages
+        )
 
-        records = query.filter(RawCommitMetrics.user_id == user_id).all()
+        records = query.all()
 
         commit_metrics = map(
             lambda record: DatabaseRawCommitMetricsMapper.to_domain(record), records
         )
 
         return list(commit_metrics)
+
+    def list_period_aggregates_by_user_id(
+        self,
+        user_id: str,
+        period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CommitMetricsPeriodAggregate]:
+        """
+        Buckets the commits by period in the database.
+        A commit touching several languages is stored as one row per language,
+        so rows are first collapsed per hash and bucketed by their latest date.
+        Returns one row per non-empty period, ordered by period start.
+        """
+        commits = self._commits_by_hash_query(
+            user_id, initial_date, final_date, languages
+        ).subquery()
+        bucket = period_bucket(commits.c.date, period).label("period_start")
+        query = self.db.query(
+            bucket,
+            func.coalesce(func.sum(commits.c.added_lines), 0),
+            func.coalesce(func.sum(commits.c.removed_lines), 0),
+            count_distinct_with_null(commits.c.author_name),
+            func.count(),
+        )
+
+        rows = query.group_by(bucket).order_by(bucket).all()
+
+        return [
+            CommitMetricsPeriodAggregate(
+                period_start=period_start,
+                added_lines=added_lines,
+                removed_lines=removed_lines,
+                number_of_authors=number_of_authors,
+                number_of_commits=number_of_commits,
+            )
+            for period_start, added_lines, removed_lines, number_of_authors, number_of_commits in rows
+        ]
+
+    def _commits_by_hash_query(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> Query[Any]:
+        """One row per commit hash with its latest date and the lines summed across languages"""
+        query = self._filter_by_user_id(
+            self.db.query(
+                RawCommitMetrics.hash,
+                func.max(RawCommitMetrics.date).label("date"),
+                func.sum(RawCommitMetrics.added_lines).label("added_lines"),
+                func.sum(RawCommitMetrics.removed_lines).label("removed_lines"),
+                func.max(RawCommitMetrics.author_name).label("author_name"),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        return query.group_by(RawCommitMetrics.user_id, RawCommitMetrics.hash)
+
+    def list_breakdown_by_user_id(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CommitMetricsBreakdown]:
+        """One row per combination of the group_by columns, ordered by them"""
+        columns = [self.BREAKDOWN_COLUMNS[name] for name in group_by]
+        query = self._filter_by_user_id(
+            self.db.query(
+                *columns,
+                func.coalesce(func.sum(RawCommitMetrics.added_lines), 0),
+                func.coalesce(func.sum(RawCommitMetrics.removed_lines), 0),
+                func.count(distinct(RawCommitMetrics.hash)),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(*columns).order_by(*columns).all()
+
+        return [
+            CommitMetricsBreakdown(
+                **dict(zip(group_by, row[: len(group_by)])),
+                added_lines=row[-3],
+                removed_lines=row[-2],
+                gross_productivity=row[-3] + row[-2],
+                number_of_commits=row[-1],
+            )
+            for row in rows
+        ]
+
+    def list_period_aggregates_by_slice(
+        self,
+        user_id: str,
+        period: Period,
+        slice_by: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CommitMetricsSlicePeriodAggregate]:
+        """
+        Period buckets per value of one BREAKDOWN_COLUMNS column, ordered by value and period.
+        A commit touching several languages counts once in each of them.
+        """
+        column = self.BREAKDOWN_COLUMNS[slice_by]
+        bucket = period_bucket(RawCommitMetrics.date, period).label("period_start")
+        query = self._filter_by_user_id(
+            self.db.query(
+                column,
+                bucket,
+                func.coalesce(func.sum(RawCommitMetrics.added_lines), 0),
+                func.coalesce(func.sum(RawCommitMetrics.removed_lines), 0),
+                func.count(distinct(RawCommitMetrics.hash)),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(column, bucket).order_by(column, bucket).all()
+
+        return [
+            CommitMetricsSlicePeriodAggregate(
+                slice_value=slice_value,
+                period_start=period_start,
+                added_lines=added_lines,
+                removed_lines=removed_lines,
+                number_of_commits=number_of_commits,
+            )
+            for slice_value, period_start, added_lines, removed_lines, number_of_commits in rows
+        ]
+
+    def list_languages_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Distinct languages ordered by the day they first appear, then by name,
+        like CommitMetricsDailyRepository.list_languages_by_user_id
+        """
+        first_seen = period_bucket(func.min(RawCommitMetrics.date), Period.DAILY)
+        query = self._filter_by_user_id(
+            self.db.query(RawCommitMetrics.language),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(RawCommitMetrics.language).order_by(
+            first_seen, RawCommitMetrics.language
+        ).all()
+
+        return [language for (language,) in rows]
+
+    def count_authors_by_user_id(
+        self,
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> int:
+        query = self._filter_by_user_id(
+            self.db.query(count_distinct_with_null(RawCommitMetrics.author_name)),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        return int(query.scalar() or 0)
+
+    def _filter_by_user_id(
+        self,
+        query: Query[Any],
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> Query[Any]:
+        query = filter_whole_days(query, RawCommitMetrics.date, initial_date, final_date)
+
+        if languages:
+            query = query.filter(RawCommitMetrics.language.in_(languages))
+
+        return query.filter(RawCommitMetrics.user_id == user_id)
     
     def deleteByUserId(
         self, 
@@ -67,4 +320,6 @@ class RawCommitMetricsRepository:
     ) -> None:
         query = self.db.query(RawCommitMetrics)
         query.filter(RawCommitMetrics.user_id == user_id).delete()
+        self.commit_metrics_daily_repository.delete_by_user_id(user_id)
+        self.user_data_versions_repository.bump(user_id)
         self.db.commit()
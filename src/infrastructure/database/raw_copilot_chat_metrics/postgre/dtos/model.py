@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
 
 from src.infrastructure.database.connection.database_connection import Base
 
@@ -8,11 +8,15 @@ class RawCopilotChatMetrics(Base):
     __tablename__ = "raw_copilot_chat_metrics"
     __table_args__ = (
         UniqueConstraint('user_id', 'team_name', 'date', 'ide', 'copilot_model', name='uq_team_date_ide_model'),
+        # Managed by schema migration 2, declared here so new databases get them too
+        Index('ix_raw_copilot_chat_metrics_user_id_date', 'user_id', 'date'),
+        {'postgresql_partition_by': 'RANGE (date)'},
     )
 
+    # Partitioned by month on date: Postgres requires the partition key in every unique key
     id = Column(String, primary_key=True, index=True)
     team_name = Column(String, index=True)
-    date = Column(DateTime, index=True)
+    date = Column(DateTime, primary_key=True, index=True)
     ide = Column(String)
     copilot_model = Column(String)
     total_users = Column(Integer)
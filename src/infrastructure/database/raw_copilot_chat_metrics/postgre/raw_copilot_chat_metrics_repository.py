@@ -1,16 +1,35 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.domain.entities.copilot_chat_metrics import CopilotChatMetrics
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.database_utils import INSERT_BATCH_SIZE, filter_whole_days, row_values, upsert_values
 from src.infrastructure.database.raw_copilot_chat_metrics.postgre.dtos.model import RawCopilotChatMetrics
 from src.infrastructure.database.raw_copilot_chat_metrics.postgre.mappers.database_raw_copilot_chat_metrics import DatabaseRawCopilotChatMetricsMapper
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 
 class RawCopilotChatMetricsRepository:
+    UPSERT_COLUMNS = [
+        'id',
+        'team_name',
+        'date',
+        'ide',
+        'copilot_model',
+        'total_users',
+        'total_chats',
+        'copy_events',
+        'insertion_events',
+        'created_at',
+        'user_id',
+    ]
+
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.copilot_chat_metrics_daily_repository = CopilotChatMetricsDailyRepository(db)
+        self.user_data_versions_repository = UserDataVersionsRepository(db)
 
     def create(self, copilot_chat_metrics: CopilotChatMetrics) -> None:
         record_to_save = DatabaseRawCopilotChatMetricsMapper.to_database(
@@ -18,13 +37,24 @@ class RawCopilotChatMetricsRepository:
         )
 
         self.db.add(record_to_save)
+        self.db.flush()
+        self.copilot_chat_metrics_daily_repository.refresh_days(
+            copilot_chat_metrics.user_id, [copilot_chat_metrics.date]
+        )
+        self.user_data_versions_repository.bump(copilot_chat_metrics.user_id)
         self.db.commit()
 
-    def upsert_many(self, copilot_chat_metrics_list: List[CopilotChatMetrics]) -> None:
+    def upsert_many(
+        self,
+        copilot_chat_metrics_list: List[CopilotChatMetrics],
+        chunk_size: int = INSERT_BATCH_SIZE,
+    ) -> None:
         """
         Bulk upsert copilot chat metrics.
         Uses unique constraint on (team_name, date, ide, copilot_model) to detect duplicates.
         On conflict, updates metric values and metadata while preserving id and created_at.
+        Rows are sent chunk_size at a time with execute_values, all in one transaction.
+        The daily rollup of every upserted day is refreshed in the same transaction.
         """
         if not copilot_chat_metrics_list:
             return
@@ -36,38 +66,26 @@ class RawCopilotChatMetricsRepository:
                 for metrics in copilot_chat_metrics_list
             ]
 
-            # Build insert statement
-            stmt = insert(RawCopilotChatMetrics).values([
-                {
-                    'id': record.id,
-                    'team_name': record.team_name,
-                    'date': record.date,
-                    'ide': record.ide,
-                    'copilot_model': record.copilot_model,
-                    'total_users': record.total_users,
-                    'total_chats': record.total_chats,
-                    'copy_events': record.copy_events,
-                    'insertion_events': record.insertion_events,
-                    'created_at': record.created_at,
-                    'user_id': record.user_id
-                }
-                for record in records_to_save
-            ])
-
-            # Handle conflicts on unique constraint (team_name, date, ide, copilot_model)
-            # Update metric values and metadata, preserve id and created_at
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['user_id', 'team_name', 'date', 'ide', 'copilot_model'],
-                set_={
-                    'total_users': stmt.excluded.total_users,
-                    'total_chats': stmt.excluded.total_chats,
-                    'copy_events': stmt.excluded.copy_events,
-                    'insertion_events': stmt.excluded.insertion_events,
-                }
+            upsert_values(
+                self.db,
+                RawCopilotChatMetrics.__tablename__,
+                self.UPSERT_COLUMNS,
+                [row_values(record, self.UPSERT_COLUMNS) for record in records_to_save],
+                # Unique constraint (team_name, date, ide, copilot_model), scoped by user_id
+                conflict_columns=['user_id', 'team_name', 'date', 'ide', 'copilot_model'],
+                # Update metric values and metadata, preserve id and created_at
+                update_columns=['total_users', 'total_chats', 'copy_events', 'insertion_events'],
+                page_size=chunk_size,
             )
 
-            # Execute and commit once
-            self.db.execute(stmt)
+            upserted_days: Dict[str, Set[datetime]] = defaultdict(set)
+            for metrics in copilot_chat_metrics_list:
+                upserted_days[metrics.user_id].add(metrics.date)
+            for user_id, days in upserted_days.items():
+                self.copilot_chat_metrics_daily_repository.refresh_days(user_id, days)
+                self.user_data_versions_repository.bump(user_id)
+
+            # Commit raw rows and rollup together
             self.db.commit()
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -81,13 +99,9 @@ class RawCopilotChatMetricsRepository:
         initial_date: Optional[datetime] = None,
         final_date: Optional[datetime] = None,
     ) -> List[CopilotChatMetrics]:
-        query = self.db.query(RawCopilotChatMetrics)
-
-        if initial_date:
-            query = query.filter(RawCopilotChatMetrics.date >= initial_date)
-
-        if final_date:
-            query = query.filter(RawCopilotChatMetrics.date <= final_date)
+        query = filter_whole_days(
+            self.db.query(RawCopilotChatMetrics), RawCopilotChatMetrics.date, initial_date, final_date
+        )
 
         records = query.filter(RawCopilotChatMetrics.user_id == user_id).all()
 
@@ -104,4 +118,6 @@ class RawCopilotChatMetricsRepository:
     ) -> None:
         query = self.db.query(RawCopilotChatMetrics)
         query.filter(RawCopilotChatMetrics.user_id == user_id).delete()
+        self.copilot_chat_metrics_daily_repository.delete_by_user_id(user_id)
+        self.user_data_versions_repository.bump(user_id)
         self.db.commit()
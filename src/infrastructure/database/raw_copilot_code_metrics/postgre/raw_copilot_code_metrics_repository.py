@@ -1,17 +1,49 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.domain.entities.copilot_code_metrics import CopilotCodeMetrics
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsBreakdown
+from src.domain.use_cases.dtos.period_aggregates import CopilotCodeMetricsPeriodAggregate, CopilotCodeMetricsSlicePeriodAggregate
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+from src.infrastructure.database.database_utils import INSERT_BATCH_SIZE, filter_whole_days, period_bucket, row_values, upsert_values
 from src.infrastructure.database.raw_copilot_code_metrics.postgre.dtos.model import RawCopilotCodeMetrics
 from src.infrastructure.database.raw_copilot_code_metrics.postgre.mappers.database_raw_copilot_code_metrics import DatabaseRawCopilotCodeMetricsMapper
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
 
 class RawCopilotCodeMetricsRepository:
+    BREAKDOWN_COLUMNS = {
+        "team": RawCopilotCodeMetrics.team_name,
+        "language": RawCopilotCodeMetrics.language,
+        "IDE": RawCopilotCodeMetrics.ide,
+        "copilot_model": RawCopilotCodeMetrics.copilot_model,
+    }
+
+    UPSERT_COLUMNS = [
+        'id',
+        'team_name',
+        'date',
+        'ide',
+        'copilot_model',
+        'language',
+        'total_users',
+        'code_acceptances',
+        'code_suggestions',
+        'lines_accepted',
+        'lines_suggested',
+        'created_at',
+        'user_id',
+    ]
+
     def __init__(self, db: Session) -> None:
         self.db = db
+        self.copilot_code_metrics_daily_repository = CopilotCodeMetricsDailyRepository(db)
+        self.user_data_versions_repository = UserDataVersionsRepository(db)
 
     def create(self, copilot_code_metrics: CopilotCodeMetrics) -> None:
         record_to_save = DatabaseRawCopilotCodeMetricsMapper.to_database(
@@ -19,13 +51,24 @@ class RawCopilotCodeMetricsRepository:
         )
 
         self.db.add(record_to_save)
+        self.db.flush()
+        self.copilot_code_metrics_daily_repository.refresh_days(
+            copilot_code_metrics.user_id, [copilot_code_metrics.date]
+        )
+        self.user_data_versions_repository.bump(copilot_code_metrics.user_id)
         self.db.commit()
 
-    def upsert_many(self, copilot_code_metrics_list: List[CopilotCodeMetrics]) -> None:
+    def upsert_many(
+        self,
+        copilot_code_metrics_list: List[CopilotCodeMetrics],
+        chunk_size: int = INSERT_BATCH_SIZE,
+    ) -> None:
         """
         Bulk upsert copilot code metrics.
         Uses unique constraint on (date, ide, copilot_model, language) to detect duplicates.
         On conflict, updates metric values and metadata while preserving id and created_at.
+        Rows are sent chunk_size at a time with execute_values, all in one transaction.
+        The daily rollup of every upserted day is refreshed in the same transaction.
         """
         if not copilot_code_metrics_list:
             return
@@ -37,42 +80,26 @@ class RawCopilotCodeMetricsRepository:
                 for metrics in copilot_code_metrics_list
             ]
 
-            # Build insert statement with conflict resolution
-            stmt = insert(RawCopilotCodeMetrics).values([
-                {
-                    'id': record.id,
-                    'team_name': record.team_name,
-                    'date': record.date,
-                    'ide': record.ide,
-                    'copilot_model': record.copilot_model,
-                    'language': record.language,
-                    'total_users': record.total_users,
-                    'code_acceptances': record.code_acceptances,
-                    'code_suggestions': record.code_suggestions,
-                    'lines_accepted': record.lines_accepted,
-                    'lines_suggested': record.lines_suggested,
-                    'created_at': record.created_at,
-                    'user_id': record.user_id
-                }
-                for record in records_to_save
-            ])
-
-            # Handle conflicts on unique constraint (date, ide, copilot_model, language)
-            # Update metric values and metadata, preserve id and created_at
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['user_id', 'date', 'ide', 'copilot_model', 'language'],
-                set_={
-                    'team_name': stmt.excluded.team_name,
-                    'total_users': stmt.excluded.total_users,
-                    'code_acceptances': stmt.excluded.code_acceptances,
-                    'code_suggestions': stmt.excluded.code_suggestions,
-                    'lines_accepted': stmt.excluded.lines_accepted,
-                    'lines_suggested': stmt.excluded.lines_suggested
-                }
+            upsert_values(
+                self.db,
+                RawCopilotCodeMetrics.__tablename__,
+                self.UPSERT_COLUMNS,
+                [row_values(record, self.UPSERT_COLUMNS) for record in records_to_save],
+                # Unique constraint (date, ide, copilot_model, language), scoped by user_id
+                conflict_columns=['user_id', 'date', 'ide', 'copilot_model', 'language'],
+                # Update metric values and metadata, preserve id and created_at
+                update_columns=['team_name', 'total_users', 'code_acceptances', 'code_suggestions', 'lines_accepted', 'lines_suggested'],
+                page_size=chunk_size,
             )
 
-            # Execute and commit once
-            self.db.execute(stmt)
+            upserted_days: Dict[str, Set[datetime]] = defaultdict(set)
+            for metrics in copilot_code_metrics_list:
+                upserted_days[metrics.user_id].add(metrics.date)
+            for user_id, days in upserted_days.items():
+                self.copilot_code_metrics_daily_repository.refresh_days(user_id, days)
+                self.user_data_versions_repository.bump(user_id)
+
+            # Commit raw rows and rollup together
             self.db.commit()
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -87,18 +114,11 @@ class RawCopilotCodeMetricsRepository:
         final_date: Optional[datetime] = None,
         languages: Optional[List[str]] = None,
     ) -> List[CopilotCodeMetrics]:
-        query = self.db.query(RawCopilotCodeMetrics)
-
-        if initial_date:
-            query = query.filter(RawCopilotCodeMetrics.date >= initial_date)
-
-        if final_date:
-            query = query.filter(RawCopilotCodeMetrics.date <= final_date)
-
-        if languages:
-            query = query.filter(RawCopilotCodeMetrics.language.in_(languages))
+        query = self._filter_by_user_id(
+            self.db.query(RawCopilotCodeMetrics), user_id, initial_date, final_date, languages
+        )
 
-        records = query.filter(RawCopilotCodeMetrics.user_id == user_id).all()
+        records = query.all()
 
         copilot_code_metrics = map(
             lambda record: DatabaseRawCopilotCodeMetricsMapper.to_domain(record),
@@ -106,6 +126,134 @@ class RawCopilotCodeMetricsRepository:
         )
 
         return list(copilot_code_metrics)
+
+    def list_period_aggregates_by_user_id(
+        self,
+        user_id: str,
+        period: Period,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotCodeMetricsPeriodAggregate]:
+        """
+        Buckets the code metrics by period in the database.
+        Returns one row per non-empty period, ordered by period start.
+        """
+        bucket = period_bucket(RawCopilotCodeMetrics.date, period).label("period_start")
+        query = self._filter_by_user_id(
+            self.db.query(
+                bucket,
+                func.coalesce(func.sum(RawCopilotCodeMetrics.code_acceptances), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.code_suggestions), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_accepted), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_suggested), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(bucket).order_by(bucket).all()
+
+        return [
+            CopilotCodeMetricsPeriodAggregate(
+                period_start=period_start,
+                code_acceptances=code_acceptances,
+                code_suggestions=code_suggestions,
+                lines_accepted=lines_accepted,
+                lines_suggested=lines_suggested,
+            )
+            for period_start, code_acceptances, code_suggestions, lines_accepted, lines_suggested in rows
+        ]
+
+    def list_breakdown_by_user_id(
+        self,
+        user_id: str,
+        group_by: List[str],
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotMetricsBreakdown]:
+        """One row per combination of the group_by columns, ordered by them"""
+        columns = [self.BREAKDOWN_COLUMNS[name] for name in group_by]
+        query = self._filter_by_user_id(
+            self.db.query(
+                *columns,
+                func.coalesce(func.sum(RawCopilotCodeMetrics.code_acceptances), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.code_suggestions), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_accepted), 0),
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_suggested), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(*columns).order_by(*columns).all()
+
+        return [
+            CopilotMetricsBreakdown(
+                **dict(zip(group_by, row[: len(group_by)])),
+                code_acceptances=row[-4],
+                code_suggestions=row[-3],
+                lines_accepted=row[-2],
+                lines_suggested=row[-1],
+                relative_use_of_AI=row[-2] / row[-1] if row[-1] > 0 else 0.0,
+            )
+            for row in rows
+        ]
+
+    def list_period_aggregates_by_slice(
+        self,
+        user_id: str,
+        period: Period,
+        slice_by: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[CopilotCodeMetricsSlicePeriodAggregate]:
+        """Period buckets per value of one BREAKDOWN_COLUMNS column, ordered by value and period"""
+        column = self.BREAKDOWN_COLUMNS[slice_by]
+        bucket = period_bucket(RawCopilotCodeMetrics.date, period).label("period_start")
+        query = self._filter_by_user_id(
+            self.db.query(
+                column,
+                bucket,
+                func.coalesce(func.sum(RawCopilotCodeMetrics.lines_accepted), 0),
+            ),
+            user_id,
+            initial_date,
+            final_date,
+            languages,
+        )
+
+        rows = query.group_by(column, bucket).order_by(column, bucket).all()
+
+        return [
+            CopilotCodeMetricsSlicePeriodAggregate(
+                slice_value=slice_value,
+                period_start=period_start,
+                lines_accepted=lines_accepted,
+            )
+            for slice_value, period_start, lines_accepted in rows
+        ]
+
+    def _filter_by_user_id(
+        self,
+        query: Query[Any],
+        user_id: str,
+        initial_date: Optional[datetime] = None,
+        final_date: Optional[datetime] = None,
+        languages: Optional[List[str]] = None,
+    ) -> Query[Any]:
+        query = filter_whole_days(query, RawCopilotCodeMetrics.date, initial_date, final_date)
+
+        if languages:
+            query = query.filter(RawCopilotCodeMetrics.language.in_(languages))
+
+        return query.filter(RawCopilotCodeMetrics.user_id == user_id)
     
     def deleteByUserId(
         self, 
@@ -113,4 +261,6 @@ class RawCopilotCodeMetricsRepository:
     ) -> None:
         query = self.db.query(RawCopilotCodeMetrics)
         query.filter(RawCopilotCodeMetrics.user_id == user_id).delete()
+        self.copilot_code_metrics_daily_repository.delete_by_user_id(user_id)
+        self.user_data_versions_repository.bump(user_id)
         self.db.commit()
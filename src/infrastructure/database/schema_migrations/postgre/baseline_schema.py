@@ -0,0 +1,152 @@
+# Frozen copy of the tables as they were when migration 1 was released. Migration 1
+# creates these and nothing else, so later model changes never leak into it: a
+# change to the models ships as a new migration instead. Do not edit.
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, UniqueConstraint
+
+BASELINE_METADATA = MetaData()
+
+Table(
+    "users", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("username", String, index=True),
+    Column("hashed_password", String),
+    Column("full_name", String(255)),
+    Column("enterprise_name", String(255), nullable=True),
+    Column("email", String(255), index=True),
+    Column("cellphone", String(20)),
+    Column("cpf_cnpj", String(18), index=True),
+    Column("created_at", DateTime),
+    UniqueConstraint("username", name="users_username_key"),
+    UniqueConstraint("email", name="users_email_key"),
+    UniqueConstraint("cpf_cnpj", name="users_cpf_cnpj_key"),
+)
+
+Table(
+    "api_keys", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("user_id", String, index=True),
+    Column("key_name", String(255)),
+    Column("key_hash", String),
+    Column("key_prefix", String(20)),
+    Column("created_at", DateTime),
+    Column("last_used_at", DateTime, nullable=True),
+    Column("expires_at", DateTime, nullable=True),
+)
+
+Table(
+    "github_apps", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("organization_name", String),
+    Column("app_id", String),
+    Column("installation_id", String),
+    Column("private_key_encrypted", String),
+    Column("user_id", String, index=True),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "report_config", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("emails", String),
+    Column("period", String),
+    Column("user_id", String, index=True),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "raw_commit_metrics", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("hash", String),
+    Column("repository_name", String),
+    Column("repository_team", String, index=True),
+    Column("date", DateTime, index=True),
+    Column("author_name", String),
+    Column("author_teams", String, index=True),
+    Column("language", String),
+    Column("added_lines", Integer),
+    Column("removed_lines", Integer),
+    Column("created_at", DateTime),
+    Column("user_id", String, index=True),
+    UniqueConstraint("user_id", "hash", "repository_name", "language", name="unique_commit_per_repo_lang"),
+)
+
+Table(
+    "raw_copilot_code_metrics", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("team_name", String, index=True),
+    Column("date", DateTime, index=True),
+    Column("ide", String),
+    Column("copilot_model", String),
+    Column("language", String),
+    Column("total_users", Integer),
+    Column("code_acceptances", Integer),
+    Column("code_suggestions", Integer),
+    Column("lines_accepted", Integer),
+    Column("lines_suggested", Integer),
+    Column("created_at", DateTime),
+    Column("user_id", String),
+    UniqueConstraint("user_id", "date", "ide", "copilot_model", "language", name="uq_date_ide_model_language_code"),
+)
+
+Table(
+    "raw_copilot_chat_metrics", BASELINE_METADATA,
+    Column("id", String, primary_key=True, index=True),
+    Column("team_name", String, index=True),
+    Column("date", DateTime, index=True),
+    Column("ide", String),
+    Column("copilot_model", String),
+    Column("total_users", Integer),
+    Column("total_chats", Integer),
+    Column("copy_events", Integer),
+    Column("insertion_events", Integer),
+    Column("created_at", DateTime),
+    Column("user_id", String),
+    UniqueConstraint("user_id", "team_name", "date", "ide", "copilot_model", name="uq_team_date_ide_model"),
+)
+
+Table(
+    "commit_metrics_daily", BASELINE_METADATA,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("user_id", String, nullable=False),
+    Column("day", DateTime, nullable=False),
+    Column("language", String),
+    Column("repository_name", String),
+    Column("author_name", String),
+    Column("added_lines", Integer, nullable=False),
+    Column("removed_lines", Integer, nullable=False),
+    Column("commits", Integer, nullable=False),
+    UniqueConstraint("user_id", "day", "language", "repository_name", "author_name", name="uq_commit_metrics_daily_key"),
+    Index("ix_commit_metrics_daily_user_id_day", "user_id", "day"),
+)
+
+Table(
+    "copilot_code_metrics_daily", BASELINE_METADATA,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("user_id", String, nullable=False),
+    Column("day", DateTime, nullable=False),
+    Column("language", String),
+    Column("ide", String),
+    Column("copilot_model", String),
+    Column("total_users", Integer, nullable=False),
+    Column("code_acceptances", Integer, nullable=False),
+    Column("code_suggestions", Integer, nullable=False),
+    Column("lines_accepted", Integer, nullable=False),
+    Column("lines_suggested", Integer, nullable=False),
+    UniqueConstraint("user_id", "day", "language", "ide", "copilot_model", name="uq_copilot_code_metrics_daily_key"),
+    Index("ix_copilot_code_metrics_daily_user_id_day", "user_id", "day"),
+)
+
+Table(
+    "copilot_chat_metrics_daily", BASELINE_METADATA,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("user_id", String, nullable=False),
+    Column("day", DateTime, nullable=False),
+    Column("ide", String),
+    Column("copilot_model", String),
+    Column("total_users", Integer, nullable=False),
+    Column("total_chats", Integer, nullable=False),
+    Column("copy_events", Integer, nullable=False),
+    Column("insertion_events", Integer, nullable=False),
+    UniqueConstraint("user_id", "day", "ide", "copilot_model", name="uq_copilot_chat_metrics_daily_key"),
+    Index("ix_copilot_chat_metrics_daily_user_id_day", "user_id", "day"),
+)
@@ -0,0 +1,14 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from src.infrastructure.database.connection.database_connection import Base
+
+
+class SchemaMigration(Base):
+    """One applied migration of src/infrastructure/database/schema_migrations/postgre/migrations.py"""
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,299 @@
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.commit_metrics_daily.postgre.commit_metrics_daily_repository import CommitMetricsDailyRepository
+from src.infrastructure.database.copilot_chat_metrics_daily.postgre.copilot_chat_metrics_daily_repository import CopilotChatMetricsDailyRepository
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+from src.infrastructure.database.schema_migrations.postgre.baseline_schema import BASELINE_METADATA
+from src.infrastructure.database.metrics_partitions.postgre.metrics_partitions_repository import MetricsPartitionsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    """
+    One schema version. Transactional migrations run and get recorded in a single
+    transaction; the others (CREATE INDEX CONCURRENTLY) run in autocommit mode
+    and must be idempotent, since a crash can leave them half applied. Manual
+    migrations rewrite large tables: startup refuses to apply them, they run
+    through `python scripts/manage_db.py migrate`, unless runs_online_if finds
+    the rewrite cheap on this database (say, its tables are still empty).
+    """
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+    transactional: bool = True
+    manual: bool = False
+    runs_online_if: Optional[Callable[[Connection], bool]] = None
+
+
+class ManagedIndex(NamedTuple):
+    name: str
+    table: str
+    columns: List[str]
+
+
+RAW_METRICS_INDEXES = [
+    ManagedIndex("ix_raw_commit_metrics_user_id_date", "raw_commit_metrics", ["user_id", "date"]),
+    ManagedIndex("ix_raw_commit_metrics_user_id_language_date", "raw_commit_metrics", ["user_id", "language", "date"]),
+    ManagedIndex("ix_raw_copilot_code_metrics_user_id_date", "raw_copilot_code_metrics", ["user_id", "date"]),
+    ManagedIndex("ix_raw_copilot_code_metrics_user_id_language_date", "raw_copilot_code_metrics", ["user_id", "language", "date"]),
+    ManagedIndex("ix_raw_copilot_chat_metrics_user_id_date", "raw_copilot_chat_metrics", ["user_id", "date"]),
+]
+
+
+def create_index_concurrently(connection: Connection, index: ManagedIndex) -> None:
+    """Builds the index without blocking writes. Needs an autocommit connection"""
+    is_valid = connection.execute(
+        text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+        ),
+        {"name": index.name},
+    ).scalar()
+
+    if is_valid is False:
+        # A failed concurrent build leaves an invalid index behind, which IF NOT EXISTS would keep
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"))
+
+    connection.execute(
+        text(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index.name} "
+            f"ON {index.table} ({', '.join(index.columns)})"
+        )
+    )
+
+
+def create_baseline_tables(connection: Connection) -> None:
+    # Creates only the missing tables, so databases set up before migrations existed are adopted as is
+    BASELINE_METADATA.create_all(bind=connection)
+
+
+def create_raw_metrics_indexes(connection: Connection) -> None:
+    for index in RAW_METRICS_INDEXES:
+        create_index_concurrently(connection, index)
+
+
+class PartitionedKeys(NamedTuple):
+    unique_name: str
+    unique_columns: List[str]
+    indexed_columns: List[str]
+
+
+# Keys of the partitioned raw tables as released with migration 3: every unique key gains date
+PARTITIONED_KEYS = {
+    "raw_commit_metrics": PartitionedKeys(
+        "unique_commit_per_repo_lang",
+        ["user_id", "hash", "repository_name", "language", "date"],
+        ["id", "repository_team", "date", "author_teams", "user_id"],
+    ),
+    "raw_copilot_code_metrics": PartitionedKeys(
+        "uq_date_ide_model_language_code",
+        ["user_id", "date", "ide", "copilot_model", "language"],
+        ["id", "team_name", "date"],
+    ),
+    "raw_copilot_chat_metrics": PartitionedKeys(
+        "uq_team_date_ide_model",
+        ["user_id", "team_name", "date", "ide", "copilot_model"],
+        ["id", "team_name", "date"],
+    ),
+}
+
+
+def partition_raw_metrics_tables(connection: Connection) -> None:
+    """
+    Moves each raw metrics table into a partitioned one with monthly partitions up
+    to MONTHS_AHEAD months from now. The swap is one short transaction, then the
+    rows are copied one month per transaction, so writers only wait for the month
+    being copied; reads miss the months not copied yet until it finishes. Picks up
+    where it stopped if interrupted.
+    """
+    for name in MetricsPartitionsRepository.PARTITIONED_TABLES:
+        old = f"{name}_unpartitioned"
+
+        with connection.engine.begin() as transaction:
+            if not MetricsPartitionsRepository(Session(bind=transaction)).is_partitioned(name):
+                _reject_rows_without_date(transaction, name)
+                _swap_for_partitioned(transaction, name, old)
+
+        if connection.execute(text("SELECT to_regclass(:name)"), {"name": old}).scalar() is not None:
+            _copy_by_month(connection, name, old)
+            connection.execute(text(f"DROP TABLE {old}"))
+
+        with connection.engine.begin() as transaction:
+            partitions_repository = MetricsPartitionsRepository(Session(bind=transaction))
+            this_month = MetricsPartitionsRepository.month_start(datetime.now())
+            partitions_repository.ensure_default_partition(name)
+            partitions_repository.ensure_partitions(
+                name, this_month, MetricsPartitionsRepository.add_months(this_month, MetricsPartitionsRepository.MONTHS_AHEAD)
+            )
+            _ensure_partitioned_indexes(transaction, name)
+
+
+def raw_metrics_tables_are_empty(connection: Connection) -> bool:
+    # Nothing to copy, so partitioning is as quick as any online migration (a fresh database)
+    return all(
+        connection.execute(text(f"SELECT NOT EXISTS (SELECT 1 FROM {table})")).scalar_one()
+        for table in MetricsPartitionsRepository.PARTITIONED_TABLES
+    )
+
+
+def _reject_rows_without_date(connection: Connection, table: str) -> None:
+    # date becomes part of the primary key, which cannot hold NULL
+    missing = connection.execute(text(f"SELECT count(*) FROM {table} WHERE date IS NULL")).scalar_one()
+    if missing:
+        raise RuntimeError(
+            f"{table} has {missing} rows without a date, which the partitioned table cannot hold. "
+            f"Delete them or fill in their date, then run the migration again"
+        )
+
+
+def _swap_for_partitioned(connection: Connection, table: str, old: str) -> None:
+    """Renames table away and creates the empty partitioned table, with a partition for every month it holds"""
+    connection.execute(text(f"ALTER TABLE {table} RENAME TO {old}"))
+
+    # Index names are schema wide, the partitioned table needs them back. Renaming an index
+    # renames its constraint too, and the old date index keeps the monthly copy cheap
+    indexes = connection.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": old}
+    ).scalars().all()
+    for index in indexes:
+        connection.execute(text(f'ALTER INDEX "{index}" RENAME TO "{index}_unpartitioned"'))
+
+    keys = PARTITIONED_KEYS[table]
+    connection.execute(text(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE (date)"))
+    connection.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, date)"))
+    connection.execute(
+        text(f"ALTER TABLE {table} ADD CONSTRAINT {keys.unique_name} UNIQUE ({', '.join(keys.unique_columns)})")
+    )
+    for column in keys.indexed_columns:
+        connection.execute(text(f"CREATE INDEX ix_{table}_{column} ON {table} ({column})"))
+    _ensure_partitioned_indexes(connection, table)
+
+    partitions_repository = MetricsPartitionsRepository(Session(bind=connection))
+    oldest, newest = connection.execute(text(f"SELECT min(date), max(date) FROM {old}")).one()
+    this_month = MetricsPartitionsRepository.month_start(datetime.now())
+    partitions_repository.ensure_default_partition(table)
+    partitions_repository.ensure_partitions(
+        table,
+        min(MetricsPartitionsRepository.month_start(oldest), this_month) if oldest else this_month,
+        max(MetricsPartitionsRepository.month_start(newest), this_month) if newest else this_month,
+    )
+
+
+def _copy_by_month(connection: Connection, table: str, old: str) -> None:
+    """Moves the rows of old into table one month per transaction, oldest first"""
+    oldest, newest = connection.execute(text(f"SELECT min(date), max(date) FROM {old}")).one()
+    if oldest is None:
+        return
+
+    columns = ", ".join(
+        connection.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = :table ORDER BY ordinal_position"
+            ),
+            {"table": old},
+        ).scalars()
+    )
+
+    month = MetricsPartitionsRepository.month_start(oldest)
+    while month <= newest:
+        bounds = {"start": month, "end": MetricsPartitionsRepository.add_months(month, 1)}
+        with connection.engine.begin() as transaction:
+            # Rows written through the new table meanwhile win over their old copy
+            transaction.execute(
+                text(
+                    f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {old} "
+                    f"WHERE date >= :start AND date < :end ON CONFLICT DO NOTHING"
+                ),
+                bounds,
+            )
+            transaction.execute(text(f"DELETE FROM {old} WHERE date >= :start AND date < :end"), bounds)
+        logger.info(f"Copied {table} rows of {month:%Y-%m}")
+        month = bounds["end"]
+
+
+def _ensure_partitioned_indexes(connection: Connection, table: str) -> None:
+    """
+    Migration 2's indexes on the partitioned table. Postgres cannot build an index
+    CONCURRENTLY on a partitioned table, so a plain CREATE INDEX builds it on every
+    partition at once; an invalid leftover is dropped first, IF NOT EXISTS would keep it.
+    """
+    for index in RAW_METRICS_INDEXES:
+        if index.table != table:
+            continue
+
+        is_valid = connection.execute(
+            text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+            ),
+            {"name": index.name},
+        ).scalar()
+
+        if is_valid is False:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+        connection.execute(
+            text(f"CREATE INDEX IF NOT EXISTS {index.name} ON {index.table} ({', '.join(index.columns)})")
+        )
+
+
+def create_user_data_versions(connection: Connection) -> None:
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS user_data_versions ("
+            "user_id VARCHAR PRIMARY KEY, version BIGINT NOT NULL DEFAULT 0)"
+        )
+    )
+
+
+# Rollup rebuild of one user, by the raw table it is built from
+ROLLUP_BACKFILLS: Dict[str, Callable[[Session, str], None]] = {
+    "raw_commit_metrics": lambda db, user_id: CommitMetricsDailyRepository(db).rebuild(user_id),
+    "raw_copilot_code_metrics": lambda db, user_id: CopilotCodeMetricsDailyRepository(db).rebuild(user_id),
+    "raw_copilot_chat_metrics": lambda db, user_id: CopilotChatMetricsDailyRepository(db).rebuild(user_id),
+}
+
+
+def backfill_metrics_rollups(connection: Connection) -> None:
+    """
+    Builds the daily rollups from the raw rows written before the rollups existed.
+    One user per transaction, under that user's rollup lock, so ingestion keeps
+    running; a rebuild replaces the user's rows, so a rerun after a crash is safe.
+    """
+    for raw_table, rebuild in ROLLUP_BACKFILLS.items():
+        user_ids = connection.execute(
+            text(f"SELECT DISTINCT user_id FROM {raw_table} WHERE user_id IS NOT NULL")
+        ).scalars().all()
+
+        for user_id in user_ids:
+            with connection.engine.begin() as transaction:
+                rebuild(Session(bind=transaction), user_id)
+        logger.info(f"Backfilled the rollups of {raw_table} for {len(user_ids)} users")
+
+
+# Append only: never edit or reorder a migration that has been released
+MIGRATIONS = [
+    Migration(1, "baseline_tables", create_baseline_tables),
+    Migration(2, "raw_metrics_user_indexes", create_raw_metrics_indexes, transactional=False),
+    Migration(
+        3,
+        "raw_metrics_monthly_partitions",
+        partition_raw_metrics_tables,
+        transactional=False,
+        manual=True,
+        runs_online_if=raw_metrics_tables_are_empty,
+    ),
+    Migration(4, "user_data_versions", create_user_data_versions),
+    Migration(5, "backfill_metrics_rollups", backfill_metrics_rollups, transactional=False),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
@@ -0,0 +1,90 @@
+import logging
+from typing import List
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.infrastructure.database.schema_migrations.postgre.dtos.model import SchemaMigration
+from src.infrastructure.database.schema_migrations.postgre.migrations import MIGRATIONS, Migration
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaMigrator:
+    """
+    Applies the pending MIGRATIONS in version order and records each one in
+    schema_migrations. Concurrent callers (several app instances starting at
+    once) are serialized by a Postgres advisory lock.
+    """
+
+    ADVISORY_LOCK_KEY = 7_245_031
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    def current_version(self) -> int:
+        """Highest applied version, 0 for a database that was never migrated"""
+        with self.engine.connect() as connection:
+            return self._current_version(connection)
+
+    @staticmethod
+    def pending(current_version: int) -> List[Migration]:
+        return [migration for migration in MIGRATIONS if migration.version > current_version]
+
+    def migrate(self, include_manual: bool = True) -> int:
+        """
+        Applies the pending migrations and returns the resulting version. Without
+        include_manual it stops before the first manual one that cannot run online.
+        """
+        with self.engine.connect() as lock_connection:
+            lock_connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": self.ADVISORY_LOCK_KEY})
+            try:
+                with self.engine.begin() as connection:
+                    SchemaMigration.__table__.create(bind=connection, checkfirst=True)  # type: ignore
+
+                current_version = self.current_version()
+                for migration in self.pending(current_version):
+                    if migration.manual and not include_manual and not self._runs_online(migration):
+                        break
+                    self._apply(migration)
+                    current_version = migration.version
+            finally:
+                lock_connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.ADVISORY_LOCK_KEY})
+                lock_connection.commit()
+
+        return current_version
+
+    def _apply(self, migration: Migration) -> None:
+        logger.info(f"Applying schema migration {migration.version}: {migration.name}")
+
+        if migration.transactional:
+            with self.engine.begin() as connection:
+                migration.upgrade(connection)
+                self._record(connection, migration)
+            return
+
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            migration.upgrade(connection)
+
+        with self.engine.begin() as connection:
+            self._record(connection, migration)
+
+    def _runs_online(self, migration: Migration) -> bool:
+        if migration.runs_online_if is None:
+            return False
+
+        with self.engine.connect() as connection:
+            return migration.runs_online_if(connection)
+
+    def _record(self, connection: Connection, migration: Migration) -> None:
+        connection.execute(
+            insert(SchemaMigration).values(version=migration.version, name=migration.name)
+        )
+
+    def _current_version(self, connection: Connection) -> int:
+        if connection.execute(text("SELECT to_regclass('schema_migrations')")).scalar() is None:
+            return 0
+
+        return int(
+            connection.execute(select(func.coalesce(func.max(SchemaMigration.version), 0))).scalar_one()
+        )
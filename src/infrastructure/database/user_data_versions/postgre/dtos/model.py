@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Column, String
+
+from src.infrastructure.database.connection.database_connection import Base
+
+
+class UserDataVersion(Base):
+    """Counter bumped in every transaction that writes a user's metrics, see UserDataVersionsRepository"""
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
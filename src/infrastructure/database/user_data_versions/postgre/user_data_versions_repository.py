@@ -0,0 +1,43 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.user_data_versions.postgre.dtos.model import UserDataVersion
+
+
+class UserDataVersionsRepository:
+    """
+    Per-user data version kept in the database, so every process sees the writes
+    of the others: API workers, the scheduler, scripts/load_metrics.py and
+    scripts/manage_db.py. Cache keys include it, so entries computed before a
+    write are never served again and simply age out of the LRU.
+    bump and bump_all never commit: they run inside the caller's write transaction,
+    so a version changes exactly when the data it describes does.
+    """
+
+    # Row bumped by writes that touch every user at once
+    ALL_USERS = "*"
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get(self, user_id: str) -> int:
+        return int(
+            self.db.execute(
+                select(func.coalesce(func.sum(UserDataVersion.version), 0)).where(
+                    UserDataVersion.user_id.in_([user_id, self.ALL_USERS])
+                )
+            ).scalar_one()
+        )
+
+    def bump(self, user_id: str) -> None:
+        statement = insert(UserDataVersion).values(user_id=user_id, version=1)
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[UserDataVersion.user_id],
+                set_={"version": UserDataVersion.version + 1},
+            )
+        )
+
+    def bump_all(self) -> None:
+        self.bump(self.ALL_USERS)
@@ -7,7 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.cmd.api.routes import router
 from src.cmd.scheduler.scheduler import start_scheduler
-from src.infrastructure.database.init_db import init_database
+from src.infrastructure.database.init_db import check_schema_version
 
 
 @asynccontextmanager # type: ignore
@@ -15,8 +15,8 @@ async def lifespan(app: FastAPI) -> Any:
     """Handle application lifespan events"""
     # Startup
     try:
-        logger.info("Initializing database...")
-        init_database()
+        logger.info("Checking database schema...")
+        check_schema_version()
         logger.info("Database initialization completed successfully!")
         start_scheduler()
     except Exception as e:
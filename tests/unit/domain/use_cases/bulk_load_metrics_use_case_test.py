@@ -0,0 +1,39 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.bulk_load_metrics_use_case import BulkLoadMetricsUseCase
+from src.domain.use_cases.dtos.bulk_insert_result import BulkInsertResult
+
+
+class TestBulkLoadMetricsUseCase(TestCase):
+    def setUp(self) -> None:
+        self.users_repository = Mock()
+        self.metrics_bulk_loader_repository = Mock()
+        self.use_case = BulkLoadMetricsUseCase(self.users_repository, self.metrics_bulk_loader_repository)
+
+    def test_loads_rows_for_the_user(self) -> None:
+        rows = [{"hash": "abc"}]
+        self.users_repository.find_by_username.return_value = Mock(id="test-user-id")
+        self.metrics_bulk_loader_repository.load.return_value = BulkInsertResult(inserted=1, skipped=0)
+
+        result = self.use_case.execute("commit", "john", rows)
+
+        self.assertEqual(result, BulkInsertResult(inserted=1, skipped=0))
+        self.metrics_bulk_loader_repository.load.assert_called_once_with("commit", "test-user-id", rows)
+
+    def test_rejects_unknown_kind(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.use_case.execute("issues", "john", [])
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.metrics_bulk_loader_repository.load.assert_not_called()
+
+    def test_unknown_user_is_not_found(self) -> None:
+        self.users_repository.find_by_username.return_value = None
+
+        with self.assertRaises(HTTPException) as context:
+            self.use_case.execute("copilot_code", "nobody", [])
+
+        self.assertEqual(context.exception.status_code, 404)
@@ -0,0 +1,171 @@
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.entities.value_objects.enums.productivity_metric import Productivity_metric
+from src.domain.use_cases.dtos.calculated_metrics import CodeLineMetricsData, CommitMetricsData
+from src.domain.use_cases.dtos.period_aggregates import CommitMetricsDailyAggregate, CommitMetricsPeriodAggregate, CopilotCodeMetricsPeriodAggregate
+from src.domain.use_cases.get_calculated_metrics_use_case import GetCalculatedMetricsUseCase
+from src.infrastructure.cache.metrics_cache import LRUCache
+
+
+class TestGetCalculatedMetricsUseCase(TestCase):
+    def setUp(self) -> None:
+        self.commit_aggregates: List[CommitMetricsPeriodAggregate] = [
+            CommitMetricsPeriodAggregate(period_start=datetime(2024, 4, 29), added_lines=20, removed_lines=5, number_of_authors=1, number_of_commits=1),
+            CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 6), added_lines=100, removed_lines=10, number_of_authors=1, number_of_commits=1),
+            CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 20), added_lines=30, removed_lines=30, number_of_authors=1, number_of_commits=1),
+        ]
+        self.copilot_aggregates: List[CopilotCodeMetricsPeriodAggregate] = [
+            CopilotCodeMetricsPeriodAggregate(period_start=datetime(2024, 5, 6), code_acceptances=2, code_suggestions=4, lines_accepted=50, lines_suggested=100),
+            CopilotCodeMetricsPeriodAggregate(period_start=datetime(2024, 7, 1), code_acceptances=1, code_suggestions=2, lines_accepted=99, lines_suggested=198),
+        ]
+        commit_metrics_repository = Mock()
+        commit_metrics_repository.list_period_aggregates_by_user_id.return_value = [
+            CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 1), added_lines=150, removed_lines=45, number_of_authors=2, number_of_commits=3),
+        ]
+        commit_metrics_repository.list_languages_by_user_id.return_value = ["python", "typescript"]
+        commit_metrics_repository.count_authors_by_user_id.return_value = 2
+        copilot_code_metrics_repository = Mock()
+        copilot_code_metrics_repository.list_period_aggregates_by_user_id.return_value = self.copilot_aggregates
+        commit_metrics_daily_repository = Mock()
+        commit_metrics_daily_repository.list_period_aggregates_by_user_id.return_value = self.commit_aggregates
+        commit_metrics_daily_repository.list_languages_by_user_id.return_value = ["python", "typescript"]
+        self.use_case = GetCalculatedMetricsUseCase(
+            commit_metrics_repository, copilot_code_metrics_repository, commit_metrics_daily_repository
+        )
+
+    def test_aggregated_code_lines_metrics_by_week(self) -> None:
+        response = self.use_case.execute("test-user-id", Period.WEEK, Productivity_metric.code_lines)
+
+        self.assertEqual(response.languages, ["python", "typescript"])
+        self.assertEqual(response.data, self.expected_weekly_code_lines_data())
+
+    def expected_weekly_code_lines_data(self) -> List[CodeLineMetricsData | CommitMetricsData]:
+        return [
+            CodeLineMetricsData(
+                initial_date=datetime(2024, 4, 29),
+                final_date=datetime(2024, 5, 5),
+                net_changed_lines=25,
+                net_changed_lines_by_copilot=0,
+                percentage_changed_lines_by_copilot=0,
+                number_of_authors=1,
+            ),
+            CodeLineMetricsData(
+                initial_date=datetime(2024, 5, 6),
+                final_date=datetime(2024, 5, 12),
+                net_changed_lines=110,
+                net_changed_lines_by_copilot=37,
+                percentage_changed_lines_by_copilot=50 / 150,
+                number_of_authors=1,
+            ),
+            CodeLineMetricsData(
+                initial_date=datetime(2024, 5, 13),
+                final_date=datetime(2024, 5, 19),
+                net_changed_lines=0,
+                net_changed_lines_by_copilot=0,
+                percentage_changed_lines_by_copilot=0,
+                number_of_authors=0,
+            ),
+            CodeLineMetricsData(
+                initial_date=datetime(2024, 5, 20),
+                final_date=datetime(2024, 5, 26),
+                net_changed_lines=60,
+                net_changed_lines_by_copilot=0,
+                percentage_changed_lines_by_copilot=0,
+                number_of_authors=1,
+            ),
+        ]
+
+    def test_returns_empty_metrics_without_commits(self) -> None:
+        self.use_case.commit_metrics_daily_repository.list_period_aggregates_by_user_id.return_value = []  # type: ignore
+
+        response = self.use_case.execute("test-user-id", Period.WEEK, Productivity_metric.code_lines)
+
+        self.assertEqual(response.data, [])
+        self.assertEqual(response.languages, [])
+
+    def test_cached_results_are_reused_until_the_user_data_changes(self) -> None:
+        user_data_versions = Mock()
+        user_data_versions.get.return_value = 0
+        use_case = GetCalculatedMetricsUseCase(
+            self.use_case.commit_metrics_repository,
+            self.use_case.copilot_code_metrics_repository,
+            self.use_case.commit_metrics_daily_repository,
+            LRUCache(8),
+            user_data_versions,
+        )
+        daily_repository: Mock = self.use_case.commit_metrics_daily_repository  # type: ignore
+
+        first = use_case.execute("test-user-id", Period.WEEK, Productivity_metric.code_lines)
+        second = use_case.execute("test-user-id", Period.WEEK, Productivity_metric.code_lines)
+
+        self.assertEqual(first, second)
+        self.assertEqual(daily_repository.list_period_aggregates_by_user_id.call_count, 1)
+
+        # Another process wrote the user's metrics
+        user_data_versions.get.return_value = 1
+        use_case.execute("test-user-id", Period.WEEK, Productivity_metric.code_lines)
+
+        self.assertEqual(daily_repository.list_period_aggregates_by_user_id.call_count, 2)
+
+    def test_combined_metrics_read_the_daily_aggregates_once(self) -> None:
+        user_data_versions = Mock()
+        user_data_versions.get.return_value = 0
+        use_case = GetCalculatedMetricsUseCase(
+            self.use_case.commit_metrics_repository,
+            self.use_case.copilot_code_metrics_repository,
+            self.use_case.commit_metrics_daily_repository,
+            LRUCache(8),
+            user_data_versions,
+        )
+        daily_repository: Mock = self.use_case.commit_metrics_daily_repository  # type: ignore
+        commit_repository: Mock = self.use_case.commit_metrics_repository  # type: ignore
+        copilot_repository: Mock = self.use_case.copilot_code_metrics_repository  # type: ignore
+        daily_repository.list_daily_aggregates_by_user_id.return_value = [
+            CommitMetricsDailyAggregate(day=datetime(2024, 5, 2), language="python", author_name="Mary", added_lines=20, removed_lines=5),
+            CommitMetricsDailyAggregate(day=datetime(2024, 5, 7), language="python", author_name="John", added_lines=60, removed_lines=0),
+            CommitMetricsDailyAggregate(day=datetime(2024, 5, 7), language="typescript", author_name="John", added_lines=40, removed_lines=10),
+            CommitMetricsDailyAggregate(day=datetime(2024, 5, 22), language="python", author_name="Mary", added_lines=30, removed_lines=30),
+        ]
+
+        response = use_case.execute_combined("test-user-id", [Period.WEEK, Period.MONTH], languages=["python", "typescript"])
+
+        self.assertEqual([m.period for m in response.code_lines], [Period.WEEK, Period.MONTH])
+        self.assertEqual(response.code_lines[0].languages, ["python", "typescript"])
+        self.assertEqual(response.code_lines[0].data, self.expected_weekly_code_lines_data())
+        self.assertEqual(response.commits[1].languages, ["python", "typescript"])
+        self.assertEqual(
+            response.commits[1].data,
+            [
+                CommitMetricsData(
+                    initial_date=datetime(2024, 5, 1),
+                    final_date=datetime(2024, 5, 31),
+                    total_commits=3,
+                    number_of_authors=2,
+                    net_changed_lines=195,
+                    net_changed_lines_by_copilot=65,
+                    percentage_changed_lines_by_copilot=50 / 150,
+                ),
+            ],
+        )
+        daily_repository.list_daily_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", None, None, ["python", "typescript"]
+        )
+        commit_repository.list_period_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", Period.DAILY, None, None, ["python", "typescript"]
+        )
+        copilot_repository.list_period_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", Period.DAILY, None, None, ["python", "typescript"]
+        )
+        daily_repository.list_period_aggregates_by_user_id.assert_not_called()
+
+        # Every result is cached under the single-period key
+        self.assertEqual(
+            use_case.execute("test-user-id", Period.MONTH, Productivity_metric.commits, languages=["typescript", "python"]),
+            response.commits[1],
+        )
+        daily_repository.list_period_aggregates_by_user_id.assert_not_called()
+        self.assertEqual(commit_repository.list_period_aggregates_by_user_id.call_count, 1)
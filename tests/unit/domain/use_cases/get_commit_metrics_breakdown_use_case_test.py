@@ -0,0 +1,27 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.get_commit_metrics_breakdown_use_case import GetCommitMetricsBreakdownUseCase
+
+
+class TestGetCommitMetricsBreakdownUseCase(TestCase):
+    def setUp(self) -> None:
+        self.commit_metrics_repository = Mock()
+        self.commit_metrics_repository.list_breakdown_by_user_id.return_value = []
+        self.use_case = GetCommitMetricsBreakdownUseCase(self.commit_metrics_repository)
+
+    def test_groups_in_the_database_by_the_requested_columns(self) -> None:
+        self.use_case.execute("test-user-id", ["team", "language", "team"])
+
+        self.commit_metrics_repository.list_breakdown_by_user_id.assert_called_once_with(
+            "test-user-id", ["team", "language"], None, None, None
+        )
+
+    def test_rejects_unknown_columns(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.use_case.execute("test-user-id", ["IDE"])
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.commit_metrics_repository.list_breakdown_by_user_id.assert_not_called()
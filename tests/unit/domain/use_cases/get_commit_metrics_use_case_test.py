@@ -39,5 +39,4 @@ class TestGetCommitMetricsUseCase(TestCase):
 
         get_commit_metrics_use_case.execute(date.date(), "canaicode", "test-user-id")
 
-        self.assertEqual(commit_metrics_repository.create.call_count, 2)
-        commit_metrics_repository.create.assert_called_with(commit_metrics)
+        commit_metrics_repository.create_many.assert_called_once_with(commit_metrics_list)
@@ -0,0 +1,75 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from fastapi import HTTPException
+
+from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsByEditor
+from src.domain.use_cases.dtos.period_aggregates import CopilotChatMetricsEditorAggregate, CopilotCodeMetricsEditorAggregate
+from src.domain.use_cases.get_copilot_metrics_by_editor_use_case import GetCopilotMetricsByEditorUseCase
+
+
+class TestGetCopilotMetricsByEditorUseCase(TestCase):
+    def setUp(self) -> None:
+        self.copilot_code_metrics_daily_repository = Mock()
+        self.copilot_chat_metrics_daily_repository = Mock()
+        self.use_case = GetCopilotMetricsByEditorUseCase(
+            self.copilot_code_metrics_daily_repository,
+            self.copilot_chat_metrics_daily_repository,
+        )
+
+    def test_code_and_chat_aggregates_are_merged_by_editor(self) -> None:
+        self.copilot_code_metrics_daily_repository.list_editor_aggregates_by_user_id.return_value = [
+            CopilotCodeMetricsEditorAggregate(IDE="vscode", code_acceptances=3, code_suggestions=4, lines_accepted=10, lines_suggested=40),
+        ]
+        self.copilot_chat_metrics_daily_repository.list_editor_aggregates_by_user_id.return_value = [
+            CopilotChatMetricsEditorAggregate(IDE="jetbrains", total_chats=5, insertion_events=2, copy_events=1),
+            CopilotChatMetricsEditorAggregate(IDE="vscode", total_chats=8, insertion_events=4, copy_events=3),
+        ]
+
+        response = self.use_case.execute(
+            "test-user-id", ["IDE", "IDE"], datetime(2024, 5, 1), datetime(2024, 5, 31), ["python"]
+        )
+
+        self.copilot_code_metrics_daily_repository.list_editor_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", ["IDE"], datetime(2024, 5, 1), datetime(2024, 5, 31), ["python"]
+        )
+        self.copilot_chat_metrics_daily_repository.list_editor_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", ["IDE"], datetime(2024, 5, 1), datetime(2024, 5, 31)
+        )
+        self.assertEqual(
+            response,
+            [
+                CopilotMetricsByEditor(
+                    IDE="jetbrains",
+                    code_acceptances=0,
+                    code_suggestions=0,
+                    lines_accepted=0,
+                    lines_suggested=0,
+                    percentage_code_acceptances=0.0,
+                    percentage_lines_accepted=0.0,
+                    total_chats=5,
+                    chat_insertion_events=2,
+                    chat_copy_events=1,
+                ),
+                CopilotMetricsByEditor(
+                    IDE="vscode",
+                    code_acceptances=3,
+                    code_suggestions=4,
+                    lines_accepted=10,
+                    lines_suggested=40,
+                    percentage_code_acceptances=75.0,
+                    percentage_lines_accepted=25.0,
+                    total_chats=8,
+                    chat_insertion_events=4,
+                    chat_copy_events=3,
+                ),
+            ],
+        )
+
+    def test_rejects_columns_other_than_ide_and_model(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.use_case.execute("test-user-id", ["IDE", "team"])
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.copilot_code_metrics_daily_repository.list_editor_aggregates_by_user_id.assert_not_called()
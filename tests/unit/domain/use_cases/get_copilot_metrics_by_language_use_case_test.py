@@ -0,0 +1,50 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsByLanguage
+from src.domain.use_cases.dtos.period_aggregates import CopilotCodeMetricsLanguageAggregate
+from src.domain.use_cases.get_copilot_metrics_by_language_use_case import GetCopilotMetricsByLanguageUseCase
+
+
+class TestGetCopilotMetricsByLanguageUseCase(TestCase):
+    def setUp(self) -> None:
+        self.copilot_code_metrics_daily_repository = Mock()
+        self.use_case = GetCopilotMetricsByLanguageUseCase(self.copilot_code_metrics_daily_repository)
+
+    def test_metrics_by_language_are_read_from_the_filtered_aggregates(self) -> None:
+        self.copilot_code_metrics_daily_repository.list_language_aggregates_by_user_id.return_value = [
+            CopilotCodeMetricsLanguageAggregate(language="python", code_acceptances=3, code_suggestions=4, lines_accepted=10, lines_suggested=40),
+            CopilotCodeMetricsLanguageAggregate(language="typescript", code_acceptances=0, code_suggestions=0, lines_accepted=0, lines_suggested=0),
+        ]
+
+        response = self.use_case.execute(
+            "test-user-id", datetime(2024, 5, 1), datetime(2024, 5, 31), ["vscode"], ["default"]
+        )
+
+        self.copilot_code_metrics_daily_repository.list_language_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", datetime(2024, 5, 1), datetime(2024, 5, 31), ["vscode"], ["default"]
+        )
+        self.assertEqual(
+            response,
+            [
+                CopilotMetricsByLanguage(
+                    language="python",
+                    code_acceptances=3,
+                    code_suggestions=4,
+                    lines_accepted=10,
+                    lines_suggested=40,
+                    percentage_code_acceptances=75.0,
+                    percentage_lines_accepted=25.0,
+                ),
+                CopilotMetricsByLanguage(
+                    language="typescript",
+                    code_acceptances=0,
+                    code_suggestions=0,
+                    lines_accepted=0,
+                    lines_suggested=0,
+                    percentage_code_acceptances=0.0,
+                    percentage_lines_accepted=0.0,
+                ),
+            ],
+        )
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.calculated_metrics import CopilotMetricsByPeriod
+from src.domain.use_cases.dtos.period_aggregates import CopilotCodeMetricsPeriodAggregate, CopilotCodeMetricsPeriodTotals
+from src.domain.use_cases.get_copilot_metrics_by_period_use_case import GetCopilotMetricsByPeriodUseCase
+
+
+class TestGetCopilotMetricsByPeriodUseCase(TestCase):
+    def setUp(self) -> None:
+        self.copilot_code_metrics_daily_repository = Mock()
+        self.use_case = GetCopilotMetricsByPeriodUseCase(self.copilot_code_metrics_daily_repository)
+
+    def test_metrics_by_month_include_empty_periods(self) -> None:
+        self.copilot_code_metrics_daily_repository.list_period_totals_by_user_id.return_value = [
+            CopilotCodeMetricsPeriodTotals(period_start=datetime(2024, 5, 1), code_acceptances=3, code_suggestions=4, lines_accepted=10, lines_suggested=40, percentage_code_acceptances=0.75, percentage_lines_accepted=0.25),
+            CopilotCodeMetricsPeriodTotals(period_start=datetime(2024, 7, 1), code_acceptances=0, code_suggestions=0, lines_accepted=0, lines_suggested=0, percentage_code_acceptances=0.0, percentage_lines_accepted=0.0),
+        ]
+
+        response = self.use_case.execute("test-user-id", Period.MONTH, datetime(2024, 5, 1), datetime(2024, 7, 31))
+
+        self.copilot_code_metrics_daily_repository.list_period_totals_by_user_id.assert_called_once_with(
+            "test-user-id", Period.MONTH, datetime(2024, 5, 1), datetime(2024, 7, 31)
+        )
+        self.assertEqual(response, self.expected_monthly_metrics())
+
+    def test_daily_aggregates_bucket_into_the_same_periods(self) -> None:
+        response = GetCopilotMetricsByPeriodUseCase.metrics_from_aggregates(
+            [
+                CopilotCodeMetricsPeriodAggregate(period_start=datetime(2024, 5, 3), code_acceptances=1, code_suggestions=2, lines_accepted=4, lines_suggested=10),
+                CopilotCodeMetricsPeriodAggregate(period_start=datetime(2024, 5, 20), code_acceptances=2, code_suggestions=2, lines_accepted=6, lines_suggested=30),
+                CopilotCodeMetricsPeriodAggregate(period_start=datetime(2024, 7, 9), code_acceptances=0, code_suggestions=0, lines_accepted=0, lines_suggested=0),
+            ],
+            Period.MONTH,
+        )
+
+        self.assertEqual(response, self.expected_monthly_metrics())
+
+    def expected_monthly_metrics(self) -> List[CopilotMetricsByPeriod]:
+        return [
+            CopilotMetricsByPeriod(
+                period_initial_date=datetime(2024, 5, 1),
+                period_final_date=datetime(2024, 5, 31),
+                total_code_acceptances=3,
+                percentage_code_acceptances=0.75,
+                total_lines_accepted=10,
+                percentage_lines_accepted=0.25,
+            ),
+            CopilotMetricsByPeriod(
+                period_initial_date=datetime(2024, 6, 1),
+                period_final_date=datetime(2024, 6, 30),
+                total_code_acceptances=0,
+                percentage_code_acceptances=0.0,
+                total_lines_accepted=0,
+                percentage_lines_accepted=0.0,
+            ),
+            CopilotMetricsByPeriod(
+                period_initial_date=datetime(2024, 7, 1),
+                period_final_date=datetime(2024, 7, 31),
+                total_code_acceptances=0,
+                percentage_code_acceptances=0.0,
+                total_lines_accepted=0,
+                percentage_lines_accepted=0.0,
+            ),
+        ]
+
+    def test_returns_empty_list_without_metrics(self) -> None:
+        self.copilot_code_metrics_daily_repository.list_period_totals_by_user_id.return_value = []
+
+        self.assertEqual(self.use_case.execute("test-user-id", Period.WEEK), [])
@@ -0,0 +1,37 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.domain.use_cases.dtos.calculated_metrics import CopilotUsersMetrics
+from src.domain.use_cases.get_copilot_users_metrics_use_case import GetCopilotUsersMetricsUseCase
+
+
+class TestGetCopilotUsersMetricsUseCase(TestCase):
+    def setUp(self) -> None:
+        self.copilot_code_metrics_daily_repository = Mock()
+        self.use_case = GetCopilotUsersMetricsUseCase(self.copilot_code_metrics_daily_repository)
+
+    def test_returns_the_users_joined_by_the_database(self) -> None:
+        users_metrics = [
+            CopilotUsersMetrics(date=datetime(2024, 5, 6), total_code_assistant_users=2, total_chat_users=0),
+            CopilotUsersMetrics(date=datetime(2024, 5, 9), total_code_assistant_users=0, total_chat_users=3),
+        ]
+        self.copilot_code_metrics_daily_repository.list_code_and_chat_users_by_user_id.return_value = users_metrics
+        initial_date, final_date = datetime(2024, 5, 1), datetime(2024, 5, 31)
+
+        response = self.use_case.execute("test-user-id", initial_date, final_date)
+
+        self.copilot_code_metrics_daily_repository.list_code_and_chat_users_by_user_id.assert_called_once_with(
+            "test-user-id", initial_date, final_date
+        )
+        self.assertEqual(response, users_metrics)
+
+    def test_reads_every_day_without_a_date_range(self) -> None:
+        self.copilot_code_metrics_daily_repository.list_code_and_chat_users_by_user_id.return_value = []
+
+        response = self.use_case.execute("test-user-id")
+
+        self.copilot_code_metrics_daily_repository.list_code_and_chat_users_by_user_id.assert_called_once_with(
+            "test-user-id", None, None
+        )
+        self.assertEqual(response, [])
@@ -0,0 +1,160 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.entities.value_objects.enums.productivity_metric import Productivity_metric
+from src.domain.use_cases.dtos.calculated_metrics import (
+    CodeLineMetricsData,
+    CommitMetricsData,
+    CopilotMetricsByLanguage,
+    CopilotMetricsByPeriod,
+    CopilotUsersMetrics,
+)
+from src.domain.use_cases.dtos.period_aggregates import (
+    CommitMetricsDailyAggregate,
+    CommitMetricsPeriodAggregate,
+    CopilotChatUsersDailyAggregate,
+    CopilotCodeMetricsDailyAggregate,
+)
+from src.domain.use_cases.get_dashboard_metrics_bundle_use_case import GetDashboardMetricsBundleUseCase
+from src.domain.use_cases.get_report_metrics_snapshot_use_case import GetReportMetricsSnapshotUseCase
+
+
+class TestGetDashboardMetricsBundleUseCase(TestCase):
+    def setUp(self) -> None:
+        self.commit_metrics_repository = Mock()
+        self.commit_metrics_repository.list_period_aggregates_by_user_id.return_value = [
+            CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 6), added_lines=80, removed_lines=20, number_of_authors=2, number_of_commits=3),
+        ]
+        self.commit_metrics_daily_repository = Mock()
+        self.commit_metrics_daily_repository.list_daily_aggregates_by_user_id.return_value = [
+            CommitMetricsDailyAggregate(day=datetime(2024, 5, 6), language="python", author_name="Ann", added_lines=50, removed_lines=10),
+            CommitMetricsDailyAggregate(day=datetime(2024, 5, 6), language="python", author_name="Bob", added_lines=30, removed_lines=10),
+        ]
+        self.copilot_code_metrics_daily_repository = Mock()
+        self.copilot_code_metrics_daily_repository.list_daily_aggregates_by_user_id.return_value = [
+            CopilotCodeMetricsDailyAggregate(day=datetime(2024, 5, 6), language="python", total_users=2, code_acceptances=1, code_suggestions=4, lines_accepted=30, lines_suggested=60),
+            CopilotCodeMetricsDailyAggregate(day=datetime(2024, 5, 8), language="go", total_users=1, code_acceptances=1, code_suggestions=2, lines_accepted=10, lines_suggested=40),
+        ]
+        self.copilot_chat_metrics_daily_repository = Mock()
+        self.copilot_chat_metrics_daily_repository.list_daily_users_by_user_id.return_value = [
+            CopilotChatUsersDailyAggregate(day=datetime(2024, 5, 9), total_users=3),
+        ]
+        self.use_case = GetDashboardMetricsBundleUseCase(
+            GetReportMetricsSnapshotUseCase(
+                self.commit_metrics_repository,
+                self.commit_metrics_daily_repository,
+                self.copilot_code_metrics_daily_repository,
+                self.copilot_chat_metrics_daily_repository,
+            ),
+        )
+        self.initial_date, self.final_date = datetime(2024, 5, 1), datetime(2024, 5, 31)
+
+    def test_code_lines_bundle(self) -> None:
+        response = self.use_case.execute(
+            "test-user-id", Period.WEEK, Productivity_metric.code_lines, self.initial_date, self.final_date
+        )
+
+        self.assertEqual(response.calculated_metrics.languages, ["python"])
+        self.assertEqual(
+            response.calculated_metrics.data,
+            [
+                CodeLineMetricsData(
+                    initial_date=datetime(2024, 5, 6),
+                    final_date=datetime(2024, 5, 12),
+                    net_changed_lines=100,
+                    net_changed_lines_by_copilot=50,
+                    percentage_changed_lines_by_copilot=0.5,
+                    number_of_authors=2,
+                ),
+            ],
+        )
+        self.assertEqual(
+            response.copilot_metrics_by_language,
+            [
+                CopilotMetricsByLanguage(
+                    language="go",
+                    code_acceptances=1,
+                    code_suggestions=2,
+                    lines_accepted=10,
+                    lines_suggested=40,
+                    percentage_code_acceptances=50.0,
+                    percentage_lines_accepted=25.0,
+                ),
+                CopilotMetricsByLanguage(
+                    language="python",
+                    code_acceptances=1,
+                    code_suggestions=4,
+                    lines_accepted=30,
+                    lines_suggested=60,
+                    percentage_code_acceptances=25.0,
+                    percentage_lines_accepted=50.0,
+                ),
+            ],
+        )
+        self.assertEqual(
+            response.copilot_metrics_by_period,
+            [
+                CopilotMetricsByPeriod(
+                    period_initial_date=datetime(2024, 5, 6),
+                    period_final_date=datetime(2024, 5, 12),
+                    total_code_acceptances=2,
+                    percentage_code_acceptances=2 / 6,
+                    total_lines_accepted=40,
+                    percentage_lines_accepted=40 / 100,
+                ),
+            ],
+        )
+        self.assertEqual(
+            response.copilot_users_metrics,
+            [
+                CopilotUsersMetrics(date=datetime(2024, 5, 6), total_code_assistant_users=2, total_chat_users=0),
+                CopilotUsersMetrics(date=datetime(2024, 5, 8), total_code_assistant_users=1, total_chat_users=0),
+                CopilotUsersMetrics(date=datetime(2024, 5, 9), total_code_assistant_users=0, total_chat_users=3),
+            ],
+        )
+        self.assert_each_table_read_once(None)
+        self.assertEqual(self.commit_metrics_repository.method_calls, [])
+
+    def test_commits_bundle(self) -> None:
+        response = self.use_case.execute(
+            "test-user-id", Period.MONTH, Productivity_metric.commits, self.initial_date, self.final_date, ["python"]
+        )
+
+        self.assertEqual(response.calculated_metrics.languages, ["python"])
+        # Only the python Copilot lines count towards the python commits
+        self.assertEqual(
+            response.calculated_metrics.data,
+            [
+                CommitMetricsData(
+                    initial_date=datetime(2024, 5, 1),
+                    final_date=datetime(2024, 5, 31),
+                    total_commits=3,
+                    number_of_authors=2,
+                    net_changed_lines=100,
+                    net_changed_lines_by_copilot=38,
+                    percentage_changed_lines_by_copilot=30 / 80,
+                ),
+            ],
+        )
+        self.assertEqual([m.language for m in response.copilot_metrics_by_language], ["go", "python"])
+        self.assert_each_table_read_once(["python"])
+        self.commit_metrics_repository.list_period_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", Period.DAILY, self.initial_date, self.final_date, ["python"]
+        )
+        self.assertEqual(len(self.commit_metrics_repository.method_calls), 1)
+
+    def assert_each_table_read_once(self, languages: list[str] | None) -> None:
+        self.commit_metrics_daily_repository.list_daily_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", self.initial_date, self.final_date, languages
+        )
+        self.copilot_code_metrics_daily_repository.list_daily_aggregates_by_user_id.assert_called_once_with(
+            "test-user-id", self.initial_date, self.final_date
+        )
+        self.copilot_chat_metrics_daily_repository.list_daily_users_by_user_id.assert_called_once_with(
+            "test-user-id", self.initial_date, self.final_date
+        )
+        self.assertEqual(len(self.commit_metrics_daily_repository.method_calls), 1)
+        self.assertEqual(len(self.copilot_code_metrics_daily_repository.method_calls), 1)
+        self.assertEqual(len(self.copilot_chat_metrics_daily_repository.method_calls), 1)
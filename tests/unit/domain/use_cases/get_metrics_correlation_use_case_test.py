@@ -0,0 +1,130 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+import numpy as np
+from fastapi import HTTPException
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.period_aggregates import (
+    CommitMetricsPeriodAggregate,
+    CommitMetricsSlicePeriodAggregate,
+    CopilotCodeMetricsPeriodAggregate,
+    CopilotCodeMetricsSlicePeriodAggregate,
+)
+from src.domain.use_cases.get_metrics_correlation_use_case import GetMetricsCorrelationUseCase
+from src.infrastructure.cache.metrics_cache import LRUCache
+
+
+def make_commit_aggregate(team: str, period_start: datetime, net_changed_lines: int, commits: int) -> CommitMetricsSlicePeriodAggregate:
+    return CommitMetricsSlicePeriodAggregate(
+        slice_value=team,
+        period_start=period_start,
+        added_lines=net_changed_lines,
+        removed_lines=0,
+        number_of_commits=commits,
+    )
+
+
+def make_copilot_aggregate(team: str, period_start: datetime, lines_accepted: int) -> CopilotCodeMetricsSlicePeriodAggregate:
+    return CopilotCodeMetricsSlicePeriodAggregate(
+        slice_value=team, period_start=period_start, lines_accepted=lines_accepted
+    )
+
+
+class TestGetMetricsCorrelationUseCase(TestCase):
+    def setUp(self) -> None:
+        weeks = [datetime(2024, 5, 6), datetime(2024, 5, 13), datetime(2024, 5, 27)]
+        commit_metrics_repository = Mock()
+        commit_metrics_repository.list_period_aggregates_by_slice.return_value = [
+            make_commit_aggregate("backend", weeks[0], 10, 1),
+            make_commit_aggregate("backend", weeks[1], 20, 3),
+            make_commit_aggregate("backend", weeks[2], 40, 2),
+            make_commit_aggregate("frontend", weeks[0], 30, 1),
+            make_commit_aggregate("frontend", weeks[2], 10, 1),
+        ]
+        copilot_code_metrics_repository = Mock()
+        copilot_code_metrics_repository.list_period_aggregates_by_slice.return_value = [
+            make_copilot_aggregate("backend", weeks[0], 1),
+            make_copilot_aggregate("backend", weeks[1], 2),
+            make_copilot_aggregate("backend", weeks[2], 4),
+            make_copilot_aggregate("backend", datetime(2024, 6, 3), 8),
+            make_copilot_aggregate("frontend", weeks[1], 5),
+        ]
+        # The unsliced rows count a commit once, whatever the number of teams it touches
+        commit_metrics_repository.list_period_aggregates_by_user_id.return_value = [
+            CommitMetricsPeriodAggregate(period_start=weeks[0], added_lines=35, removed_lines=0, number_of_authors=2, number_of_commits=2),
+            CommitMetricsPeriodAggregate(period_start=weeks[1], added_lines=20, removed_lines=0, number_of_authors=1, number_of_commits=3),
+            CommitMetricsPeriodAggregate(period_start=weeks[2], added_lines=50, removed_lines=0, number_of_authors=2, number_of_commits=3),
+        ]
+        copilot_code_metrics_repository.list_period_aggregates_by_user_id.return_value = [
+            CopilotCodeMetricsPeriodAggregate(period_start=weeks[0], code_acceptances=1, code_suggestions=2, lines_accepted=1, lines_suggested=2),
+            CopilotCodeMetricsPeriodAggregate(period_start=weeks[1], code_acceptances=3, code_suggestions=4, lines_accepted=7, lines_suggested=9),
+            CopilotCodeMetricsPeriodAggregate(period_start=weeks[2], code_acceptances=2, code_suggestions=2, lines_accepted=4, lines_suggested=5),
+        ]
+        self.use_case = GetMetricsCorrelationUseCase(commit_metrics_repository, copilot_code_metrics_repository)
+
+    def test_correlates_the_dashboard_series_of_every_slice(self) -> None:
+        response = self.use_case.execute("test-user-id", Period.WEEK, "team")
+
+        # The week of 2024-05-20 has no commits and still counts as a zero bucket
+        self.assertEqual(response.number_of_periods, 4)
+        self.assertEqual([s.value for s in response.slices], ["backend", "frontend"])
+
+        # Accepted lines over the 70 added lines times the bucket's net changed lines;
+        # the Copilot week after the last commit is outside the commit buckets
+        backend = response.slices[0]
+        backend_by_copilot = [round(1 / 70 * 10), round(2 / 70 * 20), 0, round(4 / 70 * 40)]
+        self.assertAlmostEqual(backend.code_lines, np.corrcoef(backend_by_copilot, [10, 20, 0, 40])[0, 1])
+        self.assertAlmostEqual(backend.commits, np.corrcoef(backend_by_copilot, [1, 3, 0, 2])[0, 1])
+
+        # The frontend Copilot lines fall in a week without frontend commits
+        frontend = response.slices[1]
+        self.assertEqual((frontend.code_lines, frontend.commits), (0, 0))
+
+        overall_by_copilot = [round(1 / 105 * 35), round(7 / 105 * 20), 0, round(4 / 105 * 50)]
+        self.assertIsNone(response.overall.value)
+        self.assertAlmostEqual(response.overall.code_lines, np.corrcoef(overall_by_copilot, [35, 20, 0, 50])[0, 1])
+        self.assertAlmostEqual(response.overall.commits, np.corrcoef(overall_by_copilot, [2, 3, 0, 3])[0, 1])
+
+    def test_constant_series_correlate_to_zero(self) -> None:
+        correlations = GetMetricsCorrelationUseCase.pearson_by_row(
+            np.array([[1, 1, 1], [1, 2, 3]]), np.array([[1, 2, 3], [2, 4, 6]])
+        )
+
+        self.assertEqual(correlations.tolist(), [0.0, 1.0])
+
+    def test_returns_no_slices_without_data(self) -> None:
+        self.use_case.commit_metrics_repository.list_period_aggregates_by_slice.return_value = []  # type: ignore
+        self.use_case.copilot_code_metrics_repository.list_period_aggregates_by_slice.return_value = []  # type: ignore
+
+        response = self.use_case.execute("test-user-id", Period.MONTH, "language")
+
+        self.assertEqual(response.slices, [])
+        self.assertEqual(response.number_of_periods, 0)
+
+    def test_rejects_unknown_slice_column(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.use_case.execute("test-user-id", Period.WEEK, "author")
+
+        self.assertEqual(context.exception.status_code, 400)
+
+    def test_cached_results_are_reused_until_the_user_data_changes(self) -> None:
+        user_data_versions = Mock()
+        user_data_versions.get.return_value = 0
+        use_case = GetMetricsCorrelationUseCase(
+            self.use_case.commit_metrics_repository,
+            self.use_case.copilot_code_metrics_repository,
+            LRUCache(8),
+            user_data_versions,
+        )
+        commit_metrics_repository: Mock = self.use_case.commit_metrics_repository  # type: ignore
+
+        use_case.execute("test-user-id", Period.WEEK, "team")
+        use_case.execute("test-user-id", Period.WEEK, "team")
+        self.assertEqual(commit_metrics_repository.list_period_aggregates_by_slice.call_count, 1)
+
+        # Another process wrote the user's metrics
+        user_data_versions.get.return_value = 1
+        use_case.execute("test-user-id", Period.WEEK, "team")
+        self.assertEqual(commit_metrics_repository.list_period_aggregates_by_slice.call_count, 2)
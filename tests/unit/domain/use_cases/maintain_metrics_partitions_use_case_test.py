@@ -0,0 +1,25 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.domain.use_cases.maintain_metrics_partitions_use_case import MaintainMetricsPartitionsUseCase
+
+
+class TestMaintainMetricsPartitionsUseCase(TestCase):
+    def setUp(self) -> None:
+        self.metrics_partitions_repository = Mock()
+        self.metrics_partitions_repository.create_future_partitions.return_value = ["raw_commit_metrics_p2024_08"]
+        self.metrics_partitions_repository.drop_partitions_before.return_value = ["raw_commit_metrics_p2023_04"]
+        self.use_case = MaintainMetricsPartitionsUseCase(self.metrics_partitions_repository)
+
+    def test_only_creates_partitions_without_retention(self) -> None:
+        created = self.use_case.execute(2, today=datetime(2024, 5, 20))
+
+        self.assertEqual(created, ["raw_commit_metrics_p2024_08"])
+        self.metrics_partitions_repository.create_future_partitions.assert_called_once_with(2, datetime(2024, 5, 20))
+        self.metrics_partitions_repository.drop_partitions_before.assert_not_called()
+
+    def test_retention_drops_whole_months_before_the_cutoff(self) -> None:
+        self.use_case.execute(retention_months=12, today=datetime(2024, 5, 20))
+
+        self.metrics_partitions_repository.drop_partitions_before.assert_called_once_with(datetime(2023, 5, 1))
@@ -0,0 +1,126 @@
+from datetime import datetime
+from unittest import TestCase
+
+from src.domain.entities.value_objects.enums.period import Period
+from src.domain.use_cases.dtos.calculated_metrics import CommitMetricsData, CopilotUsersMetrics
+from src.domain.use_cases.dtos.period_aggregates import (
+    CommitMetricsDailyAggregate,
+    CommitMetricsPeriodAggregate,
+    CopilotChatUsersDailyAggregate,
+    CopilotCodeMetricsDailyAggregate,
+)
+from src.domain.use_cases.report_metrics_snapshot import ReportMetricsSnapshot
+
+
+def make_copilot_code_aggregate(day: datetime, language: str, lines_accepted: int) -> CopilotCodeMetricsDailyAggregate:
+    return CopilotCodeMetricsDailyAggregate(
+        day=day,
+        language=language,
+        total_users=2,
+        code_acceptances=1,
+        code_suggestions=4,
+        lines_accepted=lines_accepted,
+        lines_suggested=lines_accepted * 2,
+    )
+
+
+COMMIT_AGGREGATES = [
+    CommitMetricsDailyAggregate(day=datetime(2024, 5, 2), language="python", author_name="Mary", added_lines=20, removed_lines=5),
+    CommitMetricsDailyAggregate(day=datetime(2024, 5, 7), language="python", author_name="John", added_lines=60, removed_lines=0),
+    CommitMetricsDailyAggregate(day=datetime(2024, 5, 7), language="typescript", author_name="John", added_lines=40, removed_lines=10),
+    CommitMetricsDailyAggregate(day=datetime(2024, 5, 22), language="python", author_name="Mary", added_lines=30, removed_lines=30),
+]
+
+COPILOT_CODE_AGGREGATES = [
+    make_copilot_code_aggregate(datetime(2024, 5, 6), "python", 30),
+    make_copilot_code_aggregate(datetime(2024, 5, 8), "python", 10),
+    make_copilot_code_aggregate(datetime(2024, 5, 8), "go", 10),
+    make_copilot_code_aggregate(datetime(2024, 7, 1), "python", 99),
+]
+
+
+class TestReportMetricsSnapshot(TestCase):
+    def setUp(self) -> None:
+        self.snapshot = ReportMetricsSnapshot(
+            "test-user-id",
+            COMMIT_AGGREGATES,
+            [
+                # The commit touching python and typescript on 2024-05-07 counts once
+                CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 2), added_lines=20, removed_lines=5, number_of_authors=1, number_of_commits=1),
+                CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 7), added_lines=100, removed_lines=10, number_of_authors=1, number_of_commits=1),
+                CommitMetricsPeriodAggregate(period_start=datetime(2024, 5, 22), added_lines=30, removed_lines=30, number_of_authors=1, number_of_commits=1),
+            ],
+            COPILOT_CODE_AGGREGATES,
+            [
+                CopilotChatUsersDailyAggregate(day=datetime(2024, 4, 30), total_users=1),
+                CopilotChatUsersDailyAggregate(day=datetime(2024, 5, 9), total_users=3),
+                CopilotChatUsersDailyAggregate(day=datetime(2024, 7, 1), total_users=2),
+            ],
+        )
+
+    def test_code_lines_metrics_narrow_the_rows_to_the_window(self) -> None:
+        response = self.snapshot.code_lines_metrics(Period.WEEK, datetime(2024, 4, 29, 15), datetime(2024, 5, 31, 15))
+
+        self.assertEqual(response.languages, ["python", "typescript"])
+        self.assertEqual([d.net_changed_lines for d in response.data], [25, 110, 0, 60])
+        self.assertEqual(response.data[1].percentage_changed_lines_by_copilot, 50 / 150)
+
+    def test_code_lines_metrics_filtered_by_language(self) -> None:
+        # The repository already narrowed the commit rows to the snapshot's languages
+        snapshot = ReportMetricsSnapshot(
+            "test-user-id",
+            [a for a in COMMIT_AGGREGATES if a.language == "typescript"],
+            [],
+            COPILOT_CODE_AGGREGATES,
+            [],
+            ["typescript"],
+        )
+
+        response = snapshot.code_lines_metrics(Period.WEEK, datetime(2024, 4, 29), datetime(2024, 5, 31))
+
+        self.assertEqual(response.languages, ["typescript"])
+        self.assertEqual([d.net_changed_lines for d in response.data], [50])
+        self.assertEqual(response.data[0].net_changed_lines_by_copilot, 0)
+
+    def test_commit_metrics_count_the_distinct_commits_per_day(self) -> None:
+        response = self.snapshot.commit_metrics(Period.MONTH, datetime(2024, 5, 1), datetime(2024, 5, 31))
+
+        self.assertEqual(response.languages, ["python", "typescript"])
+        self.assertEqual(
+            response.data,
+            [
+                CommitMetricsData(
+                    initial_date=datetime(2024, 5, 1),
+                    final_date=datetime(2024, 5, 31),
+                    total_commits=3,
+                    number_of_authors=2,
+                    net_changed_lines=195,
+                    net_changed_lines_by_copilot=65,
+                    percentage_changed_lines_by_copilot=50 / 150,
+                ),
+            ],
+        )
+
+    def test_code_lines_metrics_without_commits_in_the_window(self) -> None:
+        response = self.snapshot.code_lines_metrics(Period.WEEK, datetime(2024, 6, 1), datetime(2024, 6, 30))
+
+        self.assertEqual(response.data, [])
+        self.assertEqual(self.snapshot.commit_metrics(Period.WEEK, datetime(2024, 6, 1), datetime(2024, 6, 30)).data, [])
+
+    def test_copilot_series_share_the_same_rows(self) -> None:
+        initial_date, final_date = datetime(2024, 5, 1), datetime(2024, 5, 31)
+
+        by_language = self.snapshot.copilot_metrics_by_language(initial_date, final_date)
+        by_week = self.snapshot.copilot_metrics_by_period(Period.WEEK, initial_date, final_date)
+        users = self.snapshot.copilot_users_metrics(initial_date, datetime(2024, 5, 31, 15))
+
+        self.assertEqual([(m.language, m.lines_accepted) for m in by_language], [("go", 10), ("python", 40)])
+        self.assertEqual([(m.period_initial_date, m.total_lines_accepted) for m in by_week], [(datetime(2024, 5, 6), 50)])
+        self.assertEqual(
+            users,
+            [
+                CopilotUsersMetrics(date=datetime(2024, 5, 6), total_code_assistant_users=2, total_chat_users=0),
+                CopilotUsersMetrics(date=datetime(2024, 5, 8), total_code_assistant_users=4, total_chat_users=0),
+                CopilotUsersMetrics(date=datetime(2024, 5, 9), total_code_assistant_users=0, total_chat_users=3),
+            ],
+        )
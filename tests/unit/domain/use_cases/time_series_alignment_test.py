@@ -0,0 +1,14 @@
+from datetime import datetime
+from unittest import TestCase
+
+from src.domain.use_cases.time_series_alignment import TimeSeriesAlignment
+
+
+class TestTimeSeriesAlignment(TestCase):
+    def test_reindex_keeps_key_order(self) -> None:
+        values = {datetime(2024, 5, 1): 2, datetime(2024, 7, 1): 9}
+
+        self.assertEqual(
+            TimeSeriesAlignment.reindex(values, [datetime(2024, 6, 1), datetime(2024, 5, 1)]),
+            [0, 2],
+        )
@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from src.infrastructure.cache.metrics_cache import LRUCache
+
+
+class TestLRUCache(TestCase):
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache: LRUCache[int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats(), {"size": 2, "max_size": 2, "hits": 3, "misses": 1})
+
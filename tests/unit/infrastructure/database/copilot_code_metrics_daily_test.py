@@ -0,0 +1,31 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.copilot_code_metrics_daily.postgre.copilot_code_metrics_daily_repository import CopilotCodeMetricsDailyRepository
+
+
+class TestCopilotCodeMetricsDailyRepository(TestCase):
+    def test_users_join_the_code_and_chat_rollups_on_the_day(self) -> None:
+        db = Session()
+
+        with patch.object(db, "execute") as execute:
+            execute.return_value.all.return_value = [
+                (datetime(2024, 5, 6), 2, 0, True),
+                (datetime(2024, 5, 9), 0, 3, False),
+            ]
+            users = CopilotCodeMetricsDailyRepository(db).list_code_and_chat_users_by_user_id(
+                "test-user-id", datetime(2024, 5, 1), datetime(2024, 5, 31)
+            )
+
+        sql = str(execute.call_args.args[0])
+        self.assertIn("FROM copilot_chat_metrics_daily", sql)
+        self.assertIn("GROUP BY copilot_chat_metrics_daily.day", sql)
+        self.assertNotIn("raw_copilot_chat_metrics", sql)
+        self.assertIn("FULL OUTER JOIN", sql)
+        self.assertEqual(
+            [(u.date, u.total_code_assistant_users, u.total_chat_users) for u in users],
+            [(datetime(2024, 5, 6), 2, 0), (datetime(2024, 5, 9), 0, 3)],
+        )
@@ -0,0 +1,77 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from src.infrastructure.database.commit_metrics_daily.postgre.dtos.model import CommitMetricsDaily
+from src.infrastructure.database.database_utils import batched, filter_whole_days, upsert_values
+from src.infrastructure.database.raw_commit_metrics.postgre.dtos.model import RawCommitMetrics
+
+
+class TestUpsertValues(TestCase):
+    @patch("src.infrastructure.database.database_utils.execute_values")
+    def test_pages_rows_and_keeps_the_last_row_per_key(self, execute_values: Mock) -> None:
+        db = Mock()
+        cursor = db.connection.return_value.connection.cursor.return_value
+
+        upsert_values(
+            db,
+            "raw_copilot_chat_metrics",
+            ["id", "date", "total_chats"],
+            [("a", "2024-05-01", 1), ("b", "2024-05-02", 2), ("c", "2024-05-01", 3)],
+            conflict_columns=["date"],
+            update_columns=["total_chats"],
+            page_size=500,
+        )
+
+        execute_values.assert_called_once_with(
+            cursor,
+            "INSERT INTO raw_copilot_chat_metrics (id, date, total_chats) VALUES %s "
+            "ON CONFLICT (date) DO UPDATE SET total_chats = EXCLUDED.total_chats",
+            [("c", "2024-05-01", 3), ("b", "2024-05-02", 2)],
+            page_size=500,
+        )
+        cursor.close.assert_called_once()
+
+    @patch("src.infrastructure.database.database_utils.execute_values")
+    def test_keeps_every_row_with_a_null_key_part(self, execute_values: Mock) -> None:
+        db = Mock()
+
+        upsert_values(
+            db,
+            "raw_copilot_code_metrics",
+            ["id", "date", "ide", "lines_accepted"],
+            [("a", "2024-05-01", None, 1), ("b", "2024-05-01", None, 2), ("c", "2024-05-01", "vscode", 3)],
+            conflict_columns=["date", "ide"],
+            update_columns=["lines_accepted"],
+        )
+
+        self.assertEqual(
+            execute_values.call_args.args[2],
+            [("c", "2024-05-01", "vscode", 3), ("a", "2024-05-01", None, 1), ("b", "2024-05-01", None, 2)],
+        )
+
+    def test_batched_splits_into_consecutive_slices(self) -> None:
+        self.assertEqual(list(batched([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+        with self.assertRaises(ValueError):
+            list(batched([1], 0))
+
+    def test_batched_keeps_each_slice_under_the_bind_parameter_limit(self) -> None:
+        # A raw commit row binds 12 parameters, so at most 65535 // 12 rows fit in one statement
+        batches = list(batched(list(range(12_000)), 10_000, len(RawCommitMetrics.__table__.columns)))
+
+        self.assertEqual([len(batch) for batch in batches], [5461, 5461, 1078])
+
+
+class TestFilterWholeDays(TestCase):
+    def test_raw_and_rollup_reads_share_the_same_day_bounds(self) -> None:
+        for column in (RawCommitMetrics.date, CommitMetricsDaily.day):
+            query = Mock()
+            query.filter.return_value = query
+
+            filter_whole_days(query, column, datetime(2024, 5, 1, 15, 30), datetime(2024, 5, 31, 8))
+
+            lower, upper = [call.args[0] for call in query.filter.call_args_list]
+            self.assertEqual(lower.right.value, datetime(2024, 5, 1))
+            self.assertEqual(lower.operator.__name__, "ge")
+            self.assertEqual(upper.right.value, datetime(2024, 6, 1))
+            self.assertEqual(upper.operator.__name__, "lt")
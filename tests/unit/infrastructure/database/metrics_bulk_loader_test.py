@@ -0,0 +1,52 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.infrastructure.database.connection.database_connection import Base
+from src.infrastructure.database.metrics_bulk_loader.postgre.metrics_bulk_loader_repository import MetricsBulkLoaderRepository, _CsvStream
+
+
+class TestMetricsBulkLoaderRepository(TestCase):
+    def test_csv_stream_renders_rows_in_small_reads(self) -> None:
+        stream = _CsvStream(iter([["a", 1, ""], ["b, c", 2, "2024-05-01T00:00:00"]]))
+
+        chunks = []
+        while chunk := stream.read(4):
+            chunks.append(chunk)
+
+        self.assertEqual(b"".join(chunks), b'a,1,\n"b, c",2,2024-05-01T00:00:00\n')
+
+    def test_copy_values_turn_missing_values_into_null(self) -> None:
+        self.assertEqual(MetricsBulkLoaderRepository._copy_value(None), "")
+        self.assertEqual(MetricsBulkLoaderRepository._copy_value(float("nan")), "")
+        self.assertEqual(MetricsBulkLoaderRepository._copy_value(datetime(2024, 5, 1)), "2024-05-01T00:00:00")
+
+    def test_targets_match_the_raw_tables(self) -> None:
+        for target in MetricsBulkLoaderRepository.TARGETS.values():
+            table_columns = set(Base.metadata.tables[target.table].columns.keys())
+
+            self.assertEqual(len(target.input_columns), len(target.table_columns))
+            self.assertTrue(set(target.table_columns) | set(target.constant_columns) <= table_columns)
+            self.assertTrue(set(target.update_columns) <= table_columns)
+
+    def test_commit_merge_skips_existing_rows(self) -> None:
+        repository = MetricsBulkLoaderRepository(Mock())
+        target = MetricsBulkLoaderRepository.TARGETS["commit"]
+
+        statement = repository._merge_statement(target, "staging", ["id", "hash"])
+
+        self.assertEqual(
+            statement,
+            "INSERT INTO raw_commit_metrics (id, hash, repository_team, author_teams) "
+            "SELECT id, hash, '', '' FROM staging "
+            "ON CONFLICT (user_id, hash, repository_name, language, date) DO NOTHING",
+        )
+
+    def test_copilot_merge_keeps_one_staged_row_per_key(self) -> None:
+        repository = MetricsBulkLoaderRepository(Mock())
+        target = MetricsBulkLoaderRepository.TARGETS["copilot_chat"]
+
+        statement = repository._merge_statement(target, "staging", ["id", "total_chats"])
+
+        self.assertIn("SELECT DISTINCT ON (user_id, team_name, date, ide, copilot_model) id, total_chats", statement)
+        self.assertIn("DO UPDATE SET total_users = EXCLUDED.total_users", statement)
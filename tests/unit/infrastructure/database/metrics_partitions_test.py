@@ -0,0 +1,60 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from src.infrastructure.database.connection.database_connection import Base
+from src.infrastructure.database.metrics_partitions.postgre.metrics_partitions_repository import MetricsPartitionsRepository
+
+
+class TestMetricsPartitionsRepository(TestCase):
+    def test_partition_names_round_trip_to_month_bounds(self) -> None:
+        name = MetricsPartitionsRepository.partition_name("raw_commit_metrics", datetime(2024, 12, 17))
+
+        self.assertEqual(name, "raw_commit_metrics_p2024_12")
+        self.assertEqual(
+            MetricsPartitionsRepository.partition_bounds(name),
+            (datetime(2024, 12, 1), datetime(2025, 1, 1)),
+        )
+        self.assertIsNone(MetricsPartitionsRepository.partition_bounds("raw_commit_metrics_default"))
+
+    def test_add_months_crosses_years_both_ways(self) -> None:
+        self.assertEqual(MetricsPartitionsRepository.add_months(datetime(2024, 11, 1), 3), datetime(2025, 2, 1))
+        self.assertEqual(MetricsPartitionsRepository.add_months(datetime(2024, 2, 1), -14), datetime(2022, 12, 1))
+
+    def test_partitioned_tables_keep_date_in_every_unique_key(self) -> None:
+        for name in MetricsPartitionsRepository.PARTITIONED_TABLES:
+            table = Base.metadata.tables[name]
+
+            self.assertEqual(table.dialect_options["postgresql"]["partition_by"], "RANGE (date)")
+            self.assertIn("date", table.primary_key.columns)
+            for constraint in table.constraints:
+                if constraint.__visit_name__ == "unique_constraint":
+                    self.assertIn("date", [column.name for column in constraint.columns])
+
+    def test_dropping_a_partition_drops_its_rollup_days_and_bumps_their_users(self) -> None:
+        db = Mock()
+        db.execute.return_value.scalars.return_value = ["user-1"]
+        repository = MetricsPartitionsRepository(db)
+        repository.list_partitions = Mock(side_effect=lambda table: [  # type: ignore
+            f"{table}_default", f"{table}_p2024_01", f"{table}_p2024_02",
+        ])
+
+        with patch(
+            "src.infrastructure.database.metrics_partitions.postgre.metrics_partitions_repository.UserDataVersionsRepository"
+        ) as versions_repository:
+            dropped = repository.drop_partitions_before(datetime(2024, 2, 20))
+
+        self.assertEqual(
+            dropped,
+            ["raw_commit_metrics_p2024_01", "raw_copilot_code_metrics_p2024_01", "raw_copilot_chat_metrics_p2024_01"],
+        )
+        statements = [str(call.args[0]) for call in db.execute.call_args_list]
+        self.assertEqual(statements[0], "SELECT pg_advisory_xact_lock(:key)")
+        deleted_rollups = [s.split("DELETE FROM ")[1].split(" ")[0] for s in statements if "DELETE FROM" in s]
+        self.assertEqual(
+            deleted_rollups,
+            ["commit_metrics_daily", "copilot_code_metrics_daily", "copilot_chat_metrics_daily"],
+        )
+        db.commit.assert_called_once()
+        versions_repository.assert_called_once_with(db)
+        versions_repository.return_value.bump.assert_called_once_with("user-1")
@@ -0,0 +1,157 @@
+from unittest import TestCase
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+from src.infrastructure.database.connection.database_connection import Base
+from src.infrastructure.database.schema_migrations.postgre.baseline_schema import BASELINE_METADATA
+from src.infrastructure.database.schema_migrations.postgre.dtos.model import SchemaMigration
+from src.infrastructure.database.schema_migrations.postgre.migrations import (
+    LATEST_VERSION,
+    MIGRATIONS,
+    RAW_METRICS_INDEXES,
+    ManagedIndex,
+    Migration,
+    _copy_by_month,
+    _ensure_partitioned_indexes,
+    _reject_rows_without_date,
+    backfill_metrics_rollups,
+    create_index_concurrently,
+    raw_metrics_tables_are_empty,
+)
+from src.infrastructure.database.schema_migrations.postgre.schema_migrator import SchemaMigrator
+
+
+class TestSchemaMigrations(TestCase):
+    def test_versions_are_contiguous_from_one(self) -> None:
+        self.assertEqual([m.version for m in MIGRATIONS], list(range(1, len(MIGRATIONS) + 1)))
+        self.assertEqual(LATEST_VERSION, len(MIGRATIONS))
+
+    def test_pending_skips_applied_versions(self) -> None:
+        self.assertEqual(SchemaMigrator.pending(0), MIGRATIONS)
+        self.assertEqual([m.version for m in SchemaMigrator.pending(1)], [2, 3, 4, 5])
+        self.assertEqual(SchemaMigrator.pending(LATEST_VERSION), [])
+
+    def test_baseline_is_frozen_apart_from_the_models(self) -> None:
+        raw_commits = BASELINE_METADATA.tables["raw_commit_metrics"]
+
+        self.assertIsNot(raw_commits, Base.metadata.tables["raw_commit_metrics"])
+        self.assertIsNone(raw_commits.dialect_options["postgresql"]["partition_by"])
+        self.assertEqual(
+            [c.name for c in raw_commits.primary_key.columns], ["id"],
+        )
+        self.assertNotIn("schema_migrations", BASELINE_METADATA.tables)
+        self.assertNotIn("commit_authors_daily", BASELINE_METADATA.tables)
+
+    def test_managed_indexes_are_declared_on_the_models(self) -> None:
+        for index in RAW_METRICS_INDEXES:
+            declared = {i.name: [c.name for c in i.columns] for i in Base.metadata.tables[index.table].indexes}
+            self.assertEqual(declared.get(index.name), index.columns)
+
+    def test_invalid_index_is_dropped_before_concurrent_rebuild(self) -> None:
+        connection = Mock()
+        connection.execute.return_value.scalar.return_value = False
+
+        create_index_concurrently(connection, ManagedIndex("ix_t_a_b", "t", ["a", "b"]))
+
+        statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+        self.assertEqual(
+            statements[1:],
+            [
+                "DROP INDEX CONCURRENTLY IF EXISTS ix_t_a_b",
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_t_a_b ON t (a, b)",
+            ],
+        )
+
+    def test_partitioned_indexes_are_built_without_concurrently(self) -> None:
+        connection = Mock()
+        connection.execute.return_value.scalar.side_effect = [False, None]
+
+        _ensure_partitioned_indexes(connection, "raw_copilot_code_metrics")
+
+        statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+        self.assertEqual(
+            [s for s in statements if not s.startswith("SELECT")],
+            [
+                "DROP INDEX IF EXISTS ix_raw_copilot_code_metrics_user_id_date",
+                "CREATE INDEX IF NOT EXISTS ix_raw_copilot_code_metrics_user_id_date "
+                "ON raw_copilot_code_metrics (user_id, date)",
+                "CREATE INDEX IF NOT EXISTS ix_raw_copilot_code_metrics_user_id_language_date "
+                "ON raw_copilot_code_metrics (user_id, language, date)",
+            ],
+        )
+
+    def test_table_rewrites_are_manual(self) -> None:
+        self.assertEqual([m.version for m in MIGRATIONS if m.manual], [3])
+
+    def test_partitioning_runs_online_only_while_the_raw_tables_are_empty(self) -> None:
+        connection = Mock()
+        connection.execute.return_value.scalar_one.side_effect = [True, True, True]
+        self.assertTrue(raw_metrics_tables_are_empty(connection))
+
+        connection.execute.return_value.scalar_one.side_effect = [True, False]
+        self.assertFalse(raw_metrics_tables_are_empty(connection))
+
+    def test_startup_applies_manual_migrations_that_run_online(self) -> None:
+        def upgrade(connection: object) -> None:
+            pass
+
+        migrations = [
+            Migration(1, "online", upgrade),
+            Migration(2, "cheap_rewrite", upgrade, manual=True, runs_online_if=lambda connection: True),
+            Migration(3, "costly_rewrite", upgrade, manual=True, runs_online_if=lambda connection: False),
+            Migration(4, "after_rewrite", upgrade),
+        ]
+        migrator = SchemaMigrator(MagicMock())
+
+        with patch("src.infrastructure.database.schema_migrations.postgre.schema_migrator.MIGRATIONS", migrations), \
+                patch.object(SchemaMigration.__table__, "create"), \
+                patch.object(SchemaMigrator, "current_version", return_value=0), \
+                patch.object(SchemaMigrator, "_apply") as apply:
+            version = migrator.migrate(include_manual=False)
+
+        self.assertEqual(version, 2)
+        self.assertEqual([call.args[0].name for call in apply.call_args_list], ["online", "cheap_rewrite"])
+
+    def test_rows_without_date_stop_the_partitioning(self) -> None:
+        connection = Mock()
+        connection.execute.return_value.scalar_one.return_value = 2
+
+        with self.assertRaisesRegex(RuntimeError, "raw_commit_metrics has 2 rows without a date"):
+            _reject_rows_without_date(connection, "raw_commit_metrics")
+
+    def test_rows_are_moved_one_month_per_transaction(self) -> None:
+        connection = MagicMock()
+        connection.execute.return_value.one.return_value = (datetime(2024, 1, 15), datetime(2024, 3, 2))
+        connection.execute.return_value.scalars.return_value = ["id", "date"]
+        transaction = connection.engine.begin.return_value.__enter__.return_value
+
+        _copy_by_month(connection, "raw_commit_metrics", "raw_commit_metrics_unpartitioned")
+
+        self.assertEqual(connection.engine.begin.call_count, 3)
+        months = [call.args[1]["start"] for call in transaction.execute.call_args_list[::2]]
+        self.assertEqual(months, [datetime(2024, 1, 1), datetime(2024, 2, 1), datetime(2024, 3, 1)])
+        self.assertIn("ON CONFLICT DO NOTHING", str(transaction.execute.call_args_list[0].args[0]))
+
+    @patch("src.infrastructure.database.schema_migrations.postgre.migrations.CopilotChatMetricsDailyRepository")
+    @patch("src.infrastructure.database.schema_migrations.postgre.migrations.CopilotCodeMetricsDailyRepository")
+    @patch("src.infrastructure.database.schema_migrations.postgre.migrations.CommitMetricsDailyRepository")
+    def test_rollups_are_backfilled_one_user_per_transaction(
+        self, commit_repository: Mock, copilot_code_repository: Mock, copilot_chat_repository: Mock
+    ) -> None:
+        connection = MagicMock()
+        connection.execute.return_value.scalars.return_value.all.side_effect = [["user-a", "user-b"], ["user-a"], []]
+
+        backfill_metrics_rollups(connection)
+
+        self.assertEqual(
+            [str(call.args[0]) for call in connection.execute.call_args_list],
+            [
+                "SELECT DISTINCT user_id FROM raw_commit_metrics WHERE user_id IS NOT NULL",
+                "SELECT DISTINCT user_id FROM raw_copilot_code_metrics WHERE user_id IS NOT NULL",
+                "SELECT DISTINCT user_id FROM raw_copilot_chat_metrics WHERE user_id IS NOT NULL",
+            ],
+        )
+        self.assertEqual([call.args for call in commit_repository.return_value.rebuild.call_args_list], [("user-a",), ("user-b",)])
+        self.assertEqual([call.args for call in copilot_code_repository.return_value.rebuild.call_args_list], [("user-a",)])
+        copilot_chat_repository.return_value.rebuild.assert_not_called()
+        self.assertEqual(connection.engine.begin.call_count, 3)
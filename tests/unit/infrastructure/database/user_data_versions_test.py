@@ -0,0 +1,26 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.infrastructure.database.user_data_versions.postgre.user_data_versions_repository import UserDataVersionsRepository
+
+
+class TestUserDataVersionsRepository(TestCase):
+    def test_bump_increments_in_the_callers_transaction(self) -> None:
+        db = Mock()
+
+        UserDataVersionsRepository(db).bump("user")
+
+        # Postgres-only constructs render with the postgresql dialect on their own
+        sql = str(db.execute.call_args.args[0])
+        self.assertIn("ON CONFLICT (user_id) DO UPDATE SET version = (user_data_versions.version +", sql)
+        db.commit.assert_not_called()
+
+    def test_get_adds_the_all_users_version(self) -> None:
+        db = Mock()
+        db.execute.return_value.scalar_one.return_value = 3
+
+        version = UserDataVersionsRepository(db).get("user")
+
+        statement = db.execute.call_args.args[0]
+        self.assertEqual(version, 3)
+        self.assertEqual(statement.compile().params["user_id_1"], ["user", UserDataVersionsRepository.ALL_USERS])
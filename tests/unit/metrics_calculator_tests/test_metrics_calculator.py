@@ -19,3 +19,22 @@ def test_calculate_relative_use_of_ai(sample_copilot_metrics):  # type: ignore
     # Ratio of code_acceptances / code_suggestions: (10 + 5) / (20 + 15) = 15 / 35
     expected = (10 + 5) / (20 + 15)
     assert pytest.approx(result, 0.001) == expected  # type: ignore
+
+
+def test_calculate_gross_productivity_grouped_by_team(sample_commits, sample_repositories):  # type: ignore
+    result = MetricsCalculator.calculate_gross_productivity_grouped_by(sample_commits, sample_repositories, ["team"])  # type: ignore
+    assert result.to_dict("records") == [
+        {"team": "Team A", "gross_productivity": 230},
+        {"team": "Team B", "gross_productivity": 730},
+    ]
+
+
+def test_calculate_relative_use_of_ai_grouped_by_team(sample_copilot_metrics):  # type: ignore
+    result = MetricsCalculator.calculate_relative_use_of_AI_grouped_by(sample_copilot_metrics, ["team_id", "IDE"])  # type: ignore
+    assert result["team_id"].tolist() == ["Team A", "Team B"]
+    assert result["relative_use_of_AI"].tolist() == [150 / 200, 100 / 150]
+
+
+def test_grouped_by_rejects_unknown_columns(sample_copilot_metrics):  # type: ignore
+    with pytest.raises(ValueError):
+        MetricsCalculator.calculate_gross_use_of_AI_grouped_by(sample_copilot_metrics, ["user_id"])  # type: ignore